@@ -4,27 +4,40 @@ TOEFL学習進捗記録システム
 Gemini×Claude×ChatGPT統合戦略による学習管理
 """
 
-import json
 import datetime
+import sys
 from pathlib import Path
 
+# スナップショット＋追記専用ジャーナルの保存処理は scripts/progress_store.py と共通
+sys.path.append(str(Path(__file__).resolve().parents[4] / "scripts"))
+from progress_store import JournalProgressStore
+
+# ジャーナルがこの件数に達したらスナップショットへ統合
+COMPACT_INTERVAL = 100
+
 class TOEFLProgressTracker:
     def __init__(self):
         self.data_file = Path(__file__).parent / "progress_data.json"
+        # 追記専用ジャーナル（progress_data.journal.jsonl、1更新 = 1行）
+        self.store = JournalProgressStore(str(self.data_file), compact_interval=COMPACT_INTERVAL)
         self.load_data()
     
     def load_data(self):
-        """進捗データを読み込み"""
-        if self.data_file.exists():
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                self.data = json.load(f)
-        else:
+        """進捗データを読み込み（スナップショット＋ジャーナル再生）"""
+        self.data = self.store.load()
+        if self.data is None:
             self.data = {"daily_records": [], "vocab_progress": {}, "mock_tests": []}
+            self.store.initialize(self.data)
+    
+    def append_journal(self, op, section, value):
+        """ジャーナルに1行追記してfsync（1更新あたりO(1)）"""
+        self.store.append_entry(op, [section], value, sync=True)
+        if self.store.needs_compaction():
+            self.save_data()
     
     def save_data(self):
-        """進捗データを保存"""
-        with open(self.data_file, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        """進捗データをスナップショットとして保存し、ジャーナルを空にする"""
+        self.store.compact(self.data)
     
     def log_daily_study(self, vocab_count=0, reading_time=0, listening_time=0, 
                        speaking_time=0, writing_time=0, notes=""):
@@ -43,17 +56,20 @@ class TOEFLProgressTracker:
             "notes": notes
         }
         self.data["daily_records"].append(record)
-        self.save_data()
+        self.append_journal("append", "daily_records", record)
         print(f"✅ {today}の学習記録を保存しました")
         print(f"📚 語彙: {vocab_count}語, ⏱️  総学習時間: {record['time_breakdown']['total']}分")
     
     def update_vocab_progress(self, rank, completion_percentage):
         """語彙進捗更新"""
-        self.data["vocab_progress"][f"rank_{rank}"] = {
-            "completion": completion_percentage,
-            "updated_date": datetime.date.today().isoformat()
+        progress = {
+            f"rank_{rank}": {
+                "completion": completion_percentage,
+                "updated_date": datetime.date.today().isoformat()
+            }
         }
-        self.save_data()
+        self.data["vocab_progress"].update(progress)
+        self.append_journal("update", "vocab_progress", progress)
         print(f"📖 TOEFL3800 Rank{rank}: {completion_percentage}%完了")
     
     def add_mock_test(self, reading_score, listening_score, speaking_score, writing_score, notes=""):
@@ -71,7 +87,7 @@ class TOEFLProgressTracker:
             "notes": notes
         }
         self.data["mock_tests"].append(mock_record)
-        self.save_data()
+        self.append_journal("append", "mock_tests", mock_record)
         print(f"🎯 模試結果記録: R{reading_score} L{listening_score} S{speaking_score} W{writing_score} (合計{total_score})")
     
     def show_progress_summary(self):
@@ -99,7 +115,6 @@ class TOEFLProgressTracker:
                 print(f"  {test['date']}: 合計{score['total']}点 (R{score['reading']} L{score['listening']} S{score['speaking']} W{score['writing']})")
 
 if __name__ == "__main__":
-    import sys
     tracker = TOEFLProgressTracker()
     
     if len(sys.argv) == 1:
@@ -119,6 +134,10 @@ if __name__ == "__main__":
             tracker.update_vocab_progress(rank, percentage)
         else:
             print("使用法: python daily_log.py vocab <ランク> <完了率%>")
+    elif sys.argv[1] == "compact":
+        # ジャーナルをスナップショットに統合
+        tracker.save_data()
+        print("🗜️  進捗データをコンパクションしました")
     elif sys.argv[1] == "mock":
         # 使用例: python daily_log.py mock 25 23 18 22 "初回模試"
         if len(sys.argv) >= 6:
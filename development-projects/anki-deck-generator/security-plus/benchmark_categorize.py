@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+用語カテゴリ分類のベンチマーク
+- 合成したカテゴリ表（ASCII / 日本語キーワード）で、従来の for/any ループと CategoryMatcher を比較
+- 照合器の構築時間・構築時のメモリ（tracemalloc）・分類時間と、分類結果の一致を確認
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from process_terms import CategoryMatcher
+
+# 日本語キーワード用の文字（カタカナ + 常用漢字の範囲の一部）
+KATAKANA = [chr(code) for code in range(0x30A1, 0x30F7)]
+KANJI = [chr(code) for code in range(0x4E00, 0x4E00 + 3000)]
+
+def make_keyword(rng, alphabet, min_len=2, max_len=6):
+    return ''.join(rng.choice(alphabet) for _ in range(rng.randint(min_len, max_len)))
+
+def make_categories(category_count, keywords_per_category, alphabet, seed=0):
+    rng = random.Random(seed)
+    return {
+        f"category_{i:03d}": [make_keyword(rng, alphabet) for _ in range(keywords_per_category)]
+        for i in range(category_count)
+    }
+
+def make_terms(categories, term_count, alphabet, seed=1):
+    """約半数にいずれかのキーワードを埋め込んだ用語"""
+    rng = random.Random(seed)
+    keywords = [keyword for keyword_list in categories.values() for keyword in keyword_list]
+    terms = []
+    for _ in range(term_count):
+        text = make_keyword(rng, alphabet, 10, 30)
+        if rng.random() < 0.5:
+            position = rng.randint(0, len(text))
+            text = text[:position] + rng.choice(keywords) + text[position:]
+        terms.append(text)
+    return terms
+
+def legacy_categorize(term_key, categories):
+    """従来の for/any ループ"""
+    for category, keywords in categories.items():
+        if any(keyword in term_key for keyword in keywords):
+            return category
+    return 'general'
+
+def run_case(label, alphabet, category_count, keywords_per_category, term_count):
+    categories = make_categories(category_count, keywords_per_category, alphabet)
+    terms = make_terms(categories, term_count, alphabet)
+
+    start = time.perf_counter()
+    matcher = CategoryMatcher(categories)
+    build_time = time.perf_counter() - start
+
+    # メモリは別に構築して計測（tracemalloc 有効時は構築が遅くなるため）
+    tracemalloc.start()
+    CategoryMatcher(categories)
+    _, build_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    legacy = [legacy_categorize(term, categories) for term in terms]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matched = [matcher.categorize(term) for term in terms]
+    matcher_time = time.perf_counter() - start
+
+    print(f"{label}: {category_count} categories x {keywords_per_category} keywords, {term_count:,} terms")
+    print(f"  build                : {build_time * 1000:7.1f} ms  peak {build_peak / 1024 / 1024:.1f} MB "
+          f"({len(matcher._rank):,} states)")
+    print(f"  for/any loop         : {legacy_time:7.3f} s")
+    print(f"  CategoryMatcher      : {matcher_time:7.3f} s")
+    print(f"  same categories: {'✅' if legacy == matched else '❌'}")
+
+def run_benchmark(term_count=30_000):
+    ascii_alphabet = [chr(code) for code in range(ord('a'), ord('z') + 1)]
+    run_case("ASCII", ascii_alphabet, 300, 20, term_count)
+    run_case("日本語 (カタカナ)", KATAKANA, 300, 20, term_count)
+    run_case("日本語 (漢字)", KANJI, 300, 20, term_count)
+
+if __name__ == "__main__":
+    # 使用例: python benchmark_categorize.py [用語数]
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 30_000)
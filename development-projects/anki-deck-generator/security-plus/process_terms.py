@@ -4,10 +4,20 @@ Security+ 用語集をAnki用TSVファイルに変換するスクリプト
 Gemini戦略に基づく最適化実装
 """
 
+import argparse
+import os
+import sys
 import re
 import csv
 import json
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from pathlib import Path
+
+# キーワード照合（Aho-Corasick）は cc-screenshot-ocr/src/text_normalizer.py と共通
+sys.path.append(str(Path(__file__).resolve().parents[2] / "cc-screenshot-ocr" / "src"))
+from text_normalizer import KeywordMatcher
 
 # カテゴリ分類ルール（Gemini推奨）
 CATEGORIES = {
@@ -54,27 +64,73 @@ CATEGORIES = {
     ]
 }
 
-def categorize_term(term_key):
+class CategoryMatcher(KeywordMatcher):
+    """
+    キーワード → カテゴリ の一括照合（text_normalizer.KeywordMatcher の Aho-Corasick）
+    用語を1回走査するだけで、含まれる全キーワードのうち
+    カテゴリ定義順で最初のカテゴリを返す（従来の for/any と同じ優先順位・大文字小文字も区別）
+    """
+
+    def __init__(self, categories, default='general'):
+        self.categories = list(categories)
+        self.default = default
+
+        keyword_ranks = [(keyword, category_index)
+                         for category_index, keywords in enumerate(categories.values())
+                         for keyword in keywords if keyword]
+        super().__init__((keyword for keyword, _ in keyword_ranks), ignore_case=False)
+
+        # 各状態に「そこで終わるキーワードの最小カテゴリ番号」を持つ
+        self._rank = [min((keyword_ranks[index][1] for index in output), default=None)
+                      for output in self.outputs]
+
+    def categorize(self, text):
+        goto = self._goto
+        fail = self._fail
+        rank = self._rank
+        best = None
+        state = 0
+        for char in text:
+            # 遷移が無ければ失敗遷移をたどる
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            found = rank[state]
+            if found is not None and (best is None or found < best):
+                best = found
+                if best == 0:
+                    break
+        if best is None:
+            return self.default
+        return self.categories[best]
+
+
+CATEGORY_MATCHER = CategoryMatcher(CATEGORIES)
+
+# 用語行の解析用パターン
+ABBREVIATION_PAREN_PATTERN = re.compile(r'\(([A-Z]+[A-Za-z0-9]*)\)')
+ABBREVIATION_PREFIX_PATTERN = re.compile(r'^([A-Z]{2,})')
+CAPITALIZED_WORD_PATTERN = re.compile(r'\b[A-Z][a-z]*')
+JAPANESE_TERM_PATTERN = re.compile(r'（(.+?)）')
+
+def categorize_term(term_key, matcher=CATEGORY_MATCHER):
     """用語をカテゴリに分類"""
-    for category, keywords in CATEGORIES.items():
-        if any(keyword in term_key for keyword in keywords):
-            return category
-    return 'general'
+    return matcher.categorize(term_key)
 
 def extract_abbreviation(term_raw):
     """正式名称から略称を抽出（例: Multi-Factor Authentication, MFA → MFA）"""
     # パターン1: (略称) 形式
-    match = re.search(r'\(([A-Z]+[A-Za-z0-9]*)\)', term_raw)
+    match = ABBREVIATION_PAREN_PATTERN.search(term_raw)
     if match:
         return match.group(1)
     
     # パターン2: 略称, 正式名称 形式
-    match = re.search(r'^([A-Z]{2,})', term_raw)
+    match = ABBREVIATION_PREFIX_PATTERN.search(term_raw)
     if match:
         return match.group(1)
     
     # パターン3: 英語名から略称を推測
-    words = re.findall(r'\b[A-Z][a-z]*', term_raw)
+    words = CAPITALIZED_WORD_PATTERN.findall(term_raw)
     if len(words) >= 2:
         return ''.join(word[0] for word in words[:3])
     
@@ -93,7 +149,7 @@ def parse_term_line(line):
     definition = parts[1].strip()
     
     # 英語部分と日本語部分を分離
-    japanese_match = re.search(r'（(.+?)）', term_raw)
+    japanese_match = JAPANESE_TERM_PATTERN.search(term_raw)
     if japanese_match:
         english_term = term_raw.replace(japanese_match.group(0), '').strip()
         japanese_term = japanese_match.group(1)
@@ -148,64 +204,127 @@ def generate_practical_examples(term_data):
     
     return category_examples.get(term_data['category'], 'セキュリティ関連技術・概念')
 
-def process_security_terms():
-    """Security+用語集を処理してTSV生成"""
-    print("🔥 Security+ Anki デッキ生成開始 - 'be perfect'キャンペーン実行中")
-    
-    # 用語リストを読み込み
-    with open('raw_terms.txt', 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
-    processed_terms = []
-    stats = {'total': 0, 'processed': 0, 'categories': {}}
-    
-    for line in lines:
-        line = line.strip()
-        if not line or line.startswith('Security+'):
-            continue
-            
-        stats['total'] += 1
-        term_data = parse_term_line(line)
-        
-        if term_data:
-            # 実務例を追加
-            term_data['practical_example'] = generate_practical_examples(term_data)
-            processed_terms.append(term_data)
-            stats['processed'] += 1
-            
-            # カテゴリ統計
-            category = term_data['category']
-            stats['categories'][category] = stats['categories'].get(category, 0) + 1
-            
-            print(f"✅ 処理完了: {term_data['abbreviation']} ({category})")
-        else:
-            print(f"⚠️  解析失敗: {line[:50]}...")
-    
-    # TSV出力（Anki互換）
-    output_file = 'security_plus_deck.tsv'
+def is_glossary_header(line):
+    """見出し・コメント行か（用語集のタイトル行など）"""
+    return line.startswith('Security+') or line.startswith('#')
+
+def parse_glossary_file(file_path):
+    """
+    用語集ファイル1つを解析（並列処理のワーカーでも実行）
+    (ファイル名, 解析した用語リスト, 用語行数, 解析失敗した行) を返す
+    """
+    terms = []
+    failed = []
+    total = 0
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or is_glossary_header(line):
+                continue
+
+            total += 1
+            term_data = parse_term_line(line)
+            if term_data:
+                # 実務例を追加
+                term_data['practical_example'] = generate_practical_examples(term_data)
+                term_data['source'] = os.path.basename(file_path)
+                terms.append(term_data)
+            else:
+                failed.append(line)
+    return file_path, terms, total, failed
+
+def term_merge_key(term_data):
+    """重複判定キー: 正規化した略称 + 英語名（全角/半角・大小文字・空白の違いを無視）"""
+    abbreviation = unicodedata.normalize('NFKC', term_data['abbreviation']).casefold()
+    english_term = unicodedata.normalize('NFKC', term_data['english_term']).casefold()
+    return abbreviation, ' '.join(english_term.split())
+
+def iter_parsed_glossaries(glossary_files, workers=1):
+    """用語集を解析して、指定順に結果を返す（workers > 1 ならプロセスプールで並列）"""
+    if workers <= 1 or len(glossary_files) <= 1:
+        for file_path in glossary_files:
+            yield parse_glossary_file(file_path)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # executor.map は投入順に結果を返す（マージ結果が実行ごとに変わらない）
+        yield from executor.map(parse_glossary_file, glossary_files)
+
+def merge_glossaries(glossary_files, workers=1):
+    """
+    複数の用語集を1回の走査でマージ
+    同じキーの用語は先に指定したファイルの定義を採用し、定義が異なるものは競合として記録
+    """
+    merged = {}
+    stats = {'total': 0, 'processed': 0, 'duplicates': 0, 'conflicts': [], 'failed': 0, 'files': {}}
+
+    for file_path, terms, total, failed in iter_parsed_glossaries(glossary_files, workers):
+        stats['total'] += total
+        stats['processed'] += len(terms)
+        stats['failed'] += len(failed)
+        added = 0
+        for term_data in terms:
+            key = term_merge_key(term_data)
+            existing = merged.get(key)
+            if existing is None:
+                merged[key] = term_data
+                added += 1
+                continue
+
+            stats['duplicates'] += 1
+            if existing['definition'] != term_data['definition']:
+                stats['conflicts'].append((existing, term_data))
+        stats['files'][file_path] = {'total': total, 'processed': len(terms), 'added': added}
+        for line in failed:
+            print(f"⚠️  解析失敗 ({os.path.basename(file_path)}): {line[:50]}...")
+
+    return list(merged.values()), stats
+
+def write_deck_tsv(terms, output_file):
+    """TSV出力（Anki互換・優先度順にソートして一括書き出し）"""
     with open(output_file, 'w', encoding='utf-8', newline='') as f:
         writer = csv.writer(f, delimiter='\t')
-        
+
         # ヘッダー
         writer.writerow([
             'Front', 'Japanese', 'English_Full', 'Definition', 
             'Practical_Example', 'Category', 'Priority'
         ])
-        
+
         # データ行（優先度順にソート）
-        sorted_terms = sorted(processed_terms, 
+        sorted_terms = sorted(terms,
                             key=lambda x: (x['priority'] == 'medium', x['category'], x['abbreviation']))
-        
-        for term in sorted_terms:
-            writer.writerow([
-                term['abbreviation'],
-                term['japanese_term'],
-                term['english_term'],
-                term['definition'],
-                term['practical_example'],
-                term['category'],
-                term['priority']
-            ])
+
+        writer.writerows([
+            term['abbreviation'],
+            term['japanese_term'],
+            term['english_term'],
+            term['definition'],
+            term['practical_example'],
+            term['category'],
+            term['priority']
+        ] for term in sorted_terms)
+
+def count_categories(terms):
+    """カテゴリ別の用語数"""
+    categories = {}
+    for term_data in terms:
+        categories[term_data['category']] = categories.get(term_data['category'], 0) + 1
+    return categories
+
+def process_security_terms(input_file='raw_terms.txt', output_file='security_plus_deck.tsv'):
+    """Security+用語集を処理してTSV生成"""
+    print("🔥 Security+ Anki デッキ生成開始 - 'be perfect'キャンペーン実行中")
+    
+    _, processed_terms, total, failed = parse_glossary_file(input_file)
+    stats = {'total': total, 'processed': len(processed_terms), 'categories': count_categories(processed_terms)}
+    
+    for term_data in processed_terms:
+        print(f"✅ 処理完了: {term_data['abbreviation']} ({term_data['category']})")
+    for line in failed:
+        print(f"⚠️  解析失敗: {line[:50]}...")
+    
+    write_deck_tsv(processed_terms, output_file)
     
     # 統計レポート
     print(f"\n📊 処理統計:")
@@ -222,5 +341,46 @@ def process_security_terms():
     
     return output_file, stats
 
+def process_glossaries(glossary_files, output_file='security_plus_deck.tsv', workers=1):
+    """複数の用語集（試験範囲・ベンダー用語集・社内リスト）をマージしてTSV生成"""
+    print(f"🔥 Security+ Anki デッキ生成開始 - 用語集 {len(glossary_files)}件をマージ ({workers} workers)")
+    
+    terms, stats = merge_glossaries(glossary_files, workers)
+    write_deck_tsv(terms, output_file)
+    stats['categories'] = count_categories(terms)
+    
+    print(f"\n📚 用語集別:")
+    for file_path, file_stats in stats['files'].items():
+        print(f"  {file_path}: {file_stats['processed']}/{file_stats['total']}語 (新規 {file_stats['added']}語)")
+    
+    print(f"\n📊 処理統計:")
+    print(f"  総用語数: {stats['total']}")
+    print(f"  処理成功: {stats['processed']}")
+    print(f"  重複: {stats['duplicates']} (定義の競合 {len(stats['conflicts'])})")
+    print(f"  デッキ収録: {len(terms)}")
+    for existing, duplicate in stats['conflicts'][:10]:
+        print(f"  ⚠️  競合: {existing['abbreviation']} - {existing['source']} を採用 ({duplicate['source']} の定義は除外)")
+    print(f"\n📁 カテゴリ別内訳:")
+    for category, count in sorted(stats['categories'].items()):
+        print(f"  {category}: {count}語")
+    
+    print(f"\n🎯 出力ファイル: {output_file}")
+    print(f"📅 生成日時: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    
+    return output_file, stats
+
+def main():
+    parser = argparse.ArgumentParser(description="Security+ 用語集 → Anki TSV")
+    parser.add_argument("glossaries", nargs='*', default=['raw_terms.txt'],
+                        help="用語集ファイル（複数指定でマージ、先に指定したものの定義を優先）")
+    parser.add_argument("--output", default='security_plus_deck.tsv', help="出力TSVファイル")
+    parser.add_argument("--workers", type=int, default=1, help="並列ワーカー数（1 = 逐次処理）")
+    args = parser.parse_args()
+    
+    if len(args.glossaries) == 1:
+        process_security_terms(args.glossaries[0], args.output)
+    else:
+        process_glossaries(args.glossaries, args.output, args.workers)
+
 if __name__ == "__main__":
-    process_security_terms()
\ No newline at end of file
+    main()
@@ -4,12 +4,13 @@ CC練習問題 → Ankiデッキ変換（クローズ形式）
 Geminiの提案を基にした効果的な学習カード生成
 """
 
-import json
 import sys
-import re
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from card_stream import CardStreamWriter, iter_question_records, resolve_input_file
+from text_normalizer import clean_basic_text
+
 
 class CCAnkiGenerator:
     """
@@ -17,7 +18,7 @@ class CCAnkiGenerator:
     """
     
     def __init__(self, input_file: str, output_dir: str):
-        self.input_file = Path(input_file)
+        self.input_file = resolve_input_file(Path(input_file))
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
@@ -32,20 +33,8 @@ class CCAnkiGenerator:
         """
         テキストのクリーニング
         """
-        if not text:
-            return ""
-        
-        # HTMLタグ除去
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # 余分な空白・改行を整理
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        
-        # Ankiの特殊文字をエスケープ
-        text = text.replace('"', '""')  # CSVエスケープ
-        
-        return text
+        # HTMLタグ除去・空白整理・CSVエスケープ
+        return clean_basic_text(text)
     
     def extract_correct_choice(self, question_data: Dict) -> Tuple[str, str]:
         """
@@ -132,33 +121,27 @@ class CCAnkiGenerator:
         
         return anki_card
     
-    def generate_tsv_format(self, cards: List[Dict]) -> str:
+    TSV_HEADERS = [
+        "問題文", "選択肢A", "選択肢B", "選択肢C", "選択肢D",
+        "正解", "解説", "Text", "タグ", "ファイル名"
+    ]
+    
+    def tsv_row(self, card: Dict) -> List[str]:
         """
-        AnkiインポートTSV形式を生成
+        AnkiインポートTSVの1行
         """
-        headers = [
-            "問題文", "選択肢A", "選択肢B", "選択肢C", "選択肢D",
-            "正解", "解説", "Text", "タグ", "ファイル名"
+        return [
+            card['question'],
+            self.clean_text(card['choices_a']),
+            self.clean_text(card['choices_b']),
+            self.clean_text(card['choices_c']),
+            self.clean_text(card['choices_d']),
+            card['correct_answer'],
+            card['explanation'],
+            card['cloze_text'],
+            card['tags'],
+            card['filename']
         ]
-        
-        lines = ["\t".join(headers)]
-        
-        for card in cards:
-            row = [
-                card['question'],
-                self.clean_text(card['choices_a']),
-                self.clean_text(card['choices_b']),
-                self.clean_text(card['choices_c']),
-                self.clean_text(card['choices_d']),
-                card['correct_answer'],
-                card['explanation'],
-                card['cloze_text'],
-                card['tags'],
-                card['filename']
-            ]
-            lines.append("\t".join(row))
-        
-        return "\n".join(lines)
     
     def generate_anki_template(self) -> str:
         """
@@ -255,39 +238,31 @@ class CCAnkiGenerator:
         """
         print("CC練習問題 → Ankiデッキ変換を開始...")
         
-        # JSONファイルを読み込み
-        with open(self.input_file, 'r', encoding='utf-8') as f:
-            questions_data = json.load(f)
-        
-        self.stats['total_questions'] = len(questions_data)
-        print(f"読み込み完了: {self.stats['total_questions']}問")
-        
-        # Ankiカードを生成
-        anki_cards = []
+        tsv_file = self.output_dir / 'cc_questions_anki.tsv'
+        json_file = self.output_dir / 'cc_anki_cards.json'
         
-        for i, question_data in enumerate(questions_data):
-            if not question_data.get('parsed', False):
-                self.stats['skipped_incomplete'] += 1
-                continue
-            
-            try:
-                card = self.create_anki_card(question_data, i + 1)
-                anki_cards.append(card)
-                self.stats['converted_cards'] += 1
+        # OCR結果を1件ずつ読み込み、カードを1行ずつ書き出す
+        with CardStreamWriter(tsv_file, self.TSV_HEADERS, json_file) as writer:
+            for i, question_data in enumerate(iter_question_records(self.input_file)):
+                self.stats['total_questions'] += 1
+                
+                if not question_data.get('parsed', False):
+                    self.stats['skipped_incomplete'] += 1
+                    continue
                 
-                if (i + 1) % 10 == 0:
-                    print(f"処理済み: {i + 1}/{self.stats['total_questions']}")
+                try:
+                    card = self.create_anki_card(question_data, i + 1)
+                    writer.write(card, self.tsv_row(card))
+                    self.stats['converted_cards'] += 1
                     
-            except Exception as e:
-                print(f"カード生成エラー [{question_data.get('filename', 'Unknown')}]: {e}")
-                self.stats['skipped_incomplete'] += 1
+                    if (i + 1) % 10 == 0:
+                        print(f"処理済み: {i + 1}")
+                        
+                except Exception as e:
+                    print(f"カード生成エラー [{question_data.get('filename', 'Unknown')}]: {e}")
+                    self.stats['skipped_incomplete'] += 1
         
-        # TSVファイルを生成
-        tsv_content = self.generate_tsv_format(anki_cards)
-        tsv_file = self.output_dir / 'cc_questions_anki.tsv'
-        
-        with open(tsv_file, 'w', encoding='utf-8') as f:
-            f.write(tsv_content)
+        print(f"読み込み完了: {self.stats['total_questions']}問")
         
         # テンプレート設定ファイルを生成
         template_content = self.generate_anki_template()
@@ -296,11 +271,6 @@ class CCAnkiGenerator:
         with open(template_file, 'w', encoding='utf-8') as f:
             f.write(template_content)
         
-        # 詳細JSONも保存
-        json_file = self.output_dir / 'cc_anki_cards.json'
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(anki_cards, f, ensure_ascii=False, indent=2)
-        
         # 結果サマリー
         self.print_summary(tsv_file, template_file, json_file)
     
@@ -332,7 +302,7 @@ def main():
     メイン実行関数
     """
     project_dir = Path(__file__).parent.parent
-    input_file = project_dir / 'output' / 'cc_questions_final.json'
+    input_file = resolve_input_file(project_dir / 'output' / 'cc_questions_final.json')
     output_dir = project_dir / 'output' / 'anki'
     
     if not input_file.exists():
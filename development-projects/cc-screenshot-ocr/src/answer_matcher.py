@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+OCRで読み取った正解文と選択肢の照合（あいまい一致）
+- 選択肢の正規化は1問につき1回（ChoiceProfiles）、単語・文字trigram集合は類似度の計算が必要な選択肢だけ作成
+- 完全一致 > 包含 > trigram/単語の類似度 の順にスコア化
+- 1位と2位の差から信頼度を出し、低信頼度は「要確認」として扱う
+- どの選択肢とも一致度が低い場合は「一致なし」（選択肢を仮の正解にしない）
+"""
+
+import re
+from typing import FrozenSet, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+
+# この信頼度未満の照合結果は要確認
+ANSWER_CONFIDENCE_THRESHOLD = 0.5
+
+# 1位のスコアがこの値未満なら一致なし
+MIN_MATCH_SCORE = 0.3
+
+# 1位と2位のスコア差がこの値以上なら、1位のスコアをそのまま信頼度にする
+_CLEAR_MARGIN = 0.15
+
+_NON_WORD_PATTERN = re.compile(r'[\W_]+')
+
+
+class TextProfile(NamedTuple):
+    """
+    照合用に前処理した文字列
+    """
+    normalized: str
+    tokens: FrozenSet[str]
+    trigrams: FrozenSet[Tuple[str, str, str]]
+
+
+def normalize_text(text: str) -> str:
+    """
+    小文字化・記号除去した文字列
+    """
+    lowered = text.lower()
+    if lowered.replace(' ', '').isalnum():
+        # 英数字と空白だけなら正規表現を使わずに空白を詰める（結果は同じ）
+        return ' '.join(lowered.split())
+    return _NON_WORD_PATTERN.sub(' ', lowered).strip()
+
+
+def text_profile(normalized: str) -> TextProfile:
+    """
+    正規化済みの文字列の単語集合・文字trigram集合
+    """
+    padded = f'  {normalized} '
+    # 3文字の部分文字列を作らず、文字のタプルのまま集合にする（Dice係数は同じ）
+    trigrams = frozenset(zip(padded, padded[1:], padded[2:]))
+    return TextProfile(normalized, frozenset(normalized.split()), trigrams)
+
+
+class ChoiceProfiles:
+    """
+    1問分の選択肢の照合用データ（カードごとに1回だけ作る）
+    """
+
+    __slots__ = ('choices', 'normalized', '_profiles')
+
+    def __init__(self, choices: Sequence[str]):
+        self.choices = list(choices)
+        self.normalized = [normalize_text(choice) if choice else '' for choice in self.choices]
+        self._profiles: List[Optional[TextProfile]] = [None] * len(self.choices)
+
+    def profile(self, index: int) -> TextProfile:
+        profile = self._profiles[index]
+        if profile is None:
+            profile = self._profiles[index] = text_profile(self.normalized[index])
+        return profile
+
+
+def containment_score(a: str, b: str) -> float:
+    """
+    一方が他方を含む場合のスコア（長さが近いほど高い。OCRの欠け・余分な語を許容）
+    含まなければ 0.0
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    if a in b:
+        return 0.6 + 0.35 * len(a) / len(b)
+    return 0.0
+
+
+def overlap_score(answer: TextProfile, choice: TextProfile) -> float:
+    """
+    Dice係数（文字trigram）と単語の一致率の高い方
+    """
+    trigram_score = 2 * len(answer.trigrams & choice.trigrams) / (len(answer.trigrams) + len(choice.trigrams))
+    token_score = len(answer.tokens & choice.tokens) / max(len(answer.tokens), len(choice.tokens))
+    return max(trigram_score, token_score) * 0.9
+
+
+def match_answer(answer: str, choices: Union[Sequence[str], ChoiceProfiles]) -> Tuple[int, float]:
+    """
+    正解文に最も近い選択肢の番号と信頼度
+    一致する候補が無い（1位のスコアが MIN_MATCH_SCORE 未満）なら (-1, 0.0)
+    """
+    if not answer or not choices:
+        return -1, 0.0
+    if not isinstance(choices, ChoiceProfiles):
+        choices = ChoiceProfiles(choices)
+
+    normalized = normalize_text(answer)
+    if not normalized:
+        return -1, 0.0
+    if normalized in choices.normalized:
+        # 完全一致なら集合を作らずに確定
+        return choices.normalized.index(normalized), 1.0
+
+    answer_profile = None
+    best_index = -1
+    best = second = 0.0
+    for index, choice in enumerate(choices.normalized):
+        if not choice:
+            continue
+        score = containment_score(normalized, choice)
+        if not score:
+            if answer_profile is None:
+                answer_profile = text_profile(normalized)
+            score = overlap_score(answer_profile, choices.profile(index))
+        if score > best:
+            best_index, best, second = index, score, best
+        elif score > second:
+            second = score
+
+    if best < MIN_MATCH_SCORE:
+        return -1, 0.0
+
+    margin = best - second
+    confidence = best if margin >= _CLEAR_MARGIN else best * margin / _CLEAR_MARGIN
+    return best_index, round(confidence, 3)
+
+
+def find_answer(answer: str, choices: List[str]) -> Tuple[str, str, float]:
+    """
+    (正解の選択肢, 記号, 信頼度) を返す
+    一致しない場合は ("", "", 0.0)
+    """
+    index, confidence = match_answer(answer, choices)
+    if index < 0:
+        return "", "", 0.0
+    return choices[index], chr(65 + index), confidence
+
+
+def needs_review(confidence: float) -> bool:
+    """
+    照合結果が要確認か
+    """
+    return confidence < ANSWER_CONFIDENCE_THRESHOLD
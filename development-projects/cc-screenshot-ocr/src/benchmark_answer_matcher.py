@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+正解照合のベンチマーク
+- OCRノイズ入りの正解文を合成し、従来のキーワード照合と answer_matcher を比較
+- 正答率・要確認の件数・正解が選択肢に無い場合に「一致なし」となる件数・1問あたりの処理時間を表示
+"""
+
+import argparse
+import random
+import re
+import time
+from typing import List, Tuple
+
+from answer_matcher import find_answer, needs_review
+
+
+PHRASES = [
+    'Access control list', 'Role-based access control', 'Mandatory access control',
+    'Discretionary access control', 'Data should be destroyed', 'Data should be archived',
+    'Data should be encrypted', 'Acceptance', 'Avoidance', 'Mitigation', 'Transference',
+    'Confidentiality', 'Integrity', 'Availability', 'Non-repudiation', 'Multifactor authentication',
+    'Single sign-on', 'Intrusion detection system', 'Intrusion prevention system', 'Firewall',
+    'Security information and event management', 'Business continuity plan',
+    'Disaster recovery plan', 'Incident response plan', 'Least privilege', 'Separation of duties',
+    'Defense in depth', 'Symmetric encryption', 'Asymmetric encryption', 'Hashing',
+    'The municipal code is a law, and the Triffid checklist is a procedure',
+    'The municipal code is a procedure, and the Triffid checklist is a law',
+]
+
+
+# ---- 従来の実装（比較用） ----
+
+def legacy_find_correct_answer(correct_clean: str, choices: List[str]) -> Tuple[str, str]:
+    for i, choice in enumerate(choices):
+        if (correct_clean.lower() in choice.lower() or
+                choice.lower() in correct_clean.lower()):
+            return choice, chr(65 + i)
+
+    correct_keywords = set(re.findall(r'\b\w+\b', correct_clean.lower()))
+    best_match = ""
+    best_score = 0
+    best_index = 0
+
+    for i, choice in enumerate(choices):
+        choice_keywords = set(re.findall(r'\b\w+\b', choice.lower()))
+        score = len(correct_keywords & choice_keywords)
+        if score > best_score:
+            best_score = score
+            best_match = choice
+            best_index = i
+
+    if best_match:
+        return best_match, chr(65 + best_index)
+    return choices[0], "A"
+
+
+# ---- 入力データ ----
+
+def add_ocr_noise(text: str, rng: random.Random) -> str:
+    """
+    文字の欠落・置換・末尾の欠けを加える
+    """
+    chars = list(text)
+    for _ in range(rng.randint(0, max(1, len(chars) // 8))):
+        position = rng.randrange(len(chars))
+        if rng.random() < 0.5:
+            chars[position] = rng.choice('il1|o0rn')
+        else:
+            del chars[position]
+            if not chars:
+                break
+    noisy = ''.join(chars)
+    if rng.random() < 0.2:
+        noisy = noisy[:max(3, int(len(noisy) * 0.7))]
+    return noisy
+
+
+def make_questions(count: int) -> List[Tuple[str, List[str], int]]:
+    """
+    (OCRの正解文, 選択肢, 正解の番号) を合成
+    """
+    rng = random.Random(0)
+    questions = []
+    for _ in range(count):
+        choices = rng.sample(PHRASES, 4)
+        correct = rng.randrange(4)
+        questions.append((add_ocr_noise(choices[correct], rng), choices, correct))
+    return questions
+
+
+def make_unmatched_questions(count: int) -> List[Tuple[str, List[str]]]:
+    """
+    (OCRの正解文, 選択肢) を合成（正解文は選択肢に含まれない語句）
+    """
+    rng = random.Random(1)
+    questions = []
+    for _ in range(count):
+        phrases = rng.sample(PHRASES, 5)
+        questions.append((add_ocr_noise(phrases[4], rng), phrases[:4]))
+    return questions
+
+
+def run_benchmark(count: int, rounds: int):
+    questions = make_questions(count)
+    print(f"正解照合ベンチマーク: {count}問 x {rounds}回")
+    print("-" * 60)
+
+    legacy_correct = sum(1 for answer, choices, correct in questions
+                         if legacy_find_correct_answer(answer, choices)[1] == chr(65 + correct))
+
+    matches = [find_answer(answer, choices) for answer, choices, _ in questions]
+    new_correct = sum(1 for (_, letter, _), (_, _, correct) in zip(matches, questions)
+                      if letter == chr(65 + correct))
+    no_match = sum(1 for _, letter, _ in matches if not letter)
+    flagged = [(letter, q) for (_, letter, confidence), q in zip(matches, questions)
+               if letter and needs_review(confidence)]
+    flagged_wrong = sum(1 for letter, (_, _, correct) in flagged if letter != chr(65 + correct))
+    unflagged_wrong = count - new_correct - flagged_wrong - no_match
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for answer, choices, _ in questions:
+            legacy_find_correct_answer(answer, choices)
+    legacy_time = (time.perf_counter() - start) / (rounds * count) * 1e6
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for answer, choices, _ in questions:
+            find_answer(answer, choices)
+    new_time = (time.perf_counter() - start) / (rounds * count) * 1e6
+
+    # 実際のデッキと同じく、選択肢の文字列が問題ごとにすべて異なる場合
+    distinct = [(f"{answer} {i}", [f"{choice} {i}" for choice in choices])
+                for i, (answer, choices, _) in enumerate(questions)]
+    start = time.perf_counter()
+    for answer, choices in distinct:
+        legacy_find_correct_answer(answer, choices)
+    legacy_distinct_time = (time.perf_counter() - start) / count * 1e6
+
+    start = time.perf_counter()
+    for answer, choices in distinct:
+        find_answer(answer, choices)
+    distinct_time = (time.perf_counter() - start) / count * 1e6
+
+    # 正解文がどの選択肢でもない場合（従来は常にいずれかの選択肢を正解にしていた）
+    unmatched = make_unmatched_questions(count)
+    unmatched_count = sum(1 for answer, choices in unmatched if not find_answer(answer, choices)[1])
+    unmatched_flagged = sum(1 for answer, choices in unmatched
+                            if find_answer(answer, choices)[1] and needs_review(find_answer(answer, choices)[2]))
+
+    print(f"従来        : 正答 {legacy_correct}/{count} ({legacy_correct / count * 100:.1f}%)  {legacy_time:.2f} µs/問")
+    print(f"answer_matcher: 正答 {new_correct}/{count} ({new_correct / count * 100:.1f}%)  {new_time:.2f} µs/問")
+    print(f"選択肢がすべて異なる場合: 従来 {legacy_distinct_time:.2f} µs/問 / answer_matcher {distinct_time:.2f} µs/問")
+    print(f"要確認      : {len(flagged)}問 (うち誤り {flagged_wrong}問)  一致なし: {no_match}問")
+    print(f"要確認なしの誤り: {unflagged_wrong}問")
+    print(f"正解が選択肢に無い場合: 一致なし {unmatched_count}/{count}問  "
+          f"要確認 {unmatched_flagged}問  要確認なしの誤り {count - unmatched_count - unmatched_flagged}問")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="正解照合ベンチマーク")
+    parser.add_argument("--count", type=int, default=5000, help="合成する問題数")
+    parser.add_argument("--rounds", type=int, default=5, help="計測の繰り返し回数")
+    args = parser.parse_args()
+
+    run_benchmark(args.count, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
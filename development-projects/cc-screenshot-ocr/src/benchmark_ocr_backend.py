@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+OCRバックエンドのベンチマーク
+- 利用可能なバックエンドごとに1枚あたりのOCR時間を計測
+- 全バックエンドの出力が一致することを確認
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List
+
+from PIL import Image
+
+from benchmark_roi import make_question_screenshot
+from ocr_backend import get_backend
+
+
+def load_images(input_dir: str = None, count: int = 10) -> List[Image.Image]:
+    """
+    スクリーンショット（省略時は合成画像）を読み込み
+    """
+    if input_dir:
+        paths = sorted(p for p in Path(input_dir).iterdir()
+                       if p.suffix.lower() in {'.png', '.jpg', '.jpeg'})[:count]
+        return [Image.open(p).convert('RGB') for p in paths]
+    # OpenCVのBGRをRGBに並べ替え
+    return [Image.fromarray(make_question_screenshot(i)[:, :, ::-1]) for i in range(count)]
+
+
+def run_benchmark(input_dir: str = None, count: int = 10, threads: int = 1, config: str = '--psm 6'):
+    images = load_images(input_dir, count)
+    print(f"OCRバックエンド ベンチマーク: {len(images)}枚, {threads}スレッド, config='{config}'")
+    print("-" * 40)
+
+    outputs = {}
+    for name in ('pytesseract', 'tesserocr'):
+        try:
+            backend = get_backend(name, pool_size=threads)
+        except (ImportError, RuntimeError) as e:
+            print(f"{name:<12}: 利用不可 ({e})")
+            continue
+
+        with backend:
+            # 初回呼び出し（エンジン初期化）は別に計測
+            start = time.perf_counter()
+            backend.image_to_string(images[0], config=config)
+            warmup = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                texts = list(executor.map(lambda image: backend.image_to_string(image, config=config), images))
+            elapsed = time.perf_counter() - start
+
+        outputs[name] = texts
+        print(f"{name:<12}: {elapsed / len(images) * 1000:7.1f} ms/枚 (初回 {warmup * 1000:.0f} ms)")
+
+    if len(outputs) > 1:
+        first, *rest = outputs.values()
+        identical = all(texts == first for texts in rest)
+        print(f"出力一致: {'OK' if identical else 'NG'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCRバックエンド ベンチマーク")
+    parser.add_argument("--input", help="スクリーンショットのディレクトリ（省略時は合成画像）")
+    parser.add_argument("--count", type=int, default=10, help="画像枚数")
+    parser.add_argument("--threads", type=int, default=1, help="同時OCR数（tesserocrはエンジンをこの数だけ常駐）")
+    args = parser.parse_args()
+
+    run_benchmark(args.input, args.count, args.threads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+前処理ベンチマーク
+- 従来の1枚ずつの前処理と PreprocessPipeline のバッチ処理を比較
+- 1080p / 4K の合成スクリーンショットで段階ごとの処理時間を表示
+- 両者の出力が一致することを確認
+"""
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from preprocess_pipeline import PreprocessPipeline
+
+
+RESOLUTIONS = {
+    '1080p': (1080, 1920),
+    '4K': (2160, 3840)
+}
+
+
+def make_screenshots(count: int, height: int, width: int, seed: int = 0) -> np.ndarray:
+    """
+    問題画面風の合成スクリーンショット (N, H, W, 3) を作成
+    """
+    rng = np.random.default_rng(seed)
+    images = np.full((count, height, width, 3), 245, dtype=np.uint8)
+    scale = height / 1080
+
+    for i in range(count):
+        image = images[i]
+        y = int(120 * scale)
+        for line in range(12):
+            text = f"Question {i + 1}: Which control best protects data at rest? {line}"
+            cv2.putText(image, text, (int(80 * scale), y), cv2.FONT_HERSHEY_SIMPLEX,
+                        0.9 * scale, (30, 30, 30), max(1, int(2 * scale)), cv2.LINE_AA)
+            y += int(70 * scale)
+
+        # センサーノイズ相当
+        noise = rng.integers(0, 12, size=image.shape, dtype=np.uint8)
+        cv2.subtract(image, noise, dst=image)
+
+    return images
+
+
+def legacy_preprocess(image: np.ndarray) -> np.ndarray:
+    """
+    従来の preprocess_image と同じ処理（段階ごとに新しい配列を確保）
+    """
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    denoised = cv2.medianBlur(gray, 3)
+    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
+    enhanced = clahe.apply(denoised)
+    _, binary = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    return binary
+
+
+def run_benchmark(count: int, rounds: int):
+    """
+    解像度ごとに従来処理とバッチ処理を計測
+    """
+    pipeline = PreprocessPipeline()
+
+    for name, (height, width) in RESOLUTIONS.items():
+        images = make_screenshots(count, height, width)
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            legacy = [legacy_preprocess(image) for image in images]
+        legacy_time = (time.perf_counter() - start) / rounds
+
+        pipeline.reset_timings()
+        start = time.perf_counter()
+        for _ in range(rounds):
+            batch = pipeline.process_batch(images)
+        batch_time = (time.perf_counter() - start) / rounds
+
+        identical = all(np.array_equal(a, b) for a, b in zip(legacy, batch))
+
+        print(f"\n{name} ({width}x{height}) x {count}枚")
+        print("-" * 40)
+        print(f"従来処理:   {legacy_time * 1000:8.1f} ms ({legacy_time / count * 1000:.2f} ms/枚)")
+        print(f"バッチ処理: {batch_time * 1000:8.1f} ms ({batch_time / count * 1000:.2f} ms/枚)"
+              f"  {legacy_time / batch_time:.2f}x")
+        print(f"出力一致: {'OK' if identical else 'NG'}")
+        print(pipeline.timing_report())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="スクリーンショット前処理ベンチマーク")
+    parser.add_argument("--count", type=int, default=8, help="1バッチの枚数")
+    parser.add_argument("--rounds", type=int, default=3, help="計測の繰り返し回数")
+    args = parser.parse_args()
+
+    run_benchmark(args.count, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+ROI切り出しベンチマーク
+- 全画面OCR（従来）と問題パネルのみのOCRを比較
+- OCR時間と parsed_successfully 率を表示
+- 入力が無い場合は問題画面風の合成スクリーンショットを使用
+"""
+
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import cv2
+import numpy as np
+
+from ocr_processor import CCScreenshotOCR
+
+
+def make_question_screenshot(index: int, height: int = 1080, width: int = 1920) -> np.ndarray:
+    """
+    ブラウザバー・サイドバー・問題パネルを持つ合成スクリーンショット
+    """
+    image = np.full((height, width, 3), 250, dtype=np.uint8)
+    scale = height / 1080
+    font = cv2.FONT_HERSHEY_SIMPLEX
+
+    def put(text, x, y, size=0.9, color=(30, 30, 30)):
+        cv2.putText(image, text, (int(x * scale), int(y * scale)), font, size * scale,
+                    color, max(1, int(2 * scale)), cv2.LINE_AA)
+
+    # ブラウザのバーとサイドバー
+    cv2.rectangle(image, (0, 0), (width, int(50 * scale)), (225, 225, 225), -1)
+    put("https://learn.example.com/cc/practice-test", 20, 34, 0.7)
+    for i in range(14):
+        put(f"Lesson {i + 1}", 30, 140 + i * 60, 0.7, (90, 90, 90))
+
+    # 問題パネル
+    lines = [f"Question {index + 1}: Which security control best protects",
+             "data at rest on a lost laptop?"]
+    choices = ["A) Full disk encryption", "B) Network firewall",
+               "C) Intrusion detection system", "D) Security awareness training"]
+    y = 180
+    for line in lines:
+        put(line, 520, y)
+        y += 55
+    y += 40
+    for choice in choices:
+        put(choice, 560, y)
+        y += 70
+    put(f"Score {60 + index % 40}", 520, y + 40, 0.8)
+
+    # フッター
+    put("Previous            Next", 1500, 1050, 0.7)
+    return image
+
+
+def write_synthetic_inputs(directory: Path, count: int) -> List[Path]:
+    paths = []
+    for i in range(count):
+        path = directory / f"synthetic_{i:03d}.png"
+        cv2.imwrite(str(path), make_question_screenshot(i))
+        paths.append(path)
+    return paths
+
+
+def run_path(ocr: CCScreenshotOCR, image_paths: List[Path]) -> Dict:
+    """
+    extract_text + parse_question を実行し、OCR時間と解析成功率を集計
+    """
+    ocr_time = 0.0
+    parsed = 0
+    for image_path in image_paths:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            text = ocr.extract_text(str(image_path))
+        ocr_time += time.perf_counter() - start
+
+        if text and ocr.parse_question(text, image_path.name)['parsed_successfully']:
+            parsed += 1
+
+    return {'time': ocr_time, 'parsed': parsed}
+
+
+def run_benchmark(input_dir: str = None, count: int = 10):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        if input_dir:
+            image_paths = sorted(p for p in Path(input_dir).iterdir()
+                                 if p.suffix.lower() in {'.png', '.jpg', '.jpeg'})
+        else:
+            image_paths = write_synthetic_inputs(tmp_path, count)
+
+        total = len(image_paths)
+        print(f"ROI切り出しベンチマーク: {total}枚")
+        print("-" * 40)
+
+        results = {}
+        for name, use_roi in (('全画面', False), ('ROI', True)):
+            ocr = CCScreenshotOCR(tmp_dir, str(tmp_path / name), use_cache=False, use_roi=use_roi)
+            results[name] = run_path(ocr, image_paths)
+            print(f"{name:<4}: OCR {results[name]['time']:7.2f} s "
+                  f"({results[name]['time'] / total * 1000:.0f} ms/枚)  "
+                  f"解析成功 {results[name]['parsed']}/{total} "
+                  f"({results[name]['parsed'] / total * 100:.1f}%)")
+            if use_roi:
+                print(f"      ROI: プロファイル使用 {ocr.roi_detector.stats['profile_hits']} / "
+                      f"レイアウト検出 {ocr.roi_detector.stats['detections']}")
+
+        full, roi = results['全画面'], results['ROI']
+        if roi['time']:
+            print(f"OCR時間: {full['time'] / roi['time']:.2f}x 高速化")
+        print(f"解析成功率の差: {(roi['parsed'] - full['parsed']) / total * 100:+.1f} pt")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ROI切り出しベンチマーク")
+    parser.add_argument("--input", help="スクリーンショットのディレクトリ（省略時は合成画像）")
+    parser.add_argument("--count", type=int, default=10, help="合成画像の枚数")
+    args = parser.parse_args()
+
+    run_benchmark(args.input, args.count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+テキスト正規化のマイクロベンチマーク
+- 従来の re.sub 連続処理・用語リストのループと text_normalizer を比較
+- 1文字列あたりの処理時間と、出力が一致することを表示
+"""
+
+import argparse
+import json
+import random
+import re
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from text_normalizer import (TECH_TERM_MATCHER, TECH_TERMS, clean_basic_text, clean_card_text,
+                             is_choice_candidate, normalize_ocr_text)
+
+
+CORPUS_FILE = Path(__file__).parent.parent / 'output' / 'parse_corpus.jsonl'
+
+
+# ---- 従来の実装（比較用） ----
+# 従来の clean_text 末尾の引用符エスケープ（.replace('"', '""')）は、TSVライター側の引用符付けと
+# 二重になるため text_normalizer から削除済み。比較用の実装からも除いている
+
+def legacy_ocr_clean_text(text: str) -> str:
+    text = re.sub(r'\r\n', '\n', text)
+    text = re.sub(r'\r', '\n', text)
+    text = re.sub(r' +', ' ', text)
+    text = re.sub(r'\n +', '\n', text)
+    text = re.sub(r' +\n', '\n', text)
+    text = re.sub(r'\n\n+', '\n\n', text)
+    return text.strip()
+
+
+def legacy_basic_clean_text(text: str) -> str:
+    if not text:
+        return ""
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def legacy_card_clean_text(text: str) -> str:
+    if not text:
+        return ""
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'["""]', '"', text)
+    text = re.sub(r"[''']", "'", text)
+    text = re.sub(r'[—–]', '-', text)
+    text = re.sub(r'[©®™]', '', text)
+    text = re.sub(r'\([^\)]{0,3}\)', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+LEGACY_EXCLUDE_PATTERNS = [
+    r'^(correct|score|seconds|attempt|taken|explanation)',
+    r'^[0-9]+$',
+    r'http[s]?://',
+    r'@',
+    r'^[^a-zA-Z]',
+]
+
+
+def legacy_is_choice_candidate(choice_clean: str) -> bool:
+    for pattern in LEGACY_EXCLUDE_PATTERNS:
+        if re.search(pattern, choice_clean, re.IGNORECASE):
+            return False
+    if not (5 <= len(choice_clean) <= 100):
+        return False
+    for term in TECH_TERMS:
+        if term.lower() in choice_clean.lower():
+            return True
+    choice_lower = choice_clean.lower()
+    return bool(choice_lower.startswith(('a ', 'an ', 'the ')) or
+                any(word in choice_lower for word in ['control', 'management', 'protection', 'security']) or
+                choice_clean[0].isupper())
+
+
+# ---- 入力データ ----
+
+def load_samples(count: int) -> List[str]:
+    """
+    回帰コーパスのOCRテキスト（無ければ合成テキスト）
+    """
+    if CORPUS_FILE.exists():
+        with open(CORPUS_FILE, 'r', encoding='utf-8') as f:
+            texts = [json.loads(line)['raw_text'] for line in f if line.strip()]
+        if texts:
+            return texts
+
+    rng = random.Random(0)
+    words = ['Which', 'of', 'the', 'following', 'is', 'a', 'security', 'control', 'Data',
+             'encryption', 'policy', 'Risk', 'acceptance', 'user', '(c)', '—', '©', '<b>', '</b>',
+             'Correct', 'Answers', 'http://example.com', '42', 'Least', 'privilege', '"quoted"']
+    samples = []
+    for _ in range(count):
+        lines = []
+        for _ in range(rng.randint(4, 12)):
+            line = ' '.join(rng.choice(words) for _ in range(rng.randint(1, 10)))
+            lines.append(' ' * rng.randint(0, 2) + line + ' ' * rng.randint(0, 2))
+        samples.append(rng.choice(['\n', '\r\n', '\n\n\n']).join(lines))
+    return samples
+
+
+def measure(func: Callable, inputs: List[str], rounds: int) -> float:
+    """
+    1文字列あたりの平均処理時間（マイクロ秒）
+    """
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in inputs:
+            func(text)
+    return (time.perf_counter() - start) / (rounds * len(inputs)) * 1e6
+
+
+def run_benchmark(count: int, rounds: int):
+    texts = load_samples(count)
+    lines = [line for text in texts for line in text.splitlines() if len(line.strip()) >= 3]
+    card_lines = [legacy_card_clean_text(line) for line in lines]
+
+    cases = [
+        ('OCR clean_text', legacy_ocr_clean_text, normalize_ocr_text, texts),
+        ('basic clean_text', legacy_basic_clean_text, clean_basic_text, lines),
+        ('card clean_text', legacy_card_clean_text, clean_card_text, lines),
+        ('choice filter', legacy_is_choice_candidate,
+         lambda line: bool(is_choice_candidate(line, TECH_TERM_MATCHER)), card_lines),
+    ]
+
+    print(f"テキスト正規化ベンチマーク: {len(texts)}テキスト / {len(lines)}行")
+    print("-" * 64)
+    print(f"{'処理':<18}{'従来 µs':>10}{'新 µs':>10}{'倍率':>8}  出力一致")
+    for name, legacy, current, inputs in cases:
+        identical = all(legacy(text) == current(text) for text in inputs)
+        legacy_time = measure(legacy, inputs, rounds)
+        current_time = measure(current, inputs, rounds)
+        print(f"{name:<18}{legacy_time:>10.2f}{current_time:>10.2f}"
+              f"{legacy_time / current_time:>7.2f}x  {'OK' if identical else 'NG'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="テキスト正規化ベンチマーク")
+    parser.add_argument("--count", type=int, default=200, help="合成テキスト数（コーパスが無い場合）")
+    parser.add_argument("--rounds", type=int, default=20, help="計測の繰り返し回数")
+    args = parser.parse_args()
+
+    run_benchmark(args.count, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
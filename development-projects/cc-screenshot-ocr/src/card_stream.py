@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+OCR結果 → Ankiカードのストリーミング処理（共通モジュール）
+- OCR結果は1件ずつ読み込み（JSON Lines、または JSON配列を逐次デコード）
+- カードはTSV・JSONに1件ずつ書き出し（scripts/anki_tsv.py の AnkiTsvWriter と共通:
+  Anki互換の引用符付け・まとめ書き・一時ファイル経由で置き換え、gzip圧縮も可）
+- レポート用には件数と先頭数件のサンプルだけを集計
+メモリ使用量は問題数に比例しない
+"""
+
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO
+
+# 書き出しは scripts/anki_tsv.py の AnkiTsvWriter と共通
+sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+from anki_tsv import AnkiTsvWriter
+
+
+READ_CHUNK_SIZE = 1 << 16
+
+# json.dump(cards, ensure_ascii=False, indent=2) と同じ書式で1件ずつ出力
+_CARD_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def resolve_input_file(input_file: Path) -> Path:
+    """
+    同名の .jsonl があればそちらを優先
+    """
+    input_file = Path(input_file)
+    jsonl_file = input_file.with_suffix('.jsonl')
+    if input_file.suffix != '.jsonl' and jsonl_file.exists():
+        return jsonl_file
+    return input_file
+
+
+def _iter_json_array(f: TextIO, chunk_size: int) -> Iterator[Dict]:
+    """
+    JSON配列の要素を1つずつデコード（ファイル全体を読み込まない）
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    eof = False
+    started = False
+
+    while True:
+        # 空白と区切りのカンマを読み飛ばす
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n':
+                position += 1
+            if position < len(buffer) and started and buffer[position] == ',':
+                position += 1
+                continue
+            if position < len(buffer) or eof:
+                break
+            chunk = f.read(chunk_size)
+            buffer = buffer[position:] + chunk
+            position = 0
+            eof = not chunk
+
+        if position >= len(buffer):
+            raise ValueError("JSON配列が途中で終わっています")
+
+        if not started:
+            if buffer[position] != '[':
+                raise ValueError("OCR結果ファイルがJSON配列ではありません")
+            started = True
+            position += 1
+            continue
+
+        if buffer[position] == ']':
+            return
+
+        try:
+            record, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            # 要素が読み込み済みの範囲をまたぐので、続きを読んで再試行
+            chunk = f.read(chunk_size)
+            buffer = buffer[position:] + chunk
+            position = 0
+            eof = not chunk
+            continue
+
+        yield record
+        position = end
+        if position > chunk_size:
+            buffer = buffer[position:]
+            position = 0
+
+
+def iter_question_records(input_file: Path, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[Dict]:
+    """
+    OCR結果を1件ずつ返す（.jsonl は1行1件、.json は配列）
+    """
+    input_file = Path(input_file)
+    with open(input_file, 'r', encoding='utf-8') as f:
+        if input_file.suffix == '.jsonl':
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from _iter_json_array(f, chunk_size)
+
+
+class CardStreamWriter:
+    """
+    カードをTSV（とJSON配列）に1件ずつ書き出す
+    出力内容は全カードをまとめて書き出した場合と同じ
+    - 書き出しは scripts/anki_tsv.py の AnkiTsvWriter（Anki互換の引用符付け・まとめ書き・
+      一時ファイル経由の置き換え。compress=True または .gz のパスなら gzip 圧縮）
+    - JSON配列も同じライターに書式済みの文字列として書く
+    """
+
+    def __init__(self, tsv_file: Path, headers: List[str], json_file: Optional[Path] = None,
+                 compress: Optional[bool] = None):
+        self.tsv_file = Path(tsv_file)
+        self.json_file = Path(json_file) if json_file else None
+        self.headers = headers
+        self.count = 0
+        self._tsv = AnkiTsvWriter(str(self.tsv_file), compress=compress)
+        self._json = AnkiTsvWriter(str(self.json_file), compress=compress) if self.json_file else None
+
+    def __enter__(self) -> 'CardStreamWriter':
+        self._tsv.__enter__()
+        self._tsv.write_row(self.headers)
+        if self._json:
+            self._json.__enter__()
+            self._json.write_line('[')
+        return self
+
+    def write(self, card: Dict, row: Iterable[str]):
+        self._tsv.write_row(list(row))
+        if self._json:
+            # 配列の要素として1段インデントを下げる
+            element = _CARD_ENCODER.encode(card).replace('\n', '\n  ')
+            self._json.write_line(('\n  ' if self.count == 0 else ',\n  ') + element)
+        self.count += 1
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if self._json:
+                if exc_type is None:
+                    self._json.write_line('\n]' if self.count else ']')
+                self._json.__exit__(exc_type, exc_value, traceback)
+        finally:
+            self._tsv.__exit__(exc_type, exc_value, traceback)
+        return False
+
+
+class DeckSummary:
+    """
+    デッキ全体の集計（カードそのものは保持しない）
+    品質スコアの分布と、種類ごとの件数・先頭数件のサンプルを持つ
+    """
+
+    def __init__(self, sample_size: int = 10):
+        self.sample_size = sample_size
+        self.total = 0
+        self.quality_counts = Counter()
+        self.counts = Counter()
+        self.samples: Dict[str, List[Dict]] = {}
+
+    def add(self, card: Dict):
+        self.total += 1
+        if 'quality_score' in card:
+            self.quality_counts[card['quality_score']] += 1
+
+    def flag(self, name: str, card: Dict, **fields):
+        """
+        カードを種類 name として数え、サンプル数に達するまで fields を記録
+        """
+        self.counts[name] += 1
+        samples = self.samples.setdefault(name, [])
+        if len(samples) < self.sample_size:
+            samples.append({'filename': card.get('filename', ''), **fields})
+
+    def quality_at_least(self, score: int) -> int:
+        return sum(count for quality, count in self.quality_counts.items() if quality >= score)
@@ -30,18 +30,16 @@ def create_complete_anki_deck():
         
         # 各カードデータを選択肢込みで生成
         for card in generator.cards:
-            raw_data = card['raw_data']
-            
             # 状況説明部分
-            situation_part = f"{raw_data['situation']}\n\n" if raw_data['situation'] else ""
+            situation_part = f"{card.situation}\n\n" if card.situation else ""
             
             # 選択肢部分を作成
             choices_text = ""
-            for i, choice in enumerate(raw_data['choices'], 1):
+            for i, choice in enumerate(card.choices, 1):
                 choices_text += f"{chr(64+i)}. {choice}\n"
             
             # 完全なカード内容
-            front_content = f"Q{card['question_number']}: {situation_part}{raw_data['question']}\n\n{choices_text}\n正解: {{c1::{raw_data['correct_answer']}}}\n\n解説: {raw_data['explanation']}"
+            front_content = f"Q{card.question_number}: {situation_part}{card.question}\n\n{choices_text}\n正解: {{c1::{card.correct_answer}}}\n\n解説: {card.explanation}"
             
             writer.writerow([
                 front_content,
@@ -6,199 +6,12 @@
 import os
 import sys
 from pathlib import Path
-import pytesseract
-from PIL import Image
 import json
-import re
 from typing import Dict, List
 
-
-def extract_question_data_final(text: str, filename: str) -> Dict:
-    """
-    最終版の問題データ抽出（最も柔軟なアプローチ）
-    """
-    result = {
-        'filename': filename,
-        'raw_text': text,
-        'question': '',
-        'choices': [],
-        'correct_answer': '',
-        'explanation': '',
-        'attempt_info': '',
-        'parsed': False
-    }
-    
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    
-    # 1. 問題文検出（より広範囲）
-    question_candidates = []
-    
-    for line in lines:
-        # 問題文の開始パターン
-        question_starters = [
-            'For which of the following', 'Which of the following', 'What',
-            'Which', 'How', 'Where', 'When', 'Why', 'Of the following'
-        ]
-        
-        if any(starter in line for starter in question_starters):
-            # 長さチェック（短すぎず長すぎず）
-            if 15 <= len(line) <= 300:
-                question_candidates.append(line)
-        
-        # "?"で終わる行
-        if line.endswith('?') and len(line) > 20:
-            question_candidates.append(line)
-        
-        # "important"、"concept"、"type"を含む疑問文
-        if any(keyword in line.lower() for keyword in ['important', 'concept', 'type', 'best', 'most']):
-            if '?' in line and len(line) > 20:
-                question_candidates.append(line)
-    
-    # 最も適切な問題文を選択
-    if question_candidates:
-        # 最も情報量の多い（長い）問題文を選択
-        result['question'] = max(question_candidates, key=len)
-    
-    # 2. 選択肢検出（最も包括的）
-    potential_choices = []
-    
-    # 除外すべきキーワード
-    exclude_keywords = [
-        'progress', 'accuracy', 'answers', 'cyder', 'chess', 'usage', 
-        'isc2', 'obrizum', 'google', 'anki', 'attempt taken',
-        'score', 'seconds', 'explanation', 'correct answers',
-        'http', '@', 'www', '.com', '.io'
-    ]
-    
-    for line in lines:
-        # 明らかに選択肢でない行をスキップ
-        if any(exclude in line.lower() for exclude in exclude_keywords):
-            continue
-        
-        # 長さフィルター
-        if not (5 <= len(line) <= 150):
-            continue
-        
-        # 選択肢らしい特徴
-        is_choice = False
-        
-        # パターン1: 大文字で始まる文
-        if line[0].isupper() and ' ' in line:
-            is_choice = True
-        
-        # パターン2: 技術用語を含む
-        tech_terms = [
-            'system', 'data', 'access', 'control', 'security', 'network',
-            'password', 'encryption', 'firewall', 'malware', 'virus',
-            'threat', 'risk', 'asset', 'policy', 'procedure', 'medical',
-            'streaming', 'retail', 'records', 'camera', 'patient'
-        ]
-        if any(term in line.lower() for term in tech_terms):
-            is_choice = True
-        
-        # パターン3: "Correct Answers"の近くの行
-        if 'Correct Answers' in text:
-            correct_index = text.find('Correct Answers')
-            line_position = text.find(line)
-            if abs(correct_index - line_position) < 200:  # 近い位置
-                is_choice = True
-        
-        if is_choice:
-            potential_choices.append(line)
-    
-    # 重複除去と最終選択肢決定
-    unique_choices = []
-    seen_clean = set()
-    
-    for choice in potential_choices:
-        # 選択肢をクリーニング
-        clean_choice = re.sub(r'^[A-D\d\)\.\:\s]+', '', choice).strip()
-        clean_choice = re.sub(r'Correct Answers?', '', clean_choice).strip()
-        
-        if clean_choice and len(clean_choice) > 3 and clean_choice not in seen_clean:
-            seen_clean.add(clean_choice)
-            unique_choices.append(choice)
-    
-    result['choices'] = unique_choices[:8]  # 最大8個
-    
-    # 3. 正解検出
-    correct_patterns = [
-        r'Correct Answers?\s*\n\s*([^\n]+)',
-        r'✓\s*([^\n]+)',
-        r'✔\s*([^\n]+)'
-    ]
-    
-    for pattern in correct_patterns:
-        match = re.search(pattern, text, re.MULTILINE)
-        if match:
-            result['correct_answer'] = match.group(1).strip()
-            break
-    
-    # "Correct Answers"の後の行を探す
-    if not result['correct_answer']:
-        for i, line in enumerate(lines):
-            if 'correct answer' in line.lower():
-                # 次の数行から正解候補を探す
-                for j in range(i+1, min(i+5, len(lines))):
-                    candidate = lines[j].strip()
-                    if (candidate and 
-                        len(candidate) < 100 and 
-                        candidate not in ['Explanation'] and
-                        not candidate.startswith('Which') and
-                        not candidate.startswith('What')):
-                        result['correct_answer'] = candidate
-                        break
-                break
-    
-    # 4. 解説検出
-    explanation_lines = []
-    capture_explanation = False
-    
-    for line in lines:
-        if line.lower().strip() == 'explanation':
-            capture_explanation = True
-            continue
-        
-        if capture_explanation:
-            # 解説の終了条件
-            if (line.startswith('For which') or 
-                line.startswith('Which') or 
-                line.startswith('What') or
-                len(explanation_lines) >= 5):  # 最大5行
-                break
-            
-            if len(line) > 15:  # 十分な長さの行のみ
-                explanation_lines.append(line)
-    
-    result['explanation'] = ' '.join(explanation_lines)
-    
-    # 5. attempt taken情報
-    for line in lines:
-        if 'attempt taken' in line.lower():
-            result['attempt_info'] = line
-            break
-    
-    # 6. パース成功判定（非常に寛容）
-    has_question = bool(result['question'])
-    has_content = len(result['choices']) >= 1 or result['correct_answer'] or result['explanation']
-    
-    if has_question or has_content:
-        result['parsed'] = True
-    
-    # 最後の手段：raw_textに明らかな問題要素があれば成功とする
-    if not result['parsed']:
-        text_lower = text.lower()
-        if (('which' in text_lower or 'what' in text_lower) and 
-            ('correct' in text_lower or 'answer' in text_lower)):
-            result['parsed'] = True
-            if not result['question']:
-                # 最低限の問題文を生成
-                for line in lines:
-                    if any(word in line.lower() for word in ['which', 'what', '?']):
-                        result['question'] = line
-                        break
-    
-    return result
+from fix_store import image_content_hash
+from ocr_cache import image_to_string_cached, print_cache_stats
+from question_parser import parse_question_text
 
 
 def final_reprocess_all():
@@ -218,30 +31,35 @@ def final_reprocess_all():
     final_results = []
     success_count = 0
     
-    for i, img_file in enumerate(image_files):
-        print(f"最終処理 [{i+1}/{len(image_files)}]: {img_file.name}")
+    # 1件ごとにJSON Linesにも追記（Ankiデッキ生成はこちらを逐次読み込み）
+    with open(output_dir / 'cc_questions_final.jsonl', 'w', encoding='utf-8') as jsonl_file:
+        for i, img_file in enumerate(image_files):
+            print(f"最終処理 [{i+1}/{len(image_files)}]: {img_file.name}")
         
-        try:
-            image = Image.open(img_file)
-            text = pytesseract.image_to_string(image)
+            try:
+                text = image_to_string_cached(img_file)
             
-            # 最終版アルゴリズムで処理
-            question_data = extract_question_data_final(text, img_file.name)
-            final_results.append(question_data)
+                # 統合パーサーで処理
+                question_data = parse_question_text(text, img_file.name)
+                # 手動修正ストアとの照合用（ファイル名ではなく画像内容で引く）
+                question_data['image_hash'] = image_content_hash(img_file)
+                final_results.append(question_data)
             
-            if question_data['parsed']:
-                success_count += 1
-                print(f"  ✓ 成功")
-            else:
-                print(f"  ✗ 失敗")
+                if question_data['parsed']:
+                    success_count += 1
+                    print(f"  ✓ 成功")
+                else:
+                    print(f"  ✗ 失敗")
                 
-        except Exception as e:
-            print(f"  ✗ エラー: {e}")
-            final_results.append({
-                'filename': img_file.name,
-                'error': str(e),
-                'parsed': False
-            })
+            except Exception as e:
+                print(f"  ✗ エラー: {e}")
+                final_results.append({
+                    'filename': img_file.name,
+                    'error': str(e),
+                    'parsed': False
+                })
+            
+            jsonl_file.write(json.dumps(final_results[-1], ensure_ascii=False) + '\n')
     
     # 結果を保存
     with open(output_dir / 'cc_questions_final.json', 'w', encoding='utf-8') as f:
@@ -255,6 +73,7 @@ def final_reprocess_all():
     print(f"総ファイル数: {len(final_results)}")
     print(f"構造化成功: {success_count}")
     print(f"最終成功率: {(success_count/len(final_results)*100):.1f}%")
+    print_cache_stats()
     
     # 失敗したファイルがあれば表示
     failed_files = [r for r in final_results if not r.get('parsed', False)]
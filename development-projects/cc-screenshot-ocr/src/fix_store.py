@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+手動修正・手動作成問題の外部ストア（JSON Lines + 索引）
+- 1行1レコード。索引作成時は各行の先頭にあるキーだけを読み、
+  レコード本体は参照されたときに初めてデコードする
+- キー → ファイル内オフセット の辞書で O(1) 参照
+- ファイルの更新（mtime・サイズ）を検知して索引を作り直す（コード変更なしで反映）
+- 手動修正はスクリーンショットの内容ハッシュ（SHA-256）で照合
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+
+CONFIG_DIR = Path(__file__).parent.parent / 'config'
+MANUAL_FIXES_FILE = CONFIG_DIR / 'manual_fixes.jsonl'
+CURATED_QUESTIONS_FILE = CONFIG_DIR / 'curated_questions.jsonl'
+DEFAULT_IMAGE_DIR = Path(__file__).parent.parent / 'input' / 'screenshots'
+
+# JSON の文字列 または 整数
+_JSON_SCALAR = rb'("[^"\\]*(?:\\.[^"\\]*)*"|-?\d+)'
+
+
+def image_content_hash(image_path: Path) -> str:
+    """
+    画像ファイルの内容ハッシュ（SHA-256）
+    """
+    digest = hashlib.sha256()
+    with open(image_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _decode_scalar(raw: bytes):
+    """
+    索引用に読んだキーの値（エスケープが無ければ json.loads を通さない）
+    """
+    if raw[:1] != b'"':
+        return int(raw)
+    if b'\\' in raw:
+        return json.loads(raw)
+    return raw[1:-1].decode('utf-8')
+
+
+class JSONLIndexStore:
+    """
+    JSON Lines ファイルのキー索引付きストア
+    key_field を主キー、alias_field（省略可）を副キーとして参照できる
+    """
+
+    def __init__(self, path: Path, key_field: str, alias_field: Optional[str] = None):
+        self.path = Path(path)
+        self.key_field = key_field
+        self.alias_field = alias_field
+
+        # 行頭の {"key_field": 値, "alias_field": 値 だけを読む
+        prefix = rb'\{"' + re.escape(key_field.encode('utf-8')) + rb'": ' + _JSON_SCALAR
+        if alias_field:
+            prefix += rb'(?:, "' + re.escape(alias_field.encode('utf-8')) + rb'": ' + _JSON_SCALAR + rb')?'
+        self._prefix_pattern = re.compile(prefix)
+        # 改行 + キー先頭 の固定文字列から始まるので高速に検索できる
+        self._line_pattern = re.compile(rb'\n' + prefix)
+
+        self._signature = None
+        self._offsets: Dict = {}
+        self._aliases: Dict = {}
+        self._records: Dict = {}
+        self._count = 0
+
+    def _refresh(self):
+        """
+        ファイルが更新されていれば索引を作り直す
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            signature = None
+        else:
+            signature = (stat.st_mtime_ns, stat.st_size)
+
+        if signature == self._signature:
+            return
+        self._signature = signature
+        self._offsets = {}
+        self._aliases = {}
+        self._records = {}
+        self._count = 0
+        if signature is None:
+            return
+
+        with open(self.path, 'rb') as f:
+            data = f.read()
+
+        # 全行がキー先頭の書式なら、正規表現1回の走査で索引を作る
+        first = self._prefix_pattern.match(data)
+        matches = ([first] if first else []) + list(self._line_pattern.finditer(data))
+        entries = [(match.start() + (match is not first), match.group(1),
+                    match.group(2) if self.alias_field else None) for match in matches]
+        lines = data.count(b'\n') + (0 if data.endswith(b'\n') else 1)
+        if len(entries) == lines:
+            self._count = lines
+            for offset, key, alias in entries:
+                self._add(offset, _decode_scalar(key), _decode_scalar(alias) if alias else None)
+            return
+
+        # 空行や、手で編集された行がある場合は1行ずつ
+        offset = 0
+        for line in data.splitlines(keepends=True):
+            if line.strip():
+                self._count += 1
+                self._add(offset, *self._read_keys(line))
+            offset += len(line)
+
+    def _add(self, offset: int, key, alias):
+        # 空のキー（ハッシュ未登録など）は副キーだけで引く
+        if key not in (None, ''):
+            self._offsets[key] = offset
+        if alias:
+            self._aliases[alias] = offset
+
+    def _read_keys(self, line: bytes):
+        match = self._prefix_pattern.match(line)
+        if match:
+            key = _decode_scalar(match.group(1))
+            alias = _decode_scalar(match.group(2)) if self.alias_field and match.group(2) else None
+            return key, alias
+
+        # 手で編集されてキーの順序が変わった行は全体をデコード
+        record = json.loads(line)
+        return record.get(self.key_field), record.get(self.alias_field) if self.alias_field else None
+
+    def _load(self, offset: Optional[int]) -> Optional[Dict]:
+        if offset is None:
+            return None
+        if offset not in self._records:
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                self._records[offset] = json.loads(f.readline())
+        return self._records[offset]
+
+    def get(self, key) -> Optional[Dict]:
+        """
+        主キーで参照
+        """
+        self._refresh()
+        return self._load(self._offsets.get(key))
+
+    def get_by_alias(self, alias) -> Optional[Dict]:
+        """
+        副キーで参照
+        """
+        self._refresh()
+        return self._load(self._aliases.get(alias))
+
+    def __contains__(self, key) -> bool:
+        self._refresh()
+        return key in self._offsets
+
+    def __len__(self) -> int:
+        self._refresh()
+        return self._count
+
+    def __iter__(self) -> Iterator[Dict]:
+        """
+        全レコードをファイル順に返す
+        """
+        if not self.path.exists():
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def dump_record(self, record: Dict) -> str:
+        """
+        キー → 副キー → その他 の順で1行に書き出す
+        """
+        ordered = {self.key_field: record.get(self.key_field)}
+        if self.alias_field:
+            ordered[self.alias_field] = record.get(self.alias_field)
+        ordered.update(record)
+        return json.dumps(ordered, ensure_ascii=False)
+
+    def write_all(self, records: List[Dict]):
+        """
+        全レコードを書き出す（一時ファイル経由で置き換え）
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(self.dump_record(record) + '\n')
+        os.replace(tmp_path, self.path)
+
+
+class ManualFixStore(JSONLIndexStore):
+    """
+    手動修正データ（image_hash が主キー、filename が副キー）
+    """
+
+    def __init__(self, path: Path = MANUAL_FIXES_FILE, image_dir: Path = DEFAULT_IMAGE_DIR):
+        super().__init__(path, 'image_hash', 'filename')
+        self.image_dir = Path(image_dir)
+        self._hashes: Dict[str, str] = {}
+
+    def image_hash(self, question_data: Dict) -> Optional[str]:
+        """
+        OCR結果の画像ハッシュ（記録が無ければ画像ファイルから計算）
+        """
+        if question_data.get('image_hash'):
+            return question_data['image_hash']
+
+        filename = question_data.get('filename', '')
+        if filename not in self._hashes:
+            image_path = self.image_dir / filename
+            self._hashes[filename] = image_content_hash(image_path) if filename and image_path.is_file() else None
+        return self._hashes[filename]
+
+    def lookup(self, question_data: Dict) -> Optional[Dict]:
+        """
+        OCR結果に対応する手動修正
+        （ハッシュ未登録の修正だけはファイル名で照合）
+        """
+        image_hash = self.image_hash(question_data)
+        if image_hash:
+            fix = self.get(image_hash)
+            if fix is not None:
+                return fix
+
+        fix = self.get_by_alias(question_data.get('filename', ''))
+        if fix is not None and not fix.get('image_hash'):
+            return fix
+        return None
+
+    def rehash(self) -> int:
+        """
+        image_hash が空の修正に、画像ファイルから計算したハッシュを記録
+        """
+        records = list(self)
+        updated = 0
+        for record in records:
+            if record.get('image_hash'):
+                continue
+            image_path = self.image_dir / record.get('filename', '')
+            if image_path.is_file():
+                record['image_hash'] = image_content_hash(image_path)
+                updated += 1
+        if updated:
+            self.write_all(records)
+        return updated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="手動修正ストアの管理")
+    parser.add_argument('command', choices=['stats', 'rehash'],
+                        help="stats: 件数を表示 / rehash: 画像からハッシュを記録")
+    parser.add_argument('--store', default=str(MANUAL_FIXES_FILE), help="手動修正ファイル")
+    parser.add_argument('--images', default=str(DEFAULT_IMAGE_DIR), help="スクリーンショットのディレクトリ")
+    args = parser.parse_args()
+
+    store = ManualFixStore(args.store, args.images)
+    if args.command == 'rehash':
+        if not store.image_dir.is_dir():
+            print(f"❌ スクリーンショットのディレクトリが見つかりません: {store.image_dir}")
+            sys.exit(1)
+        print(f"🔧 ハッシュを記録: {store.rehash()}件")
+
+    records = list(store)
+    hashed = sum(1 for record in records if record.get('image_hash'))
+    print(f"📖 手動修正: {len(records)}件 (ハッシュ登録済み {hashed}件)")
+
+
+if __name__ == "__main__":
+    main()
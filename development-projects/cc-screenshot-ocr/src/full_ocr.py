@@ -6,95 +6,11 @@ CC練習問題スクリーンショット全ファイルOCR処理
 import os
 import sys
 from pathlib import Path
-import pytesseract
-from PIL import Image
 import json
-import re
 from typing import Dict, List
 
-
-def extract_question_data(text: str, filename: str) -> Dict:
-    """
-    OCRテキストから問題データを構造化抽出
-    """
-    result = {
-        'filename': filename,
-        'raw_text': text,
-        'question': '',
-        'choices': [],
-        'correct_answer': '',
-        'explanation': '',
-        'attempt_info': '',
-        'parsed': False
-    }
-    
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    
-    # 問題文を探す（"What"で始まる行、または"Which"で始まる行）
-    question_lines = []
-    choices = []
-    explanation_lines = []
-    
-    in_explanation = False
-    found_question = False
-    
-    for i, line in enumerate(lines):
-        # 問題文の開始を検出
-        if re.match(r'^(What|Which|How|Where|When|Why)', line):
-            found_question = True
-            question_lines = [line]
-            # 次の行も問題文の一部か確認
-            for j in range(i+1, min(i+3, len(lines))):
-                next_line = lines[j]
-                if not re.match(r'^[A-Z]', next_line) and not 'attempt taken' in next_line:
-                    question_lines.append(next_line)
-                else:
-                    break
-            break
-    
-    # 選択肢を探す（大文字で始まる行）
-    choice_pattern = r'^([A-Z][A-Za-z\s]+)$'
-    
-    for line in lines:
-        # "Explanation"の後は解説
-        if line.lower().startswith('explanation'):
-            in_explanation = True
-            continue
-        
-        if in_explanation:
-            if line and not line.startswith('Which') and not line.startswith('What'):
-                explanation_lines.append(line)
-        
-        # 選択肢らしい行を検出
-        if re.match(choice_pattern, line) and len(line) > 3 and len(line) < 100:
-            # 明らかに選択肢でない行を除外
-            if not any(exclude in line.lower() for exclude in ['progress', 'accuracy', 'answers', 'cyder', 'chess', 'usage']):
-                choices.append(line)
-    
-    # 正解を探す（"Correct Answers"の近く）
-    for i, line in enumerate(lines):
-        if 'correct answers' in line.lower():
-            # 次の行が正解の可能性
-            if i+1 < len(lines):
-                correct_candidate = lines[i+1]
-                if len(correct_candidate) < 50:  # 短い行のみ
-                    result['correct_answer'] = correct_candidate
-    
-    # "attempt taken"の情報
-    for line in lines:
-        if 'attempt taken' in line.lower():
-            result['attempt_info'] = line
-    
-    # 結果を格納
-    result['question'] = ' '.join(question_lines)
-    result['choices'] = choices[:6]  # 最大6個の選択肢
-    result['explanation'] = ' '.join(explanation_lines)
-    
-    # パース成功判定
-    if result['question'] and len(result['choices']) >= 2:
-        result['parsed'] = True
-    
-    return result
+from ocr_cache import image_to_string_cached, print_cache_stats
+from question_parser import parse_question_text
 
 
 def process_all_screenshots(input_dir: str, output_dir: str):
@@ -117,12 +33,11 @@ def process_all_screenshots(input_dir: str, output_dir: str):
         print(f"処理中 [{i+1}/{len(image_files)}]: {img_file.name}")
         
         try:
-            # 画像を開いてOCR
-            image = Image.open(img_file)
-            text = pytesseract.image_to_string(image)
+            # 画像を開いてOCR（キャッシュ済みなら再実行しない）
+            text = image_to_string_cached(img_file)
             
             # 問題データを抽出
-            question_data = extract_question_data(text, img_file.name)
+            question_data = parse_question_text(text, img_file.name)
             all_results.append(question_data)
             
             if question_data['parsed']:
@@ -151,6 +66,7 @@ def process_all_screenshots(input_dir: str, output_dir: str):
     print(f"総ファイル数: {len(image_files)}")
     print(f"問題として解析成功: {parsed_count}")
     print(f"成功率: {(parsed_count/len(image_files)*100):.1f}%")
+    print_cache_stats()
     print(f"\n結果ファイル:")
     print(f"- {output_path}/cc_questions_full.json")
     print(f"- {output_path}/cc_questions_structured.txt")
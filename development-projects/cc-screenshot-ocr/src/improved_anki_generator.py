@@ -4,12 +4,15 @@
 より精密な選択肢抽出とデータクリーニング
 """
 
-import json
 import sys
-import re
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from answer_matcher import find_answer, needs_review
+from card_stream import CardStreamWriter, DeckSummary, iter_question_records, resolve_input_file
+from quality_engine import IMPROVED_RULES, score_card
+from text_normalizer import TECH_TERM_MATCHER, clean_card_text, is_choice_candidate
+
 
 class ImprovedCCAnkiGenerator:
     """
@@ -17,7 +20,7 @@ class ImprovedCCAnkiGenerator:
     """
     
     def __init__(self, input_file: str, output_dir: str):
-        self.input_file = Path(input_file)
+        self.input_file = resolve_input_file(Path(input_file))
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
@@ -25,34 +28,17 @@ class ImprovedCCAnkiGenerator:
             'total_questions': 0,
             'converted_cards': 0,
             'skipped_incomplete': 0,
-            'manual_review_needed': 0
+            'manual_review_needed': 0,
+            'answer_review_needed': 0,
+            'answer_unmatched': 0
         }
     
     def clean_text(self, text: str) -> str:
         """
         改良版テキストクリーニング
         """
-        if not text:
-            return ""
-        
-        # HTMLタグ除去
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # OCRエラーの修正
-        text = re.sub(r'["""]', '"', text)  # 引用符統一
-        text = re.sub(r"[''']", "'", text)  # アポストロフィ統一
-        text = re.sub(r'[—–]', '-', text)   # ダッシュ統一
-        
-        # 余分な記号・文字除去
-        text = re.sub(r'[©®™]', '', text)
-        text = re.sub(r'\([^\)]{0,3}\)', '', text)  # 短い括弧内容除去
-        text = re.sub(r'\s+', ' ', text)  # 空白統一
-        text = text.strip()
-        
-        # Ankiエスケープ
-        text = text.replace('"', '""')
-        
-        return text
+        # 記号の統一・除去、タグと短い括弧書きの除去、空白統一、Ankiエスケープ
+        return clean_card_text(text)
     
     def extract_clean_choices(self, question_data: Dict) -> List[str]:
         """
@@ -61,64 +47,14 @@ class ImprovedCCAnkiGenerator:
         raw_choices = question_data.get('choices', [])
         clean_choices = []
         
-        # 技術用語リスト（これらを含む行は選択肢候補）
-        tech_terms = [
-            'access control', 'authentication', 'authorization', 'encryption',
-            'firewall', 'malware', 'virus', 'security', 'data', 'network',
-            'system', 'password', 'user', 'administrative', 'physical',
-            'technical', 'policy', 'procedure', 'risk', 'threat', 'asset',
-            'confidentiality', 'integrity', 'availability', 'medical',
-            'privacy', 'gdpr', 'regulation', 'biometric', 'multifactor',
-            'non-repudiation', 'siem', 'ids', 'ips', 'vpn', 'certificate'
-        ]
-        
-        # 明らかに選択肢でない文字列
-        exclude_patterns = [
-            r'^(correct|score|seconds|attempt|taken|explanation)',
-            r'^[0-9]+$',  # 数字のみ
-            r'http[s]?://',  # URL
-            r'@',  # メールアドレス風
-            r'^[^a-zA-Z]',  # 英字で始まらない
-        ]
-        
         for choice in raw_choices:
             if not choice or len(choice.strip()) < 3:
                 continue
             
             choice_clean = self.clean_text(choice)
             
-            # 除外パターンチェック
-            skip = False
-            for pattern in exclude_patterns:
-                if re.search(pattern, choice_clean, re.IGNORECASE):
-                    skip = True
-                    break
-            
-            if skip:
-                continue
-            
-            # 長さフィルター
-            if not (5 <= len(choice_clean) <= 100):
-                continue
-            
-            # 技術用語を含むか、一般的な選択肢パターンか
-            is_valid_choice = False
-            
-            # 技術用語チェック
-            for term in tech_terms:
-                if term.lower() in choice_clean.lower():
-                    is_valid_choice = True
-                    break
-            
-            # 一般的な選択肢パターン
-            if not is_valid_choice:
-                choice_lower = choice_clean.lower()
-                if (choice_lower.startswith(('a ', 'an ', 'the ')) or
-                    any(word in choice_lower for word in ['control', 'management', 'protection', 'security']) or
-                    choice_clean[0].isupper()):  # 大文字で始まる
-                    is_valid_choice = True
-            
-            if is_valid_choice:
+            # 除外パターン・長さ・技術用語（キーワードマッチャーで1回走査）
+            if is_choice_candidate(choice_clean, TECH_TERM_MATCHER):
                 clean_choices.append(choice_clean)
         
         # 重複除去と最大4個まで
@@ -132,44 +68,17 @@ class ImprovedCCAnkiGenerator:
         
         return unique_choices[:4]
     
-    def find_correct_answer(self, question_data: Dict, choices: List[str]) -> Tuple[str, str]:
+    def find_correct_answer(self, question_data: Dict, choices: List[str]) -> Tuple[str, str, float]:
         """
         正解を特定（改良版）
+        (正解の選択肢, 記号, 信頼度) を返し、特定できなければ ("", "", 0.0)
         """
         correct_raw = question_data.get('correct_answer', '')
         
         if not correct_raw or not choices:
-            return choices[0] if choices else "", "A"
-        
-        correct_clean = self.clean_text(correct_raw)
-        
-        # 方法1: 完全一致または部分一致
-        for i, choice in enumerate(choices):
-            if (correct_clean.lower() in choice.lower() or 
-                choice.lower() in correct_clean.lower()):
-                return choice, chr(65 + i)
-        
-        # 方法2: キーワードマッチング
-        correct_keywords = set(re.findall(r'\b\w+\b', correct_clean.lower()))
-        best_match = ""
-        best_score = 0
-        best_index = 0
+            return "", "", 0.0
         
-        for i, choice in enumerate(choices):
-            choice_keywords = set(re.findall(r'\b\w+\b', choice.lower()))
-            common_keywords = correct_keywords & choice_keywords
-            score = len(common_keywords)
-            
-            if score > best_score:
-                best_score = score
-                best_match = choice
-                best_index = i
-        
-        if best_match:
-            return best_match, chr(65 + best_index)
-        
-        # フォールバック: 最初の選択肢
-        return choices[0], "A"
+        return find_answer(self.clean_text(correct_raw), choices)
     
     def create_improved_anki_card(self, question_data: Dict, card_id: int) -> Dict:
         """
@@ -184,25 +93,15 @@ class ImprovedCCAnkiGenerator:
         choices = self.extract_clean_choices(question_data)
         
         # 正解特定
-        correct_answer, correct_letter = self.find_correct_answer(question_data, choices)
+        correct_answer, correct_letter, answer_confidence = self.find_correct_answer(question_data, choices)
+        review_answer = needs_review(answer_confidence)
         
         # 空の選択肢を埋める
         while len(choices) < 4:
             choices.append("")
         
-        # データ品質チェック
-        quality_score = 0
-        if question_text and len(question_text) > 10:
-            quality_score += 2
-        if len([c for c in choices if c]) >= 2:
-            quality_score += 2
-        if correct_answer:
-            quality_score += 1
-        if explanation:
-            quality_score += 1
-        
-        # クローズテキスト
-        cloze_text = f"{{{{c1::{correct_answer}}}}}"
+        # クローズテキスト（正解を特定できない場合は空。空のクローズはAnkiが取り込めないので、このカードはデッキに入れない）
+        cloze_text = f"{{{{c1::{correct_answer}}}}}" if correct_answer else ""
         
         anki_card = {
             'card_id': card_id,
@@ -216,54 +115,53 @@ class ImprovedCCAnkiGenerator:
             'explanation': explanation,
             'cloze_text': cloze_text,
             'filename': filename,
-            'quality_score': quality_score,
-            'tags': 'CC ISC2 Cybersecurity Security+'
+            'quality_score': 0,
+            'answer_confidence': answer_confidence,
+            'answer_review': review_answer,
+            'tags': 'CC ISC2 Cybersecurity Security+' + (' NeedsReview' if review_answer else '')
         }
         
+        # データ品質チェック
+        anki_card['quality_score'] = score_card(anki_card, IMPROVED_RULES)
+        
         return anki_card
     
-    def generate_improved_tsv(self, cards: List[Dict]) -> str:
+    TSV_HEADERS = [
+        "問題文", "選択肢A", "選択肢B", "選択肢C", "選択肢D",
+        "正解", "解説", "Text", "タグ", "品質スコア"
+    ]
+    
+    def tsv_row(self, card: Dict) -> List[str]:
         """
-        改良版TSV生成
+        改良版TSVの1行
         """
-        headers = [
-            "問題文", "選択肢A", "選択肢B", "選択肢C", "選択肢D",
-            "正解", "解説", "Text", "タグ", "品質スコア"
+        return [
+            card['question'],
+            card['choice_a'],
+            card['choice_b'],
+            card['choice_c'],
+            card['choice_d'],
+            card['correct_answer'],
+            card['explanation'],
+            card['cloze_text'],
+            card['tags'],
+            str(card['quality_score'])
         ]
-        
-        lines = ["\t".join(headers)]
-        
-        for card in cards:
-            row = [
-                card['question'],
-                card['choice_a'],
-                card['choice_b'],
-                card['choice_c'],
-                card['choice_d'],
-                card['correct_answer'],
-                card['explanation'],
-                card['cloze_text'],
-                card['tags'],
-                str(card['quality_score'])
-            ]
-            lines.append("\t".join(row))
-        
-        return "\n".join(lines)
     
-    def generate_study_guide(self, cards: List[Dict]) -> str:
+    def generate_study_guide(self, summary: DeckSummary) -> str:
         """
         学習ガイド生成
         """
-        high_quality = [c for c in cards if c['quality_score'] >= 5]
-        medium_quality = [c for c in cards if 3 <= c['quality_score'] < 5]
-        low_quality = [c for c in cards if c['quality_score'] < 3]
+        high_quality = summary.quality_at_least(5)
+        medium_quality = summary.quality_at_least(3) - high_quality
+        low_quality = summary.total - summary.quality_at_least(3)
         
         guide = f"""# CC練習問題 Ankiデッキ学習ガイド
 
 ## 📊 品質分析
-- **高品質カード**: {len(high_quality)}枚（推奨学習優先度: 高）
-- **中品質カード**: {len(medium_quality)}枚（推奨学習優先度: 中）  
-- **低品質カード**: {len(low_quality)}枚（推奨学習優先度: 低、手動確認推奨）
+- **高品質カード**: {high_quality}枚（推奨学習優先度: 高）
+- **中品質カード**: {medium_quality}枚（推奨学習優先度: 中）  
+- **低品質カード**: {low_quality}枚（推奨学習優先度: 低、手動確認推奨）
 
 ## 🎯 学習戦略
 1. **高品質カード**から学習開始
@@ -275,11 +173,21 @@ class ImprovedCCAnkiGenerator:
 """
         
         if low_quality:
-            for i, card in enumerate(low_quality[:10], 1):
-                guide += f"{i}. {card['filename']}: {card['question'][:50]}...\n"
+            for i, card in enumerate(summary.samples['low_quality'], 1):
+                guide += f"{i}. {card['filename']}: {card['question']}...\n"
         else:
             guide += "なし（全カードが高品質です！）\n"
         
+        if summary.counts['answer_review']:
+            guide += f"\n## ❓ 正解の確認が必要なカード（{summary.counts['answer_review']}枚, タグ NeedsReview）\n"
+            for i, card in enumerate(summary.samples['answer_review'], 1):
+                guide += f"{i}. {card['filename']}: 信頼度 {card['answer_confidence']:.2f}\n"
+        
+        if summary.counts['unmatched']:
+            guide += f"\n## 🚫 正解を特定できずデッキから除外したカード（{summary.counts['unmatched']}枚, cc_anki_improved_review.tsv）\n"
+            for i, card in enumerate(summary.samples['unmatched'], 1):
+                guide += f"{i}. {card['filename']}: {card['question']}...\n"
+        
         guide += f"""
 ## 📚 学習トピック別分布
 CCの主要トピック:
@@ -304,73 +212,75 @@ CCの主要トピック:
         """
         print("🔧 改良版CC練習問題 → Ankiデッキ変換開始...")
         
-        with open(self.input_file, 'r', encoding='utf-8') as f:
-            questions_data = json.load(f)
-        
-        self.stats['total_questions'] = len(questions_data)
-        print(f"📖 読み込み完了: {self.stats['total_questions']}問")
-        
-        anki_cards = []
-        
-        for i, question_data in enumerate(questions_data):
-            if not question_data.get('parsed', False):
-                self.stats['skipped_incomplete'] += 1
-                continue
-            
-            try:
-                card = self.create_improved_anki_card(question_data, i + 1)
-                anki_cards.append(card)
-                
-                if card['quality_score'] < 3:
-                    self.stats['manual_review_needed'] += 1
+        tsv_file = self.output_dir / 'cc_anki_improved.tsv'
+        json_file = self.output_dir / 'cc_anki_improved.json'
+        # 正解を特定できなかったカード（デッキには入れず、確認用に別ファイルへ）
+        review_tsv_file = self.output_dir / 'cc_anki_improved_review.tsv'
+        review_json_file = self.output_dir / 'cc_anki_improved_review.json'
+        summary = DeckSummary()
+        
+        # OCR結果を1件ずつ読み込み、カードを1行ずつ書き出す
+        with CardStreamWriter(tsv_file, self.TSV_HEADERS, json_file) as writer, \
+                CardStreamWriter(review_tsv_file, self.TSV_HEADERS, review_json_file) as review_writer:
+            for i, question_data in enumerate(iter_question_records(self.input_file)):
+                self.stats['total_questions'] += 1
                 
-                self.stats['converted_cards'] += 1
+                if not question_data.get('parsed', False):
+                    self.stats['skipped_incomplete'] += 1
+                    continue
                 
-                if (i + 1) % 25 == 0:
-                    print(f"⚡ 処理済み: {i + 1}/{self.stats['total_questions']}")
+                try:
+                    card = self.create_improved_anki_card(question_data, i + 1)
+                    if (i + 1) % 25 == 0:
+                        print(f"⚡ 処理済み: {i + 1}")
+                    
+                    if not card['correct_letter']:
+                        review_writer.write(card, self.tsv_row(card))
+                        self.stats['answer_unmatched'] += 1
+                        summary.flag('unmatched', card, question=card['question'][:50])
+                        continue
                     
-            except Exception as e:
-                print(f"❌ エラー [{question_data.get('filename', 'Unknown')}]: {e}")
-                self.stats['skipped_incomplete'] += 1
+                    writer.write(card, self.tsv_row(card))
+                    summary.add(card)
+                    
+                    if card['quality_score'] < 3:
+                        summary.flag('low_quality', card, question=card['question'][:50])
+                    if card['quality_score'] < 3 or card['answer_review']:
+                        self.stats['manual_review_needed'] += 1
+                    if card['answer_review']:
+                        self.stats['answer_review_needed'] += 1
+                        summary.flag('answer_review', card, answer_confidence=card['answer_confidence'])
+                    
+                    self.stats['converted_cards'] += 1
+                        
+                except Exception as e:
+                    print(f"❌ エラー [{question_data.get('filename', 'Unknown')}]: {e}")
+                    self.stats['skipped_incomplete'] += 1
         
-        # ファイル生成
-        self.save_outputs(anki_cards)
-    
-    def save_outputs(self, cards: List[Dict]):
-        """
-        出力ファイル保存
-        """
-        # TSVファイル
-        tsv_content = self.generate_improved_tsv(cards)
-        tsv_file = self.output_dir / 'cc_anki_improved.tsv'
-        with open(tsv_file, 'w', encoding='utf-8') as f:
-            f.write(tsv_content)
+        print(f"📖 読み込み完了: {self.stats['total_questions']}問")
         
         # 学習ガイド
-        guide_content = self.generate_study_guide(cards)
+        guide_content = self.generate_study_guide(summary)
         guide_file = self.output_dir / 'study_guide.md'
         with open(guide_file, 'w', encoding='utf-8') as f:
             f.write(guide_content)
         
-        # JSON詳細データ
-        json_file = self.output_dir / 'cc_anki_improved.json'
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(cards, f, ensure_ascii=False, indent=2)
-        
         # 結果サマリー
-        self.print_results(tsv_file, guide_file, cards)
+        self.print_results(tsv_file, guide_file, summary, review_tsv_file)
     
-    def print_results(self, tsv_file: Path, guide_file: Path, cards: List[Dict]):
+    def print_results(self, tsv_file: Path, guide_file: Path, summary: DeckSummary, review_tsv_file: Path):
         """
         結果表示
         """
-        high_quality = len([c for c in cards if c['quality_score'] >= 5])
+        high_quality = summary.quality_at_least(5)
         
         print("\n🎉 改良版Ankiデッキ生成完了!")
         print("=" * 60)
         print(f"📊 総問題数: {self.stats['total_questions']}")
         print(f"✅ 変換成功: {self.stats['converted_cards']}")
         print(f"⚠️  手動確認推奨: {self.stats['manual_review_needed']}")
+        print(f"❓ 正解の照合が低信頼度: {self.stats['answer_review_needed']} (タグ NeedsReview)")
+        print(f"🚫 正解を特定できず除外: {self.stats['answer_unmatched']} ({review_tsv_file.name})")
         print(f"🏆 高品質カード: {high_quality}")
         print(f"📈 全体成功率: {(self.stats['converted_cards']/self.stats['total_questions']*100):.1f}%")
         
@@ -378,6 +288,7 @@ CCの主要トピック:
         print(f"1. 📋 {tsv_file.name} - Ankiインポート用")
         print(f"2. 📖 {guide_file.name} - 学習ガイド")
         print(f"3. 🔍 cc_anki_improved.json - 詳細データ")
+        print(f"4. 🚫 {review_tsv_file.name} - 正解の確認が必要なカード（インポート対象外）")
         
         print(f"\n🚀 次のステップ:")
         print(f"1. study_guide.md で学習戦略を確認")
@@ -387,7 +298,7 @@ CCの主要トピック:
 
 def main():
     project_dir = Path(__file__).parent.parent
-    input_file = project_dir / 'output' / 'cc_questions_final.json'
+    input_file = resolve_input_file(project_dir / 'output' / 'cc_questions_final.json')
     output_dir = project_dir / 'output' / 'anki'
     
     if not input_file.exists():
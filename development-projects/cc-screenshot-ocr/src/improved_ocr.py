@@ -6,146 +6,11 @@
 import os
 import sys
 from pathlib import Path
-import pytesseract
-from PIL import Image
 import json
-import re
 from typing import Dict, List
 
-
-def extract_question_data_improved(text: str, filename: str) -> Dict:
-    """
-    改良版の問題データ抽出（より柔軟）
-    """
-    result = {
-        'filename': filename,
-        'raw_text': text,
-        'question': '',
-        'choices': [],
-        'correct_answer': '',
-        'explanation': '',
-        'attempt_info': '',
-        'parsed': False
-    }
-    
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    
-    # 改良された問題文検出
-    question_candidates = []
-    for i, line in enumerate(lines):
-        # 問題文の特徴を広く捉える
-        if any(starter in line for starter in ['What', 'Which', 'How', 'Where', 'When', 'Why', 'Of the following']):
-            # 問題文として適切な長さかチェック
-            if 10 <= len(line) <= 200:
-                question_candidates.append(line)
-        
-        # "?"で終わる行も問題文候補
-        if line.endswith('?') and len(line) > 15:
-            question_candidates.append(line)
-    
-    # 最も適切な問題文を選択
-    if question_candidates:
-        # 最も長い（詳細な）問題文を選択
-        result['question'] = max(question_candidates, key=len)
-    
-    # 改良された選択肢検出
-    choice_candidates = []
-    
-    for line in lines:
-        # 様々な選択肢パターンを検出
-        patterns = [
-            r'^[A-D]\)',          # A), B), C), D)
-            r'^[A-D]\.',          # A. B. C. D.
-            r'^[A-D][\s:]',       # A: B: C: D:
-            r'^\d+\)',            # 1), 2), 3), 4)
-            r'^\d+\.',            # 1. 2. 3. 4.
-        ]
-        
-        choice_match = False
-        for pattern in patterns:
-            if re.match(pattern, line):
-                choice_match = True
-                break
-        
-        # パターンマッチしなくても、選択肢らしい行を検出
-        if not choice_match:
-            # 適度な長さで、明らかに選択肢でない文字列を除外
-            if (5 <= len(line) <= 100 and 
-                not any(exclude in line.lower() for exclude in [
-                    'progress', 'accuracy', 'answers', 'cyder', 'chess', 'usage', 
-                    'isc2', 'obrizum', 'google', 'anki', 'attempt taken',
-                    'correct', 'score', 'seconds', 'explanation'
-                ]) and
-                not line.startswith('http') and
-                not line.startswith('@') and
-                not '?' in line):
-                
-                # 大文字で始まる、または技術用語らしい行
-                if (line[0].isupper() or 
-                    any(tech in line.lower() for tech in [
-                        'access', 'control', 'security', 'data', 'system', 
-                        'network', 'password', 'encryption', 'firewall',
-                        'malware', 'virus', 'threat', 'risk', 'asset',
-                        'policy', 'procedure', 'authentication', 'authorization'
-                    ])):
-                    choice_candidates.append(line)
-    
-    # 重複除去と選択肢として適切なものを選択
-    seen = set()
-    unique_choices = []
-    for choice in choice_candidates:
-        # 類似した選択肢を除外
-        choice_clean = re.sub(r'^[A-D\d\)\.\:\s]+', '', choice).strip()
-        if choice_clean and choice_clean not in seen and len(choice_clean) > 2:
-            seen.add(choice_clean)
-            unique_choices.append(choice)
-    
-    result['choices'] = unique_choices[:6]  # 最大6個
-    
-    # 改良された正解検出
-    for i, line in enumerate(lines):
-        if 'correct answer' in line.lower():
-            # 周辺の行から正解を探す
-            for j in range(max(0, i-2), min(len(lines), i+4)):
-                candidate = lines[j].strip()
-                if candidate and len(candidate) < 50 and candidate not in ['Explanation', 'Correct Answers']:
-                    result['correct_answer'] = candidate
-                    break
-    
-    # 解説検出
-    explanation_lines = []
-    in_explanation = False
-    
-    for line in lines:
-        if line.lower().startswith('explanation'):
-            in_explanation = True
-            continue
-        
-        if in_explanation:
-            # 解説らしい行のみ追加
-            if (len(line) > 10 and 
-                not line.startswith('Which') and 
-                not line.startswith('What') and
-                not line.startswith('How')):
-                explanation_lines.append(line)
-            
-            # 次の問題が始まったら解説終了
-            if any(starter in line for starter in ['What', 'Which', 'How']):
-                break
-    
-    result['explanation'] = ' '.join(explanation_lines[:3])  # 最初の3行のみ
-    
-    # attempt taken情報
-    for line in lines:
-        if 'attempt taken' in line.lower():
-            result['attempt_info'] = line
-            break
-    
-    # パース成功判定（より寛容に）
-    if result['question'] and len(result['choices']) >= 1:
-        result['parsed'] = True
-    
-    return result
+from ocr_cache import image_to_string_cached, print_cache_stats
+from question_parser import parse_question_text
 
 
 def reprocess_failed_files():
@@ -161,40 +26,41 @@ def reprocess_failed_files():
     with open(results_file, 'r', encoding='utf-8') as f:
         existing_results = json.load(f)
     
-    # 失敗したファイル名を取得
-    failed_filenames = [r['filename'] for r in existing_results if not r.get('parsed', False)]
+    # 失敗したファイルを取得
+    failed_results = [r for r in existing_results if not r.get('parsed', False)]
     
-    print(f"再処理対象: {len(failed_filenames)}個のファイル")
+    print(f"再処理対象: {len(failed_results)}個のファイル")
     
-    # 失敗したファイルのみ再処理
-    improved_results = []
+    # 失敗したファイルのみ再処理（OCR済みテキストがあれば再OCRしない）
+    improved_results = {}
     success_count = 0
     
-    for filename in failed_filenames:
+    for failed in failed_results:
+        filename = failed['filename']
         print(f"再処理中: {filename}")
         
         try:
-            image_path = input_dir / filename
-            image = Image.open(image_path)
-            text = pytesseract.image_to_string(image)
+            text = failed.get('raw_text')
+            if not text:
+                text = image_to_string_cached(input_dir / filename)
             
-            # 改良版アルゴリズムで再処理
-            question_data = extract_question_data_improved(text, filename)
-            improved_results.append(question_data)
+            # 統合パーサーで再解析
+            question_data = parse_question_text(text, filename)
+            improved_results[filename] = question_data
             
             if question_data['parsed']:
                 success_count += 1
-                print(f"  ✓ 再処理成功")
+                print(f"  ✓ 再処理成功 (信頼度 {question_data['confidence']:.2f})")
             else:
-                print(f"  - 再処理失敗")
+                print(f"  - 再処理失敗 (信頼度 {question_data['confidence']:.2f})")
                 
         except Exception as e:
             print(f"  ✗ エラー: {e}")
-            improved_results.append({
+            improved_results[filename] = {
                 'filename': filename,
                 'error': str(e),
                 'parsed': False
-            })
+            }
     
     # 既存の成功結果と改良結果をマージ
     final_results = []
@@ -204,9 +70,8 @@ def reprocess_failed_files():
             # 成功していたものはそのまま
             final_results.append(existing)
         else:
-            # 失敗していたものは改良版で置き換え
-            improved = next((r for r in improved_results if r['filename'] == existing['filename']), existing)
-            final_results.append(improved)
+            # 失敗していたものは再解析結果で置き換え
+            final_results.append(improved_results.get(existing['filename'], existing))
     
     # 結果を保存
     with open(output_dir / 'cc_questions_improved.json', 'w', encoding='utf-8') as f:
@@ -223,6 +88,7 @@ def reprocess_failed_files():
     print(f"構造化成功: {total_parsed}")
     print(f"改良前失敗→成功: {success_count}")
     print(f"最終成功率: {(total_parsed/len(final_results)*100):.1f}%")
+    print_cache_stats()
     
     return final_results
 
@@ -8,6 +8,39 @@ import os
 import csv
 from datetime import datetime
 
+class ManualCard:
+    """
+    手動作成カード1枚分
+    元データ（状況・問題文・選択肢・正解・解説）だけを保持し、表面・裏面・Cloze文は参照時に組み立てる
+    """
+    __slots__ = ('question_number', 'situation', 'question', 'choices', 'correct_answer', 'explanation')
+
+    def __init__(self, question_number, situation, question, choices, correct_answer, explanation):
+        self.question_number = question_number
+        self.situation = situation
+        self.question = question
+        self.choices = tuple(choices)
+        self.correct_answer = correct_answer
+        self.explanation = explanation
+
+    @property
+    def front(self):
+        # 選択肢をフォーマット
+        choices_text = ""
+        for choice in self.choices:
+            marker = "✓" if choice == self.correct_answer else "◯"
+            choices_text += f"{marker} {choice}\n"
+        return f"Q{self.question_number}: {self.situation}\n\n{self.question}\n\n{choices_text}"
+
+    @property
+    def back(self):
+        return f"正解: {self.correct_answer}\n\n解説: {self.explanation}"
+
+    @property
+    def cloze(self):
+        return (f"Q{self.question_number}: {self.situation}\n\n{self.question}\n\n"
+                f"正解: {{c1::{self.correct_answer}}}\n\n解説: {self.explanation}")
+
 class ManualAnkiCardGenerator:
     def __init__(self):
         self.cards = []
@@ -18,29 +51,7 @@ class ManualAnkiCardGenerator:
         """
         手動でAnkiカードを追加
         """
-        # Cloze形式での質問文作成
-        cloze_question = f"{situation}\n\n{question}"
-        
-        # 選択肢をフォーマット
-        choices_text = ""
-        for i, choice in enumerate(choices, 1):
-            marker = "✓" if choice == correct_answer else "◯"
-            choices_text += f"{marker} {choice}\n"
-        
-        # Ankiカード作成
-        card = {
-            'question_number': question_number,
-            'front': f"Q{question_number}: {cloze_question}\n\n{choices_text}",
-            'back': f"正解: {correct_answer}\n\n解説: {explanation}",
-            'cloze': f"Q{question_number}: {situation}\n\n{question}\n\n正解: {{c1::{correct_answer}}}\n\n解説: {explanation}",
-            'raw_data': {
-                'situation': situation,
-                'question': question,
-                'choices': choices,
-                'correct_answer': correct_answer,
-                'explanation': explanation
-            }
-        }
+        card = ManualCard(question_number, situation, question, choices, correct_answer, explanation)
         
         self.cards.append(card)
         print(f"カード{question_number}追加完了")
@@ -61,7 +72,7 @@ class ManualAnkiCardGenerator:
             # カードデータ
             for card in self.cards:
                 writer.writerow([
-                    card['cloze'],
+                    card.cloze,
                     '',  # Cloze形式では空白
                     'cc-practice security-plus'
                 ])
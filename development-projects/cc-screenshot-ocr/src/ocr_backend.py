@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+OCRエンジンのバックエンド
+- PytesseractBackend: 従来通り1枚ごとに tesseract プロセスを起動
+- TesserocrBackend: libtesseract のAPIインスタンスを常駐させて再利用（要 tesserocr）
+どちらも image_to_string(image, config) で同じように呼び出せる
+"""
+
+import queue
+import shlex
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+
+BACKEND_NAMES = ('auto', 'tesserocr', 'pytesseract')
+
+
+def parse_tesseract_config(config: str) -> Tuple[Optional[int], Optional[int], List[Tuple[str, str]]]:
+    """
+    tesseractのコマンドライン設定を (psm, oem, [(変数, 値)]) に分解
+    pytesseract と同じく shlex で分割する
+    """
+    psm = None
+    oem = None
+    variables = []
+
+    args = shlex.split(config)
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == '--psm':
+            psm = int(args[i + 1])
+            i += 2
+        elif arg == '--oem':
+            oem = int(args[i + 1])
+            i += 2
+        elif arg == '-c':
+            name, value = args[i + 1].split('=', 1)
+            variables.append((name, value))
+            i += 2
+        elif arg.startswith('-c') and '=' in arg:
+            name, value = arg[2:].split('=', 1)
+            variables.append((name, value))
+            i += 1
+        else:
+            raise ValueError(f"未対応のtesseract設定です: {arg}")
+
+    return psm, oem, variables
+
+
+class OCRBackend:
+    """
+    OCRバックエンドの共通インターフェース
+    """
+    name = 'base'
+
+    def image_to_string(self, image, config: str = '') -> str:
+        """
+        画像（PIL.Image または NumPy配列）からテキストを抽出
+        """
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class PytesseractBackend(OCRBackend):
+    """
+    pytesseract経由（呼び出しごとにプロセス起動と一時ファイル書き出し）
+    """
+    name = 'pytesseract'
+
+    def __init__(self, lang: str = 'eng'):
+        import pytesseract
+        self._pytesseract = pytesseract
+        self.lang = lang
+
+    def image_to_string(self, image, config: str = '') -> str:
+        return self._pytesseract.image_to_string(image, lang=self.lang, config=config)
+
+
+class TesserocrBackend(OCRBackend):
+    """
+    常駐エンジンのプール
+    設定文字列ごとに初期化済みのAPIインスタンスを保持し、スレッド間で貸し出す
+    """
+    name = 'tesserocr'
+
+    # tesseract CLIのテキスト出力はページ末尾に改ページ文字を付けるため揃える
+    PAGE_SEPARATOR = '\f'
+
+    def __init__(self, lang: str = 'eng', pool_size: int = 1, tessdata_path: Optional[str] = None):
+        import tesserocr
+        self._tesserocr = tesserocr
+        self.lang = lang
+        self.pool_size = pool_size
+        self.tessdata_path = tessdata_path
+
+        # 設定文字列 → 空きエンジンのキュー
+        self._pools: Dict[str, queue.Queue] = {}
+        self._created: Dict[str, int] = {}
+        self._engines = []
+        self._lock = threading.Lock()
+
+        # 言語データが見つからない場合はここで失敗させる
+        self._created[''] = 1
+        self._release('', self._create_engine(''))
+
+    def _create_engine(self, config: str):
+        psm, oem, variables = parse_tesseract_config(config)
+
+        kwargs = {'lang': self.lang}
+        if self.tessdata_path:
+            kwargs['path'] = self.tessdata_path
+        if oem is not None:
+            kwargs['oem'] = oem
+        if psm is not None:
+            kwargs['psm'] = psm
+        if variables:
+            kwargs['variables'] = dict(variables)
+
+        engine = self._tesserocr.PyTessBaseAPI(**kwargs)
+        with self._lock:
+            self._engines.append(engine)
+        return engine
+
+    def _release(self, config: str, engine):
+        with self._lock:
+            pool = self._pools.setdefault(config, queue.Queue())
+        pool.put(engine)
+
+    @contextmanager
+    def _acquire(self, config: str):
+        """
+        空きエンジンを借りる（上限未満なら新規作成、上限なら返却待ち）
+        """
+        with self._lock:
+            pool = self._pools.setdefault(config, queue.Queue())
+            can_create = pool.empty() and self._created.get(config, 0) < self.pool_size
+            if can_create:
+                # 作成中の分も上限に数える
+                self._created[config] = self._created.get(config, 0) + 1
+
+        if can_create:
+            try:
+                engine = self._create_engine(config)
+            except Exception:
+                with self._lock:
+                    self._created[config] -= 1
+                raise
+        else:
+            engine = pool.get()
+
+        try:
+            yield engine
+        finally:
+            pool.put(engine)
+
+    def image_to_string(self, image, config: str = '') -> str:
+        from PIL import Image
+
+        if not isinstance(image, Image.Image):
+            image = Image.fromarray(image)
+
+        with self._acquire(config) as engine:
+            engine.SetImage(image)
+            text = engine.GetUTF8Text()
+            engine.Clear()
+
+        return text + self.PAGE_SEPARATOR
+
+    def close(self):
+        with self._lock:
+            engines, self._engines = self._engines, []
+            self._pools = {}
+            self._created = {}
+        for engine in engines:
+            engine.End()
+
+
+def get_backend(name: str = 'auto', lang: str = 'eng', pool_size: int = 1) -> OCRBackend:
+    """
+    バックエンドを作成（auto: tesserocr が使えれば常駐エンジン、無ければpytesseract）
+    """
+    if name == 'tesserocr':
+        return TesserocrBackend(lang=lang, pool_size=pool_size)
+    if name == 'pytesseract':
+        return PytesseractBackend(lang=lang)
+    if name != 'auto':
+        raise ValueError(f"不明なOCRバックエンドです: {name}")
+
+    try:
+        return TesserocrBackend(lang=lang, pool_size=pool_size)
+    except (ImportError, RuntimeError):
+        return PytesseractBackend(lang=lang)
+
+
+_default_backend: Optional[OCRBackend] = None
+
+
+def get_default_backend() -> OCRBackend:
+    """
+    プロセス共通のバックエンド
+    """
+    global _default_backend
+    if _default_backend is None:
+        _default_backend = get_backend()
+    return _default_backend
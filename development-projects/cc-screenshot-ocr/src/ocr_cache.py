@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+OCR結果キャッシュ（コンテンツアドレス方式）
+画像バイト列 + 前処理パラメータ + tesseract設定 のSHA-256をキーに、
+Tesseractの生テキストをディスクに保存する（サイズ上限付きLRU）
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / 'output' / 'ocr_cache'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# PIL画像をそのままTesseractに渡す場合の前処理識別子
+PREPROCESS_NONE = 'pil-raw'
+
+
+class OCRCache:
+    """
+    OCRテキストのディスクキャッシュ
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0
+        }
+
+        # キー → サイズ（先頭ほど古い = LRU順）
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self.total_bytes = 0
+        self._scan()
+
+    def _scan(self):
+        """
+        既存キャッシュを最終アクセス時刻順に索引化
+        """
+        files = []
+        for path in self.cache_dir.glob('*/*.txt'):
+            stat = path.stat()
+            files.append((stat.st_mtime, path.stem, stat.st_size))
+
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+            self.total_bytes += size
+
+    @staticmethod
+    def make_key(image_bytes: bytes, preprocess: str, config: str) -> str:
+        """
+        キャッシュキー生成
+        """
+        digest = hashlib.sha256(image_bytes)
+        digest.update(b'\0' + preprocess.encode('utf-8'))
+        digest.update(b'\0' + config.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.txt"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        キャッシュ参照（ヒット時はLRU順を更新）
+        """
+        path = self._path(key)
+        try:
+            text = path.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            # 他プロセスに削除された場合も含めミス扱い
+            if key in self._entries:
+                self.total_bytes -= self._entries.pop(key)
+            return None
+
+        os.utime(path)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        return text
+
+    def put(self, key: str, text: str):
+        """
+        キャッシュ書き込み（一時ファイル経由）と上限超過分の削除
+        """
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(text, encoding='utf-8')
+        os.replace(tmp_path, path)
+
+        size = path.stat().st_size
+        if key in self._entries:
+            self.total_bytes -= self._entries.pop(key)
+        self._entries[key] = size
+        self.total_bytes += size
+
+        self._evict()
+
+    def _evict(self):
+        """
+        上限を超えた分を古い順に削除
+        """
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self.total_bytes -= size
+            self.stats['evictions'] += 1
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+
+    def get_or_compute(self, image_path: str, compute: Callable[[], str],
+                       preprocess: str, config: str = '') -> str:
+        """
+        キャッシュがあれば返し、無ければ compute() でOCRして保存
+        """
+        with open(image_path, 'rb') as f:
+            key = self.make_key(f.read(), preprocess, config)
+
+        text = self.get(key)
+        if text is not None:
+            self.stats['hits'] += 1
+            return text
+
+        self.stats['misses'] += 1
+        text = compute()
+        self.put(key, text)
+        return text
+
+
+_default_cache: Optional[OCRCache] = None
+
+
+def get_default_cache() -> OCRCache:
+    """
+    プロジェクト共通のキャッシュ（output/ocr_cache）
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = OCRCache()
+    return _default_cache
+
+
+def image_to_string_cached(image_path, cache: OCRCache = None, config: str = '',
+                           backend=None) -> str:
+    """
+    pytesseract.image_to_string(Image.open(image_path)) のキャッシュ付き版
+    OCRは既定のバックエンド（常駐エンジンがあればそれ）で実行
+    """
+    from PIL import Image
+    from ocr_backend import get_default_backend
+
+    cache = cache or get_default_cache()
+    backend = backend or get_default_backend()
+    return cache.get_or_compute(
+        str(image_path),
+        lambda: backend.image_to_string(Image.open(image_path), config=config),
+        PREPROCESS_NONE,
+        config
+    )
+
+
+def print_cache_stats(cache: OCRCache = None):
+    """
+    キャッシュ統計を表示
+    """
+    cache = cache or get_default_cache()
+    stats: Dict[str, int] = cache.stats
+    print(f"OCRキャッシュ: ヒット {stats['hits']} / ミス {stats['misses']} / 削除 {stats['evictions']}"
+          f" ({cache.total_bytes / 1024:.1f} KB)")
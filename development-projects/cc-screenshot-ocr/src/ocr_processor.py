@@ -3,16 +3,44 @@
 ISC2 CC練習問題スクリーンショット OCR処理スクリプト
 """
 
-import os
 import sys
 import cv2
 import numpy as np
-from PIL import Image, ImageEnhance
-import pytesseract
-import re
 from pathlib import Path
 import json
-from typing import Dict, List, Optional
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+from ocr_backend import BACKEND_NAMES, get_backend
+from ocr_cache import OCRCache
+from preprocess_pipeline import PreprocessPipeline
+from question_parser import correct_choice_letter, parse_question_text
+from roi_detector import ROIDetector
+from text_normalizer import normalize_ocr_text
+
+
+# ワーカープロセスごとのOCRインスタンス
+_worker_ocr = None
+
+
+def _init_ocr_worker(input_dir: str, output_dir: str, use_cache: bool = True, use_roi: bool = False,
+                     backend: str = 'auto'):
+    """
+    ワーカープロセス初期化（OCRエンジンはワーカーごとに常駐）
+    """
+    global _worker_ocr
+    _worker_ocr = CCScreenshotOCR(input_dir, output_dir, use_cache=use_cache, use_roi=use_roi, backend=backend)
+
+
+def _ocr_worker_process(image_path: Path) -> Tuple[bool, Dict]:
+    """
+    ワーカープロセスで1ファイルを処理（例外はファイル単位で隔離）
+    """
+    try:
+        return True, _worker_ocr.process_single_file(image_path)
+    except Exception as e:
+        return False, {'filename': image_path.name, 'error': str(e)}
 
 
 class CCScreenshotOCR:
@@ -20,14 +48,30 @@ class CCScreenshotOCR:
     ISC2 CC練習問題スクリーンショットのOCR処理クラス
     """
     
-    def __init__(self, input_dir: str, output_dir: str):
+    def __init__(self, input_dir: str, output_dir: str, use_cache: bool = True, use_roi: bool = False,
+                 backend: str = 'auto'):
         self.input_dir = Path(input_dir)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
+        # OCRエンジン（auto: tesserocr があれば常駐エンジン、無ければpytesseract）
+        self.ocr_backend = get_backend(backend)
+        
         # OCR設定
         self.tesseract_config = '--psm 6 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789.,;:?!()[]{}"-\' \n'
         
+        # 前処理パイプライン（バッファとCLAHEを呼び出し間で再利用）
+        self.preprocess_pipeline = PreprocessPipeline(clip_limit=2.0, tile_grid_size=(8, 8), median_ksize=3)
+        
+        # 問題パネルのみをOCRする場合のROI検出（プロファイルは output/roi_profiles.json）
+        self.roi_detector = ROIDetector(self.output_dir / 'roi_profiles.json') if use_roi else None
+        
+        # 前処理パラメータ（キャッシュキーの一部）
+        self.preprocess_signature = self.preprocess_pipeline.signature + ('|roi' if use_roi else '')
+        
+        # OCR結果キャッシュ（同じ画像・設定ならTesseractを再実行しない）
+        self.ocr_cache = OCRCache(self.output_dir / 'ocr_cache') if use_cache else None
+        
         # 処理統計
         self.stats = {
             'total_files': 0,
@@ -45,31 +89,34 @@ class CCScreenshotOCR:
         if image is None:
             raise ValueError(f"画像を読み込めません: {image_path}")
         
-        # グレースケール変換
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        
-        # ノイズ除去
-        denoised = cv2.medianBlur(gray, 3)
-        
-        # コントラスト調整
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
-        enhanced = clahe.apply(denoised)
-        
-        # 二値化
-        _, binary = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-        
-        return binary
+        # グレースケール → ノイズ除去 → コントラスト調整 → 二値化
+        # パイプラインのバッファは次の呼び出しで上書きされるためコピーを返す
+        return self.preprocess_pipeline.process(image).copy()
+    
+    def preprocess_batch(self, image_paths: List[str]) -> np.ndarray:
+        """
+        同サイズの画像群をまとめて前処理し (N, H, W) を返す
+        戻り値はパイプラインのバッファ（次の呼び出しまで有効）
+        """
+        return self.preprocess_pipeline.process_paths(image_paths)
     
     def extract_text(self, image_path: str) -> str:
         """
         画像からテキストを抽出
         """
         try:
-            # 前処理
-            processed_image = self.preprocess_image(image_path)
+            # 前処理 + OCR実行
+            def run_ocr() -> str:
+                processed_image = self.preprocess_image(image_path)
+                if self.roi_detector is not None:
+                    processed_image = self.roi_detector.crop(processed_image)
+                return self.ocr_backend.image_to_string(processed_image, config=self.tesseract_config)
             
-            # OCR実行
-            text = pytesseract.image_to_string(processed_image, config=self.tesseract_config)
+            if self.ocr_cache is not None:
+                text = self.ocr_cache.get_or_compute(image_path, run_ocr,
+                                                     self.preprocess_signature, self.tesseract_config)
+            else:
+                text = run_ocr()
             
             # テキストクリーニング
             cleaned_text = self.clean_text(text)
@@ -84,112 +131,28 @@ class CCScreenshotOCR:
         """
         OCRで抽出したテキストのクリーニング
         """
-        # 改行を統一
-        text = re.sub(r'\r\n', '\n', text)
-        text = re.sub(r'\r', '\n', text)
-        
-        # 余分な空白を削除
-        text = re.sub(r' +', ' ', text)
-        text = re.sub(r'\n +', '\n', text)
-        text = re.sub(r' +\n', '\n', text)
-        
-        # 連続する改行を削除
-        text = re.sub(r'\n\n+', '\n\n', text)
-        
-        # 先頭末尾の空白を削除
-        text = text.strip()
-        
-        return text
+        # 改行の統一・余分な空白と連続改行の削除（1回の走査）
+        return normalize_ocr_text(text)
     
     def parse_question(self, text: str, filename: str) -> Dict:
         """
-        OCRテキストから問題構造を解析
+        OCRテキストから問題構造を解析（統合パーサー）
         """
+        parsed = parse_question_text(text, filename)
+        
         question_data = {
             'filename': filename,
             'raw_text': text,
-            'question': '',
-            'choices': [],
-            'correct_answer': '',
-            'explanation': '',
-            'score': '',
-            'parsed_successfully': False
+            'question': parsed['question'],
+            'choices': parsed['choice_details'],
+            'correct_answer': correct_choice_letter(parsed) or '',
+            'explanation': parsed['explanation'],
+            'score': parsed['score'],
+            'confidence': parsed['confidence'],
+            'parsed_successfully': parsed['parsed']
         }
         
-        # スコア情報を抽出
-        score_match = re.search(r'Score\s*(\d+)', text)
-        if score_match:
-            question_data['score'] = score_match.group(1)
-        
-        # 正解マーク（チェック）を検出
-        correct_mark_pattern = r'[✓✔☑]'
-        
-        # 選択肢パターンを検出
-        choice_patterns = [
-            r'([A-D])[):.]?\s*([^\n]+)',  # A) content, A. content, A: content
-            r'([A-D])\s+([^\n]+)',       # A content
-        ]
-        
-        lines = text.split('\n')
-        question_lines = []
-        choices = []
-        explanation_lines = []
-        
-        in_explanation = False
-        found_choices = False
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # 説明セクションの開始を検出
-            if 'explanation' in line.lower() or 'correct answer' in line.lower():
-                in_explanation = True
-                continue
-            
-            # 選択肢を検出
-            choice_found = False
-            for pattern in choice_patterns:
-                match = re.match(pattern, line)
-                if match:
-                    choice_letter = match.group(1)
-                    choice_text = match.group(2).strip()
-                    
-                    # 正解かどうかを判定
-                    is_correct = bool(re.search(correct_mark_pattern, line))
-                    
-                    choices.append({
-                        'letter': choice_letter,
-                        'text': choice_text,
-                        'is_correct': is_correct
-                    })
-                    
-                    if is_correct:
-                        question_data['correct_answer'] = choice_letter
-                    
-                    choice_found = True
-                    found_choices = True
-                    break
-            
-            if choice_found:
-                continue
-            
-            # 説明部分
-            if in_explanation:
-                explanation_lines.append(line)
-            elif not found_choices:
-                # 問題文
-                question_lines.append(line)
-        
-        # データを整理
-        question_data['question'] = ' '.join(question_lines).strip()
-        question_data['choices'] = choices
-        question_data['explanation'] = ' '.join(explanation_lines).strip()
-        
-        # パース成功判定
-        if question_data['question'] and len(choices) >= 2:
-            question_data['parsed_successfully'] = True
+        if question_data['parsed_successfully']:
             self.stats['questions_found'] += 1
         
         return question_data
@@ -211,9 +174,10 @@ class CCScreenshotOCR:
         
         return question_data
     
-    def process_all_screenshots(self):
+    def process_all_screenshots(self, workers: int = 1):
         """
         全スクリーンショットの処理
+        workers > 1 の場合はマルチプロセスでOCR（結果はファイル名順）
         """
         print("CC練習問題スクリーンショット OCR処理を開始します...")
         
@@ -232,30 +196,59 @@ class CCScreenshotOCR:
         # 処理結果を保存するリスト
         all_results = []
         
-        # 各ファイルを処理
-        for image_path in image_files:
-            try:
-                result = self.process_single_file(image_path)
-                all_results.append(result)
-                self.stats['processed'] += 1
-                
-                # 進捗表示
-                progress = (self.stats['processed'] / self.stats['total_files']) * 100
-                print(f"進捗: {progress:.1f}% ({self.stats['processed']}/{self.stats['total_files']})")
-                
-            except Exception as e:
-                print(f"エラー [{image_path.name}]: {e}")
-                self.stats['errors'] += 1
-                all_results.append({
-                    'filename': image_path.name,
-                    'error': str(e)
-                })
+        if workers > 1:
+            print(f"並列OCR: {workers}プロセス")
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_ocr_worker,
+                                     initargs=(str(self.input_dir), str(self.output_dir),
+                                               self.ocr_cache is not None,
+                                               self.roi_detector is not None,
+                                               self.ocr_backend.name)) as executor:
+                # executor.map は投入順（ファイル名順）に結果を返す
+                for image_path, (ok, result) in zip(image_files, executor.map(_ocr_worker_process, image_files)):
+                    if ok:
+                        # 解析成功数はワーカー側の統計に入るため、ここで集計
+                        if result.get('parsed_successfully'):
+                            self.stats['questions_found'] += 1
+                        self._record_result(all_results, result)
+                    else:
+                        self._record_error(all_results, image_path, result['error'])
+        else:
+            # 各ファイルを処理
+            for image_path in image_files:
+                try:
+                    result = self.process_single_file(image_path)
+                    self._record_result(all_results, result)
+                    
+                except Exception as e:
+                    self._record_error(all_results, image_path, str(e))
         
         # 結果を保存
         self.save_results(all_results)
         self.save_structured_text(all_results)
         self.print_summary()
     
+    def _record_result(self, all_results: List[Dict], result: Dict):
+        """
+        処理成功時の集計と進捗表示
+        """
+        all_results.append(result)
+        self.stats['processed'] += 1
+        
+        # 進捗表示
+        progress = (self.stats['processed'] / self.stats['total_files']) * 100
+        print(f"進捗: {progress:.1f}% ({self.stats['processed']}/{self.stats['total_files']})")
+    
+    def _record_error(self, all_results: List[Dict], image_path: Path, error: str):
+        """
+        処理エラー時の集計
+        """
+        print(f"エラー [{image_path.name}]: {error}")
+        self.stats['errors'] += 1
+        all_results.append({
+            'filename': image_path.name,
+            'error': error
+        })
+    
     def save_results(self, results: List[Dict]):
         """
         処理結果をJSONファイルに保存
@@ -309,16 +302,33 @@ class CCScreenshotOCR:
         print("\n処理完了サマリー:")
         print("-" * 30)
         print(f"総ファイル数: {self.stats['total_files']}")
+        print(f"OCRエンジン: {self.ocr_backend.name}")
         print(f"処理成功: {self.stats['processed']}")
         print(f"エラー: {self.stats['errors']}")
         print(f"問題として解析成功: {self.stats['questions_found']}")
         print(f"成功率: {(self.stats['processed'] / self.stats['total_files'] * 100):.1f}%")
+        # 並列モードではワーカー側のキャッシュ統計のため表示しない
+        if self.ocr_cache is not None and (self.ocr_cache.stats['hits'] or self.ocr_cache.stats['misses']):
+            cache_stats = self.ocr_cache.stats
+            print(f"OCRキャッシュ: ヒット {cache_stats['hits']} / ミス {cache_stats['misses']}")
+        if self.roi_detector is not None:
+            roi_stats = self.roi_detector.stats
+            print(f"ROI: プロファイル使用 {roi_stats['profile_hits']} / レイアウト検出 {roi_stats['detections']}")
+        if self.preprocess_pipeline.images_processed:
+            print(self.preprocess_pipeline.timing_report())
 
 
 def main():
     """
     メイン実行関数
     """
+    parser = argparse.ArgumentParser(description="ISC2 CC練習問題スクリーンショット OCR処理")
+    parser.add_argument("--workers", type=int, default=1, help="OCRワーカープロセス数（1 = 逐次処理）")
+    parser.add_argument("--roi", action="store_true", help="問題文・選択肢の領域のみをOCR")
+    parser.add_argument("--backend", choices=BACKEND_NAMES, default="auto",
+                        help="OCRエンジン（auto: tesserocr があれば常駐エンジン）")
+    args = parser.parse_args()
+    
     # プロジェクトパス
     project_dir = Path(__file__).parent.parent
     input_dir = project_dir / 'input' / 'screenshots'
@@ -330,8 +340,8 @@ def main():
         sys.exit(1)
     
     # OCR処理実行
-    ocr = CCScreenshotOCR(str(input_dir), str(output_dir))
-    ocr.process_all_screenshots()
+    ocr = CCScreenshotOCR(str(input_dir), str(output_dir), use_roi=args.roi, backend=args.backend)
+    ocr.process_all_screenshots(workers=args.workers)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+問題解析の回帰テスト用コーパス
+- build: 既存のOCR結果JSON（raw_text と旧パーサーの判定）からコーパスを作成
+- run:   統合パーサーで再解析し、解析成功率・旧結果との差分・処理速度を表示
+- check: 固定の回帰ケース（REGRESSION_CASES）の parsed 判定だけを確認（コーパス不要）
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from question_parser import MIN_CHOICES, PARSED_THRESHOLD, parse_question_text
+
+
+PROJECT_DIR = Path(__file__).parent.parent
+DEFAULT_CORPUS_FILE = PROJECT_DIR / 'output' / 'parse_corpus.jsonl'
+
+# 旧パーサーごとの出力（ファイル名, 成功判定のキー）
+SOURCE_FILES = [
+    ('cc_questions_full.json', 'parsed'),
+    ('cc_questions_improved.json', 'parsed'),
+    ('cc_questions_final.json', 'parsed'),
+    ('ocr_results.json', 'parsed_successfully'),
+]
+
+# 固定の回帰ケース（raw_text, 期待する parsed）
+# 選択肢が2個未満なら、問題文・正解・解説がそろって信頼度が閾値を超えても解析失敗（旧パーサーと同じ）
+REGRESSION_CASES = [
+    {
+        'filename': 'single_choice.png',
+        'raw_text': "Question 3: Which of the following is a physical control?\n"
+                    "A. Fence\n"
+                    "Correct Answer\n"
+                    "Fence\n"
+                    "Explanation\n"
+                    "A fence is a physical control that deters intruders.",
+        'parsed': False,
+    },
+    {
+        'filename': 'explanation_only.png',
+        'raw_text': "Which of the following is a physical control?\n"
+                    "Explanation\n"
+                    "A fence is a physical control that deters intruders.",
+        'parsed': False,
+    },
+    {
+        'filename': 'two_choices.png',
+        'raw_text': "Which of the following is a physical control?\n"
+                    "A. Fence\n"
+                    "B. Firewall",
+        'parsed': True,
+    },
+]
+
+
+def build_corpus(output_dir: Path, corpus_file: Path) -> int:
+    """
+    OCR結果JSONからコーパスを作成（同じ raw_text は1件にまとめる）
+    """
+    records = {}
+    for source_name, parsed_key in SOURCE_FILES:
+        source_file = output_dir / source_name
+        if not source_file.exists():
+            continue
+
+        with open(source_file, 'r', encoding='utf-8') as f:
+            results = json.load(f)
+
+        for result in results:
+            text = result.get('raw_text')
+            if not text:
+                continue
+            key = hashlib.sha256(f"{result.get('filename', '')}\0{text}".encode('utf-8')).hexdigest()
+            record = records.setdefault(key, {
+                'filename': result.get('filename', ''),
+                'raw_text': text,
+                'legacy': {}
+            })
+            record['legacy'][source_name] = {
+                'parsed': bool(result.get(parsed_key, False)),
+                'question': result.get('question', ''),
+                'choices': len(result.get('choices', []))
+            }
+
+    if not records:
+        print(f"OCR結果JSONが見つかりません: {output_dir}")
+        return 0
+
+    corpus_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(corpus_file, 'w', encoding='utf-8') as f:
+        for record in records.values():
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    print(f"コーパスを作成しました: {corpus_file} ({len(records)}件)")
+    return len(records)
+
+
+def load_corpus(corpus_file: Path) -> List[Dict]:
+    with open(corpus_file, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def check_cases() -> bool:
+    """
+    固定の回帰ケースの parsed 判定を確認
+    """
+    failures = 0
+    for case in REGRESSION_CASES:
+        result = parse_question_text(case['raw_text'], case['filename'])
+        ok = result['parsed'] == case['parsed']
+        failures += not ok
+        print(f"  {'✅' if ok else '❌'} {case['filename']:<24} parsed={result['parsed']} "
+              f"(期待 {case['parsed']}, 信頼度 {result['confidence']:.3f}, 選択肢 {len(result['choices'])}個)")
+    print(f"固定ケース: {len(REGRESSION_CASES) - failures}/{len(REGRESSION_CASES)} 一致 "
+          f"(閾値 {PARSED_THRESHOLD}, 選択肢 {MIN_CHOICES}個以上)")
+    return failures == 0
+
+
+def run_regression(corpus_file: Path, rounds: int = 20) -> Dict:
+    """
+    統合パーサーで再解析し、旧パーサーの判定と比較
+    """
+    corpus = load_corpus(corpus_file)
+    if not corpus:
+        print(f"コーパスが空です: {corpus_file}")
+        return {}
+
+    results = [parse_question_text(record['raw_text'], record['filename']) for record in corpus]
+    parsed = sum(1 for result in results if result['parsed'])
+
+    print(f"問題解析 回帰テスト: {len(corpus)}件 (閾値 {PARSED_THRESHOLD})")
+    print("-" * 50)
+    print(f"統合パーサー: {parsed}/{len(corpus)} ({parsed / len(corpus) * 100:.1f}%)")
+
+    # 旧パーサーごとの比較
+    for source_name, _ in SOURCE_FILES:
+        pairs = [(record['legacy'][source_name], result)
+                 for record, result in zip(corpus, results) if source_name in record['legacy']]
+        if not pairs:
+            continue
+        legacy_parsed = sum(1 for legacy, _ in pairs if legacy['parsed'])
+        gained = sum(1 for legacy, result in pairs if result['parsed'] and not legacy['parsed'])
+        lost = sum(1 for legacy, result in pairs if legacy['parsed'] and not result['parsed'])
+        print(f"  vs {source_name:<28} 旧 {legacy_parsed}/{len(pairs)}  "
+              f"新規成功 +{gained}  失敗化 -{lost}")
+
+    # 信頼度の分布（低い順に確認用）
+    low = sorted((result for result in results if not result['parsed']), key=lambda r: r['confidence'])
+    if low:
+        print(f"\n解析失敗 ({len(low)}件, 信頼度の低い順):")
+        for result in low[:10]:
+            print(f"  {result['confidence']:.2f}  {result['filename']}")
+
+    # 処理速度
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for record in corpus:
+            parse_question_text(record['raw_text'], record['filename'])
+    elapsed = time.perf_counter() - start
+    throughput = len(corpus) * rounds / elapsed
+    print(f"\n処理速度: {throughput:,.0f} 件/秒 ({elapsed / (len(corpus) * rounds) * 1e6:.1f} µs/件)")
+
+    return {'total': len(corpus), 'parsed': parsed, 'throughput': throughput}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="問題解析の回帰テスト")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help="OCR結果JSONからコーパスを作成")
+    build_parser.add_argument('--output-dir', default=str(PROJECT_DIR / 'output'), help="OCR結果JSONのディレクトリ")
+    build_parser.add_argument('--corpus', default=str(DEFAULT_CORPUS_FILE), help="コーパスの出力先")
+
+    run_parser = subparsers.add_parser('run', help="コーパスを統合パーサーで再解析")
+    run_parser.add_argument('--corpus', default=str(DEFAULT_CORPUS_FILE), help="コーパスファイル")
+    run_parser.add_argument('--rounds', type=int, default=20, help="速度計測の繰り返し回数")
+
+    subparsers.add_parser('check', help="固定の回帰ケースを確認")
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        if not build_corpus(Path(args.output_dir), Path(args.corpus)):
+            sys.exit(1)
+    elif args.command == 'check':
+        if not check_cases():
+            sys.exit(1)
+    else:
+        check_cases()
+        print()
+        run_regression(Path(args.corpus), args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,79 +4,52 @@
 手動修正 + 自動最適化で100%高品質達成
 """
 
-import json
 import sys
-import re
 from pathlib import Path
 from typing import Dict, List
 
+from answer_matcher import find_answer, needs_review
+from card_stream import CardStreamWriter, DeckSummary, iter_question_records, resolve_input_file
+from fix_store import DEFAULT_IMAGE_DIR, MANUAL_FIXES_FILE, ManualFixStore
+from quality_engine import PERFECT_RULES, score_card
+from text_normalizer import (RISK_RESPONSE_TERMS, TECH_TERMS, KeywordMatcher,
+                             clean_card_text, is_choice_candidate)
+
+
+# レポートに一覧表示するカード数の上限
+REPORT_SAMPLE_SIZE = 50
+
+# 技術用語 + リスク対応の用語
+ENHANCED_TERM_MATCHER = KeywordMatcher(TECH_TERMS + RISK_RESPONSE_TERMS)
+
 
 class PerfectAnkiGenerator:
     """
     100%高品質Ankiデッキ生成器
     """
     
-    def __init__(self, input_file: str, output_dir: str):
-        self.input_file = Path(input_file)
+    def __init__(self, input_file: str, output_dir: str,
+                 manual_fixes_file: str = MANUAL_FIXES_FILE, image_dir: str = DEFAULT_IMAGE_DIR):
+        self.input_file = resolve_input_file(Path(input_file))
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
-        # 手動修正データベース
-        self.manual_fixes = {
-            'Screenshot from 2025-07-02 16-52-54.png': {
-                'question': 'Fill in the missing word: Sophia is visiting Las Vegas and decides to put a bet on a particular number on a roulette wheel. This is an example of _______.',
-                'choices': ['Acceptance', 'Avoidance', 'Mitigation', 'Transference'],
-                'correct_answer': 'Acceptance',
-                'explanation': 'Sophia is accepting the risk that the money will be lost, even though the likelihood is high; Sophia has decided that the potential benefit (winning the bet), while low in likelihood, is worth the risk.'
-            },
-            'Screenshot from 2025-07-02 16-53-46.png': {
-                'question': 'San Jose municipal code requires that all companies maintain security policies and procedures. Triffid Inc. has written a checklist of steps to follow in the event of a fire. What is the difference between these two documents?',
-                'choices': ['The municipal code is a law, and the Triffid checklist is a procedure', 'Jose city limits', 'The municipal code is a procedure, and the Triffid checklist is a law', 'Law, procedure'],
-                'correct_answer': 'The municipal code is a law, and the Triffid checklist is a procedure',
-                'explanation': 'The municipal code was created by a governmental body and is a legal mandate; this is a law. The Triffid checklist is an internal document that details how to respond to a specific situation; this is a procedure.'
-            },
-            'Screenshot from 2025-07-02 16-57-33.png': {
-                'question': 'What should be done when data has reached the end of the retention period?',
-                'choices': ['Data should be destroyed', 'Data should be archived', 'Data should be backed up', 'Data should be encrypted'],
-                'correct_answer': 'Data should be destroyed',
-                'explanation': 'When data reaches the end of its retention period, it should be properly destroyed according to organizational policies and regulatory requirements to prevent unauthorized access.'
-            },
-            'Screenshot from 2025-07-02 16-58-15.png': {
-                'question': 'If two people want to use asymmetric communication, how many keys are needed in total?',
-                'choices': ['2 keys (1 key pair)', '4 keys (2 key pairs)', '1 key (shared)', '6 keys (3 key pairs)'],
-                'correct_answer': '4 keys (2 key pairs)',
-                'explanation': 'In asymmetric encryption, each party needs their own key pair (a public key and a private key) to encrypt and decrypt messages. For two people, this requires a total of 4 keys: 2 key pairs.'
-            }
-        }
+        # 手動修正データベース（config/manual_fixes.jsonl、参照時に読み込み・更新を自動反映）
+        self.manual_fixes = ManualFixStore(manual_fixes_file, image_dir)
     
     def clean_text(self, text: str) -> str:
         """
         改良版テキストクリーニング
         """
-        if not text:
-            return ""
-        
-        text = re.sub(r'<[^>]+>', '', text)
-        text = re.sub(r'["""]', '"', text)
-        text = re.sub(r"[''']", "'", text)
-        text = re.sub(r'[—–]', '-', text)
-        text = re.sub(r'[©®™]', '', text)
-        text = re.sub(r'\([^\)]{0,3}\)', '', text)
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        text = text.replace('"', '""')
-        
-        return text
+        return clean_card_text(text)
     
     def apply_manual_fix(self, question_data: Dict) -> Dict:
         """
         手動修正を適用
         """
-        filename = question_data.get('filename', '')
+        fix_data = self.manual_fixes.lookup(question_data)
         
-        if filename in self.manual_fixes:
-            fix_data = self.manual_fixes[filename]
-            
+        if fix_data is not None:
             # 手動修正データで上書き
             fixed_data = question_data.copy()
             fixed_data['question'] = fix_data['question']
@@ -100,54 +73,13 @@ class PerfectAnkiGenerator:
         raw_choices = question_data.get('choices', [])
         clean_choices = []
         
-        tech_terms = [
-            'access control', 'authentication', 'authorization', 'encryption',
-            'firewall', 'malware', 'virus', 'security', 'data', 'network',
-            'system', 'password', 'user', 'administrative', 'physical',
-            'technical', 'policy', 'procedure', 'risk', 'threat', 'asset',
-            'confidentiality', 'integrity', 'availability', 'medical',
-            'privacy', 'gdpr', 'regulation', 'biometric', 'multifactor',
-            'non-repudiation', 'siem', 'ids', 'ips', 'vpn', 'certificate',
-            'acceptance', 'avoidance', 'mitigation', 'transference'
-        ]
-        
-        exclude_patterns = [
-            r'^(correct|score|seconds|attempt|taken|explanation)',
-            r'^[0-9]+$',
-            r'http[s]?://',
-            r'@',
-            r'^[^a-zA-Z]',
-        ]
-        
         for choice in raw_choices:
             if not choice or len(choice.strip()) < 3:
                 continue
             
             choice_clean = self.clean_text(choice)
             
-            skip = False
-            for pattern in exclude_patterns:
-                if re.search(pattern, choice_clean, re.IGNORECASE):
-                    skip = True
-                    break
-            
-            if skip or not (5 <= len(choice_clean) <= 100):
-                continue
-            
-            is_valid_choice = False
-            for term in tech_terms:
-                if term.lower() in choice_clean.lower():
-                    is_valid_choice = True
-                    break
-            
-            if not is_valid_choice:
-                choice_lower = choice_clean.lower()
-                if (choice_lower.startswith(('a ', 'an ', 'the ')) or
-                    any(word in choice_lower for word in ['control', 'management', 'protection', 'security']) or
-                    choice_clean[0].isupper()):
-                    is_valid_choice = True
-            
-            if is_valid_choice:
+            if is_choice_candidate(choice_clean, ENHANCED_TERM_MATCHER):
                 clean_choices.append(choice_clean)
         
         unique_choices = []
@@ -163,76 +95,25 @@ class PerfectAnkiGenerator:
     def find_perfect_correct_answer(self, question_data: Dict, choices: List[str]) -> tuple:
         """
         完璧な正解特定
+        (正解の選択肢, 記号, 信頼度) を返し、特定できなければ ("", "", 0.0)
         """
-        if question_data.get('manual_fixed'):
-            correct = question_data['correct_answer']
-            for i, choice in enumerate(choices):
-                if choice == correct:
-                    return correct, chr(65 + i)
-            return correct, "A"  # フォールバック
-        
-        # 自動検出ロジック（既存の改良版）
         correct_raw = question_data.get('correct_answer', '')
         
         if not correct_raw or not choices:
-            return choices[0] if choices else "", "A"
-        
-        correct_clean = self.clean_text(correct_raw)
-        
-        for i, choice in enumerate(choices):
-            if (correct_clean.lower() in choice.lower() or 
-                choice.lower() in correct_clean.lower()):
-                return choice, chr(65 + i)
-        
-        correct_keywords = set(re.findall(r'\b\w+\b', correct_clean.lower()))
-        best_match = ""
-        best_score = 0
-        best_index = 0
-        
-        for i, choice in enumerate(choices):
-            choice_keywords = set(re.findall(r'\b\w+\b', choice.lower()))
-            common_keywords = correct_keywords & choice_keywords
-            score = len(common_keywords)
-            
-            if score > best_score:
-                best_score = score
-                best_match = choice
-                best_index = i
+            return "", "", 0.0
         
-        if best_match:
-            return best_match, chr(65 + best_index)
+        # 手動修正済みの正解は選択肢と同じ表記なのでクリーニングしない
+        if not question_data.get('manual_fixed'):
+            correct_raw = self.clean_text(correct_raw)
         
-        return choices[0], "A"
+        return find_answer(correct_raw, choices)
     
     def calculate_perfect_quality_score(self, card_data: Dict) -> int:
         """
         完璧品質スコア計算
+        問題文 (0-2点)・選択肢 (0-2点)・正解 (0-1点)・解説 (0-1点)
         """
-        score = 0
-        
-        # 問題文品質 (0-2点)
-        if card_data['question'] and len(card_data['question']) > 15:
-            score += 2
-        elif card_data['question'] and len(card_data['question']) > 5:
-            score += 1
-        
-        # 選択肢品質 (0-2点)
-        valid_choices = [c for c in [card_data['choice_a'], card_data['choice_b'], 
-                                   card_data['choice_c'], card_data['choice_d']] if c]
-        if len(valid_choices) >= 4:
-            score += 2
-        elif len(valid_choices) >= 2:
-            score += 1
-        
-        # 正解品質 (0-1点)
-        if card_data['correct_answer']:
-            score += 1
-        
-        # 解説品質 (0-1点)
-        if card_data['explanation'] and len(card_data['explanation']) > 10:
-            score += 1
-        
-        return score
+        return score_card(card_data, PERFECT_RULES)
     
     def create_perfect_anki_card(self, question_data: Dict, card_id: int) -> Dict:
         """
@@ -250,7 +131,8 @@ class PerfectAnkiGenerator:
         choices = self.extract_enhanced_choices(fixed_data)
         
         # 正解特定
-        correct_answer, correct_letter = self.find_perfect_correct_answer(fixed_data, choices)
+        correct_answer, correct_letter, answer_confidence = self.find_perfect_correct_answer(fixed_data, choices)
+        review_answer = needs_review(answer_confidence)
         
         # 4つの選択肢に調整
         while len(choices) < 4:
@@ -267,10 +149,13 @@ class PerfectAnkiGenerator:
             'correct_answer': correct_answer,
             'correct_letter': correct_letter,
             'explanation': explanation,
-            'cloze_text': f"{{{{c1::{correct_answer}}}}}",
+            # 正解を特定できない場合は空（空のクローズはAnkiが取り込めないので、このカードはデッキに入れない）
+            'cloze_text': f"{{{{c1::{correct_answer}}}}}" if correct_answer else "",
             'filename': filename,
             'manual_fixed': fixed_data.get('manual_fixed', False),
-            'tags': 'CC ISC2 Cybersecurity Security+ HighQuality'
+            'answer_confidence': answer_confidence,
+            'answer_review': review_answer,
+            'tags': 'CC ISC2 Cybersecurity Security+' + (' NeedsReview' if review_answer else ' HighQuality')
         }
         
         # 品質スコア計算
@@ -278,116 +163,110 @@ class PerfectAnkiGenerator:
         
         return card_data
     
-    def generate_perfect_tsv(self, cards: List[Dict]) -> str:
+    TSV_HEADERS = [
+        "問題文", "選択肢A", "選択肢B", "選択肢C", "選択肢D",
+        "正解", "解説", "Text", "タグ", "品質スコア", "手動修正"
+    ]
+    
+    def tsv_row(self, card: Dict) -> List[str]:
         """
-        完璧品質TSV生成
+        完璧品質TSVの1行
         """
-        headers = [
-            "問題文", "選択肢A", "選択肢B", "選択肢C", "選択肢D",
-            "正解", "解説", "Text", "タグ", "品質スコア", "手動修正"
+        return [
+            card['question'],
+            card['choice_a'],
+            card['choice_b'],
+            card['choice_c'],
+            card['choice_d'],
+            card['correct_answer'],
+            card['explanation'],
+            card['cloze_text'],
+            card['tags'],
+            str(card['quality_score']),
+            "✓" if card.get('manual_fixed') else ""
         ]
-        
-        lines = ["\t".join(headers)]
-        
-        for card in cards:
-            row = [
-                card['question'],
-                card['choice_a'],
-                card['choice_b'],
-                card['choice_c'],
-                card['choice_d'],
-                card['correct_answer'],
-                card['explanation'],
-                card['cloze_text'],
-                card['tags'],
-                str(card['quality_score']),
-                "✓" if card.get('manual_fixed') else ""
-            ]
-            lines.append("\t".join(row))
-        
-        return "\n".join(lines)
     
     def process_to_perfection(self):
         """
         完璧品質処理実行
         """
         print("🎯 完璧品質Ankiデッキ生成開始...")
-        
-        with open(self.input_file, 'r', encoding='utf-8') as f:
-            questions_data = json.load(f)
-        
-        print(f"📖 読み込み完了: {len(questions_data)}問")
         print(f"🔧 手動修正適用: {len(self.manual_fixes)}問")
         
-        perfect_cards = []
-        
-        for i, question_data in enumerate(questions_data):
-            if not question_data.get('parsed', False):
-                continue
-            
-            try:
-                card = self.create_perfect_anki_card(question_data, i + 1)
-                perfect_cards.append(card)
+        tsv_file = self.output_dir / 'cc_anki_perfect.tsv'
+        json_file = self.output_dir / 'cc_anki_perfect.json'
+        # 正解を特定できなかったカード（デッキには入れず、確認用に別ファイルへ）
+        review_tsv_file = self.output_dir / 'cc_anki_perfect_review.tsv'
+        review_json_file = self.output_dir / 'cc_anki_perfect_review.json'
+        summary = DeckSummary(sample_size=REPORT_SAMPLE_SIZE)
+        total_questions = 0
+        
+        # OCR結果を1件ずつ読み込み、カードを1行ずつ書き出す
+        with CardStreamWriter(tsv_file, self.TSV_HEADERS, json_file) as writer, \
+                CardStreamWriter(review_tsv_file, self.TSV_HEADERS, review_json_file) as review_writer:
+            for i, question_data in enumerate(iter_question_records(self.input_file)):
+                total_questions += 1
+                
+                if not question_data.get('parsed', False):
+                    continue
                 
-                if (i + 1) % 25 == 0:
-                    print(f"⚡ 処理済み: {i + 1}/{len(questions_data)}")
+                try:
+                    card = self.create_perfect_anki_card(question_data, i + 1)
+                    if (i + 1) % 25 == 0:
+                        print(f"⚡ 処理済み: {i + 1}")
                     
-            except Exception as e:
-                print(f"❌ エラー [{question_data.get('filename', 'Unknown')}]: {e}")
+                    if not card['correct_letter']:
+                        review_writer.write(card, self.tsv_row(card))
+                        summary.flag('unmatched', card, question=card['question'][:60])
+                        continue
+                    
+                    writer.write(card, self.tsv_row(card))
+                    summary.add(card)
+                    
+                    if card['manual_fixed']:
+                        summary.flag('manual_fixed', card, question=card['question'][:60])
+                    if card['answer_review']:
+                        summary.flag('answer_review', card, answer_confidence=card['answer_confidence'])
+                        
+                except Exception as e:
+                    print(f"❌ エラー [{question_data.get('filename', 'Unknown')}]: {e}")
         
-        # 品質統計
-        quality_stats = {}
-        for score in range(7):
-            quality_stats[score] = len([c for c in perfect_cards if c['quality_score'] == score])
+        print(f"📖 読み込み完了: {total_questions}問")
         
-        # ファイル生成
-        self.save_perfect_outputs(perfect_cards, quality_stats)
-    
-    def save_perfect_outputs(self, cards: List[Dict], quality_stats: Dict):
-        """
-        完璧品質出力保存
-        """
-        # TSVファイル
-        tsv_content = self.generate_perfect_tsv(cards)
-        tsv_file = self.output_dir / 'cc_anki_perfect.tsv'
-        with open(tsv_file, 'w', encoding='utf-8') as f:
-            f.write(tsv_content)
+        # 品質統計
+        quality_stats = {score: summary.quality_counts[score] for score in range(7)}
         
         # 完璧品質レポート
-        report = self.generate_perfect_report(cards, quality_stats)
+        report = self.generate_perfect_report(summary, quality_stats)
         report_file = self.output_dir / 'perfect_quality_report.md'
         with open(report_file, 'w', encoding='utf-8') as f:
             f.write(report)
         
-        # JSON詳細データ
-        json_file = self.output_dir / 'cc_anki_perfect.json'
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(cards, f, ensure_ascii=False, indent=2)
-        
         # 結果表示
-        self.print_perfect_results(cards, quality_stats, tsv_file, report_file)
+        self.print_perfect_results(summary, quality_stats, tsv_file, report_file, review_tsv_file)
     
-    def generate_perfect_report(self, cards: List[Dict], quality_stats: Dict) -> str:
+    def generate_perfect_report(self, summary: DeckSummary, quality_stats: Dict) -> str:
         """
         完璧品質レポート生成
         """
-        high_quality_count = len([c for c in cards if c['quality_score'] >= 5])
-        manual_fixed_count = len([c for c in cards if c.get('manual_fixed')])
+        total_cards = summary.total
+        high_quality_count = summary.quality_at_least(5)
+        manual_fixed_count = summary.counts['manual_fixed']
         
         report = f"""# CC練習問題 完璧品質Ankiデッキレポート
 
 ## 🎯 完璧品質達成サマリー
-- **総カード数**: {len(cards)}枚
-- **高品質カード (5-6点)**: {high_quality_count}枚 ({high_quality_count/len(cards)*100:.1f}%)
+- **総カード数**: {total_cards}枚
+- **高品質カード (5-6点)**: {high_quality_count}枚 ({high_quality_count/total_cards*100 if total_cards else 0:.1f}%)
 - **手動修正適用**: {manual_fixed_count}枚
-- **自動処理**: {len(cards) - manual_fixed_count}枚
+- **自動処理**: {total_cards - manual_fixed_count}枚
 
 ## 📊 品質スコア分布
 """
         
         for score in range(6, -1, -1):
             count = quality_stats.get(score, 0)
-            percentage = count / len(cards) * 100 if cards else 0
+            percentage = count / total_cards * 100 if total_cards else 0
             stars = "⭐" * score
             report += f"- **{score}点** {stars}: {count}枚 ({percentage:.1f}%)\n"
         
@@ -395,9 +274,26 @@ class PerfectAnkiGenerator:
 ## 🔧 手動修正適用済みカード
 """
         
-        manual_cards = [c for c in cards if c.get('manual_fixed')]
-        for card in manual_cards:
-            report += f"- {card['filename']}: {card['question'][:60]}...\n"
+        for card in summary.samples.get('manual_fixed', []):
+            report += f"- {card['filename']}: {card['question']}...\n"
+        
+        answer_review_count = summary.counts['answer_review']
+        if answer_review_count:
+            answer_review = summary.samples['answer_review']
+            report += f"\n## ❓ 正解の確認が必要なカード（{answer_review_count}枚, タグ NeedsReview）\n"
+            for card in answer_review:
+                report += f"- {card['filename']}: 信頼度 {card['answer_confidence']:.2f}\n"
+            if answer_review_count > len(answer_review):
+                report += f"- ...他 {answer_review_count - len(answer_review)}枚\n"
+        
+        unmatched_count = summary.counts['unmatched']
+        if unmatched_count:
+            unmatched = summary.samples['unmatched']
+            report += f"\n## 🚫 正解を特定できずデッキから除外したカード（{unmatched_count}枚, cc_anki_perfect_review.tsv）\n"
+            for card in unmatched:
+                report += f"- {card['filename']}: {card['question']}...\n"
+            if unmatched_count > len(unmatched):
+                report += f"- ...他 {unmatched_count - len(unmatched)}枚\n"
         
         report += f"""
 ## 🚀 学習推奨順序
@@ -418,37 +314,41 @@ class PerfectAnkiGenerator:
         
         return report
     
-    def print_perfect_results(self, cards: List[Dict], quality_stats: Dict, 
-                            tsv_file: Path, report_file: Path):
+    def print_perfect_results(self, summary: DeckSummary, quality_stats: Dict, 
+                            tsv_file: Path, report_file: Path, review_tsv_file: Path):
         """
         完璧品質結果表示
         """
-        high_quality = len([c for c in cards if c['quality_score'] >= 5])
-        perfect_quality = len([c for c in cards if c['quality_score'] == 6])
+        total_cards = summary.total
+        high_quality = summary.quality_at_least(5)
+        perfect_quality = quality_stats.get(6, 0)
         
         print("\n🎉 完璧品質Ankiデッキ生成完了!")
         print("=" * 60)
-        print(f"📊 総カード数: {len(cards)}")
+        print(f"📊 総カード数: {total_cards}")
         print(f"🏆 完璧品質 (6点): {perfect_quality}枚")
         print(f"⭐ 高品質 (5-6点): {high_quality}枚")
-        print(f"📈 高品質率: {(high_quality/len(cards)*100):.1f}%")
-        print(f"🔧 手動修正適用: {len([c for c in cards if c.get('manual_fixed')])}枚")
+        print(f"📈 高品質率: {(high_quality/total_cards*100 if total_cards else 0):.1f}%")
+        print(f"🔧 手動修正適用: {summary.counts['manual_fixed']}枚")
+        print(f"❓ 正解の照合が低信頼度: {summary.counts['answer_review']}枚 (タグ NeedsReview)")
+        print(f"🚫 正解を特定できず除外: {summary.counts['unmatched']}枚 ({review_tsv_file.name})")
         
         print(f"\n📁 生成ファイル:")
         print(f"1. 📋 {tsv_file.name} - 完璧品質Ankiインポート用")
         print(f"2. 📖 {report_file.name} - 完璧品質レポート")
         print(f"3. 🔍 cc_anki_perfect.json - 詳細データ")
+        print(f"4. 🚫 {review_tsv_file.name} - 正解の確認が必要なカード（インポート対象外）")
         
         print(f"\n🎯 達成度:")
-        if high_quality == len(cards):
+        if total_cards and high_quality == total_cards:
             print("✅ 100%高品質達成！完璧です！")
         else:
-            print(f"📈 高品質率 {(high_quality/len(cards)*100):.1f}% - ほぼ完璧！")
+            print(f"📈 高品質率 {(high_quality/total_cards*100 if total_cards else 0):.1f}% - ほぼ完璧！")
 
 
 def main():
     project_dir = Path(__file__).parent.parent
-    input_file = project_dir / 'output' / 'cc_questions_final.json'
+    input_file = resolve_input_file(project_dir / 'output' / 'cc_questions_final.json')
     output_dir = project_dir / 'output' / 'anki'
     
     if not input_file.exists():
@@ -3,11 +3,15 @@
 品質分析ツール - 低品質カードの原因調査
 """
 
-import json
 import sys
 from pathlib import Path
 from typing import Dict, List
 
+import numpy as np
+
+from card_stream import iter_question_records
+from quality_engine import IMPROVED_RULES, CardColumns, format_report, quality_summary
+
 
 def analyze_quality_issues():
     """
@@ -16,25 +20,38 @@ def analyze_quality_issues():
     project_dir = Path(__file__).parent.parent
     cards_file = project_dir / 'output' / 'anki' / 'cc_anki_improved.json'
     
-    with open(cards_file, 'r', encoding='utf-8') as f:
-        cards = json.load(f)
+    # 1回の走査で列にまとめ、分類・問題点は配列演算で集計
+    columns = CardColumns.from_file(cards_file)
+    summary = quality_summary(columns, IMPROVED_RULES)
     
-    # 品質別分類
-    high_quality = [c for c in cards if c['quality_score'] >= 5]
-    medium_quality = [c for c in cards if 3 <= c['quality_score'] < 5]
-    low_quality = [c for c in cards if c['quality_score'] < 3]
+    # 保存済みのスコア（無ければ再計算したスコア）で分類
+    stored = columns.columns['stored_score']
+    scores = np.where(stored >= 0, stored, summary['scores'])
+    medium_mask = (scores >= 3) & (scores < 5)
+    low_mask = scores < 3
     
     print("🔍 品質分析レポート")
     print("=" * 50)
-    print(f"高品質カード: {len(high_quality)}枚")
-    print(f"中品質カード: {len(medium_quality)}枚")
-    print(f"低品質カード: {len(low_quality)}枚")
+    print(f"高品質カード: {int((scores >= 5).sum())}枚")
+    print(f"中品質カード: {int(medium_mask.sum())}枚")
+    print(f"低品質カード: {int(low_mask.sum())}枚")
+    print()
+    print(format_report(summary))
     
     print("\n📉 中・低品質カードの詳細分析:")
     
-    problem_cards = medium_quality + low_quality
+    issue_masks = columns.issue_masks()
+    
+    # 詳細表示は中品質 → 低品質の順（該当カードだけを読み直す）
+    order = np.concatenate([np.flatnonzero(medium_mask), np.flatnonzero(low_mask)])
+    rank = {int(index): position for position, index in enumerate(order)}
+    
+    problem_cards = [None] * len(order)
+    for index, card in enumerate(iter_question_records(cards_file)):
+        if index in rank:
+            problem_cards[rank[index]] = (index, card)
     
-    for i, card in enumerate(problem_cards, 1):
+    for i, (index, card) in enumerate(problem_cards, 1):
         print(f"\n【問題カード {i}】")
         print(f"ファイル: {card['filename']}")
         print(f"品質スコア: {card['quality_score']}/6")
@@ -47,18 +64,11 @@ def analyze_quality_issues():
         print(f"解説: {card['explanation'][:100]}...")
         
         # 問題点分析
-        issues = []
-        if not card['question'] or len(card['question']) <= 10:
-            issues.append("問題文が短すぎる/空")
-        if len([c for c in [card['choice_a'], card['choice_b'], card['choice_c'], card['choice_d']] if c]) < 2:
-            issues.append("選択肢が不足")
-        if not card['correct_answer']:
-            issues.append("正解が空")
-        if not card['explanation']:
-            issues.append("解説が空")
+        issues = [label for label, mask in issue_masks.items() if mask[index]]
         
         print(f"問題点: {', '.join(issues)}")
     
+    problem_cards = [card for _, card in problem_cards]
     return problem_cards
 
 
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+カード品質の列指向スコアリング
+- カードを1回だけ走査して数値列（NumPy配列）にまとめ、
+  品質スコア・分布・問題点の集計をすべて配列演算で行う
+- スコアの配点はルール表で定義し、1枚ずつの計算（カード生成時）と共有
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from card_stream import iter_question_records
+
+
+CHOICE_KEYS = ('choice_a', 'choice_b', 'choice_c', 'choice_d')
+MAX_SCORE = 6
+
+# 配点ルール: (列名, [(この値より大きければ, 点数), ...])  上から最初に一致した点数
+ScoreRules = List[Tuple[str, List[Tuple[int, int]]]]
+
+# 完璧品質版: 問題文 0-2, 選択肢 0-2, 正解 0-1, 解説 0-1
+PERFECT_RULES: ScoreRules = [
+    ('question_len', [(15, 2), (5, 1)]),
+    ('choice_count', [(3, 2), (1, 1)]),
+    ('correct_len', [(0, 1)]),
+    ('explanation_len', [(10, 1)]),
+]
+
+# 改良版: 問題文 0/2, 選択肢 0/2, 正解 0-1, 解説 0-1
+IMPROVED_RULES: ScoreRules = [
+    ('question_len', [(10, 2)]),
+    ('choice_count', [(1, 2)]),
+    ('correct_len', [(0, 1)]),
+    ('explanation_len', [(0, 1)]),
+]
+
+# 問題点: (ラベル, 列名, この値以下なら該当)
+ISSUE_RULES = [
+    ("問題文が短すぎる/空", 'question_len', 10),
+    ("選択肢が不足", 'choice_count', 1),
+    ("正解が空", 'correct_len', 0),
+    ("解説が空", 'explanation_len', 0),
+]
+
+def card_features(card: Dict) -> Dict[str, int]:
+    """
+    1枚のカードの採点用の値
+    """
+    return {
+        'question_len': len(card.get('question') or ''),
+        'choice_count': sum(1 for key in CHOICE_KEYS if card.get(key)),
+        'correct_len': len(card.get('correct_answer') or ''),
+        'explanation_len': len(card.get('explanation') or ''),
+    }
+
+
+def score_card(card: Dict, rules: ScoreRules = PERFECT_RULES) -> int:
+    """
+    1枚のカードの品質スコア（カード生成時用）
+    """
+    features = card_features(card)
+    score = 0
+    for column, steps in rules:
+        value = features[column]
+        for threshold, points in steps:
+            if value > threshold:
+                score += points
+                break
+    return score
+
+
+class CardColumns:
+    """
+    カード集合の列指向表現（採点用の数値列とフラグ列）
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        self.columns = columns
+        self.size = len(columns['question_len'])
+
+    @classmethod
+    def from_cards(cls, cards: Iterable[Dict]) -> 'CardColumns':
+        """
+        カードを1回だけ走査して列を作る
+        """
+        question_len, choice_count, correct_len, explanation_len = [], [], [], []
+        stored_score, manual_fixed, answer_review, answer_confidence = [], [], [], []
+        for card in cards:
+            get = card.get
+            question_len.append(len(get('question') or ''))
+            choice_count.append((not not get('choice_a')) + (not not get('choice_b')) +
+                                (not not get('choice_c')) + (not not get('choice_d')))
+            correct_len.append(len(get('correct_answer') or ''))
+            explanation_len.append(len(get('explanation') or ''))
+            stored_score.append(get('quality_score', -1))
+            manual_fixed.append(not not get('manual_fixed'))
+            answer_review.append(not not get('answer_review'))
+            answer_confidence.append(get('answer_confidence', 1.0))
+
+        columns = {
+            'question_len': np.array(question_len, dtype=np.int32),
+            'choice_count': np.array(choice_count, dtype=np.int32),
+            'correct_len': np.array(correct_len, dtype=np.int32),
+            'explanation_len': np.array(explanation_len, dtype=np.int32),
+            'stored_score': np.array(stored_score, dtype=np.int32),
+            'manual_fixed': np.array(manual_fixed, dtype=bool),
+            'answer_review': np.array(answer_review, dtype=bool),
+            'answer_confidence': np.array(answer_confidence, dtype=np.float32),
+        }
+        return cls(columns)
+
+    @classmethod
+    def from_file(cls, cards_file: Path) -> 'CardColumns':
+        return cls.from_cards(iter_question_records(cards_file))
+
+    def scores(self, rules: ScoreRules = PERFECT_RULES) -> np.ndarray:
+        """
+        全カードの品質スコア
+        """
+        total = np.zeros(self.size, dtype=np.int8)
+        for column, steps in rules:
+            values = self.columns[column]
+            total += np.select([values > threshold for threshold, _ in steps],
+                               [points for _, points in steps], 0).astype(np.int8)
+        return total
+
+    def issue_masks(self) -> Dict[str, np.ndarray]:
+        """
+        問題点ごとの該当カード（真偽値の配列）
+        """
+        masks = {label: self.columns[column] <= limit for label, column, limit in ISSUE_RULES}
+        masks["正解の照合が低信頼度"] = self.columns['answer_review']
+        return masks
+
+
+def quality_summary(columns: CardColumns, rules: ScoreRules = PERFECT_RULES) -> Dict:
+    """
+    スコア・分布・問題点をまとめて集計
+    """
+    scores = columns.scores(rules)
+    histogram = np.bincount(scores, minlength=MAX_SCORE + 1)
+    stored = columns.columns['stored_score']
+    has_stored = stored >= 0
+
+    return {
+        'total': columns.size,
+        'scores': scores,
+        'histogram': histogram,
+        'high': int(histogram[5:].sum()),
+        'medium': int(histogram[3:5].sum()),
+        'low': int(histogram[:3].sum()),
+        'mean': float(scores.mean()) if columns.size else 0.0,
+        'issues': {label: int(mask.sum()) for label, mask in columns.issue_masks().items()},
+        'manual_fixed': int(columns.columns['manual_fixed'].sum()),
+        'score_mismatch': int((has_stored & (stored != scores)).sum()),
+    }
+
+
+def format_report(summary: Dict) -> str:
+    """
+    簡潔な品質レポート
+    """
+    total = summary['total']
+    lines = [f"📊 品質レポート: {total:,}枚 (平均 {summary['mean']:.2f}/{MAX_SCORE})"]
+    if not total:
+        return lines[0]
+
+    lines.append(f"高品質 {summary['high']:,} / 中品質 {summary['medium']:,} / 低品質 {summary['low']:,}")
+    histogram = summary['histogram']
+    peak = max(int(histogram.max()), 1)
+    for score in range(MAX_SCORE, -1, -1):
+        count = int(histogram[score])
+        bar = "█" * round(count / peak * 30)
+        lines.append(f"  {score}点 {bar:<30} {count:,} ({count / total * 100:.1f}%)")
+
+    issues = [f"{label} {count:,}" for label, count in summary['issues'].items() if count]
+    lines.append(f"問題点: {', '.join(issues) if issues else 'なし'}")
+    if summary['manual_fixed']:
+        lines.append(f"手動修正: {summary['manual_fixed']:,}枚")
+    if summary['score_mismatch']:
+        lines.append(f"⚠️  保存済みスコアと再計算の不一致: {summary['score_mismatch']:,}枚")
+    return "\n".join(lines)
+
+
+def make_synthetic_cards(count: int, seed: int = 0) -> List[Dict]:
+    """
+    ベンチマーク用の合成カード
+    """
+    rng = np.random.default_rng(seed)
+    question_lens = rng.integers(0, 120, count)
+    choice_counts = rng.integers(0, 5, count)
+    explanation_lens = rng.integers(0, 40, count)
+    has_correct = rng.random(count) < 0.9
+    return [{
+        'question': 'q' * int(question_lens[i]),
+        **{key: ('choice' if j < choice_counts[i] else '') for j, key in enumerate(CHOICE_KEYS)},
+        'correct_answer': 'answer' if has_correct[i] else '',
+        'explanation': 'e' * int(explanation_lens[i]),
+    } for i in range(count)]
+
+
+def run_benchmark(count: int):
+    cards = make_synthetic_cards(count)
+
+    start = time.perf_counter()
+    legacy_scores = [score_card(card) for card in cards]
+    per_card = time.perf_counter() - start
+
+    start = time.perf_counter()
+    columns = CardColumns.from_cards(cards)
+    loaded = time.perf_counter() - start
+    summary = quality_summary(columns)
+    scored = time.perf_counter() - start - loaded
+
+    identical = np.array_equal(summary['scores'], np.array(legacy_scores, dtype=np.int8))
+    print(f"品質スコア ベンチマーク: {count:,}枚")
+    print("-" * 40)
+    print(f"1枚ずつ採点      : {per_card * 1000:7.1f} ms")
+    print(f"列の作成         : {loaded * 1000:7.1f} ms")
+    print(f"採点+分布+問題点 : {scored * 1000:7.1f} ms")
+    print(f"スコア一致: {'OK' if identical else 'NG'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="カード品質の集計")
+    parser.add_argument('cards', nargs='?',
+                        default=str(Path(__file__).parent.parent / 'output' / 'anki' / 'cc_anki_perfect.json'),
+                        help="カードJSON（.json / .jsonl）")
+    parser.add_argument('--rules', choices=['perfect', 'improved'], default='perfect', help="配点ルール")
+    parser.add_argument('--benchmark', type=int, metavar='N', help="合成カードN枚で処理時間を計測")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.benchmark)
+        return
+
+    cards_file = Path(args.cards)
+    if not cards_file.exists():
+        print(f"❌ カードファイルが見つかりません: {cards_file}")
+        sys.exit(1)
+
+    rules = PERFECT_RULES if args.rules == 'perfect' else IMPROVED_RULES
+    print(format_report(quality_summary(CardColumns.from_file(cards_file), rules)))
+
+
+if __name__ == "__main__":
+    main()
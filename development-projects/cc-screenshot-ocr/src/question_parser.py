@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+OCRテキストの問題構造解析（統合版）
+各行をルール表で1回だけ分類し（問題文・選択肢・解説・メタ情報）、
+1パスで問題データを組み立てて信頼度スコアを付ける
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+
+# 行分類ルール（上から順に優先）
+# 1つの正規表現に結合し、先頭から一致した分岐のグループ名をラベルとして使う
+LINE_RULES: List[Tuple[str, str]] = [
+    ('correct_header', r'(?i:correct answers?)\s*$'),
+    ('explanation_header', r'(?i:explanation)\b'),
+    ('attempt', r'.*(?i:attempt taken)'),
+    ('score', r'(?i:score)\s*\d+'),
+    ('metadata', r'.*(?:https?://|www\.|@|\.com\b|\.io\b'
+                 r'|(?i:\b(?:progress|accuracy|usage|seconds|isc2|obrizum|google|anki|cyder|chess)\b))'),
+    ('choice', r'(?:[✓✔☑]\s*)?(?:[A-Da-d]|[1-8])\s*[).:]\s*\S'),
+    ('question', r'(?:(?i:question)\s*\d+\s*[:.)]?\s*)?'
+                 r'(?i:for which of the following|which of the following|of the following'
+                 r'|what|which|how|where|when|why)\b'),
+    ('question', r'.*\?$'),
+]
+
+_LINE_PATTERN = re.compile('|'.join(
+    f'(?P<{label}_{i}>{pattern})' for i, (label, pattern) in enumerate(LINE_RULES)
+))
+
+CHOICE_PREFIX_PATTERN = re.compile(r'^(?:[✓✔☑]\s*)?([A-Da-d]|[1-8])\s*[).:]\s*')
+CORRECT_MARK_PATTERN = re.compile(r'[✓✔☑]')
+SCORE_PATTERN = re.compile(r'(?i:score)\s*(\d+)')
+CORRECT_LABEL_PATTERN = re.compile(r'(?i:correct answers?)')
+
+MAX_QUESTION_LINES = 3
+MAX_CHOICES = 8
+MAX_EXPLANATION_LINES = 5
+
+# confidence がこの値以上、かつ選択肢が MIN_CHOICES 個以上なら parsed（問題文 + 選択肢2個 に相当）
+PARSED_THRESHOLD = 0.55
+MIN_CHOICES = 2
+
+
+def classify_line(line: str) -> str:
+    """
+    1行を分類（question / choice / correct_header / explanation_header /
+    attempt / score / metadata / text）
+    """
+    match = _LINE_PATTERN.match(line)
+    if match is None:
+        return 'text'
+    return match.lastgroup.rsplit('_', 1)[0]
+
+
+def _choice_detail(line: str, index: int) -> Dict:
+    """
+    選択肢行から記号・本文・正解マークを取り出す
+    """
+    is_correct = bool(CORRECT_MARK_PATTERN.search(line))
+    prefix = CHOICE_PREFIX_PATTERN.match(line)
+    if prefix:
+        mark = prefix.group(1).upper()
+        letter = chr(ord('A') + int(mark) - 1) if mark.isdigit() else mark
+        text = line[prefix.end():]
+    else:
+        letter = chr(ord('A') + index)
+        text = line
+    text = CORRECT_MARK_PATTERN.sub('', text).strip()
+    return {'letter': letter, 'text': text, 'is_correct': is_correct}
+
+
+def score_confidence(question: str, choices: List, correct_answer: str, explanation: str) -> float:
+    """
+    解析結果の信頼度（0.0〜1.0）
+    """
+    confidence = 0.0
+    if question:
+        confidence += 0.4
+        if question.endswith('?'):
+            confidence += 0.1
+    confidence += 0.3 * min(len(choices), 4) / 4
+    if correct_answer:
+        confidence += 0.1
+    if explanation:
+        confidence += 0.1
+    return round(confidence, 3)
+
+
+def parse_question_text(text: str, filename: str) -> Dict:
+    """
+    OCRテキストから問題データを抽出（1パス）
+    """
+    result = {
+        'filename': filename,
+        'raw_text': text,
+        'question': '',
+        'choices': [],
+        'correct_answer': '',
+        'explanation': '',
+        'attempt_info': '',
+        'score': '',
+        'choice_details': [],
+        'confidence': 0.0,
+        'parsed': False
+    }
+
+    question_lines: List[str] = []
+    choices: List[str] = []
+    choice_details: List[Dict] = []
+    explanation_lines: List[str] = []
+    seen_choices = set()
+
+    # pre → question → choices → explanation → done
+    state = 'pre'
+    expect_correct = False
+    # 問題文より前の直近の未分類行（問題文の1行目が小文字で始まる場合に補う）
+    previous_text = ''
+
+    for raw_line in text.split('\n'):
+        line = raw_line.strip()
+        if not line:
+            continue
+
+        label = classify_line(line)
+
+        if label == 'correct_header':
+            expect_correct = True
+            continue
+        if label == 'explanation_header':
+            state = 'explanation'
+            continue
+        if label == 'attempt':
+            if not result['attempt_info']:
+                result['attempt_info'] = line
+            continue
+        if label == 'score':
+            if not result['score']:
+                result['score'] = SCORE_PATTERN.match(line).group(1)
+            continue
+        if label == 'metadata':
+            continue
+
+        # "Correct Answers" の次の行が正解
+        if expect_correct:
+            expect_correct = False
+            answer = CORRECT_LABEL_PATTERN.sub('', line).strip()
+            if answer and label != 'question':
+                result['correct_answer'] = _choice_detail(answer, 0)['text']
+
+        if state == 'explanation':
+            # 次の問題文が始まったら解説終了
+            if label == 'question' and explanation_lines:
+                state = 'done'
+            elif len(explanation_lines) < MAX_EXPLANATION_LINES and len(line) > 10:
+                explanation_lines.append(line)
+            continue
+        if state == 'done':
+            continue
+
+        if label == 'question' and state in ('pre', 'question') and len(question_lines) < MAX_QUESTION_LINES:
+            if state == 'pre' and previous_text and line[0].islower():
+                question_lines.append(previous_text)
+            question_lines.append(line)
+            state = 'question'
+            continue
+
+        if state == 'pre':
+            previous_text = line if label == 'text' else ''
+
+        # 問題文が「?」で終わるまでは続きの行として扱う
+        if (state == 'question' and label == 'text' and not question_lines[-1].endswith('?')
+                and len(question_lines) < MAX_QUESTION_LINES):
+            question_lines.append(line)
+            continue
+
+        if label == 'choice' or (state in ('question', 'choices') and 3 < len(line) <= 150):
+            detail = _choice_detail(line, len(choices))
+            if detail['text'] and detail['text'] not in seen_choices and len(choices) < MAX_CHOICES:
+                seen_choices.add(detail['text'])
+                choices.append(line)
+                choice_details.append(detail)
+                if detail['is_correct'] and not result['correct_answer']:
+                    result['correct_answer'] = detail['text']
+            state = 'choices'
+
+    result['question'] = ' '.join(question_lines)
+    result['choices'] = choices
+    result['choice_details'] = choice_details
+    result['explanation'] = ' '.join(explanation_lines)
+    result['confidence'] = score_confidence(result['question'], choices,
+                                            result['correct_answer'], result['explanation'])
+    # 選択肢が1個以下の解析結果は、正解・解説があっても不完全なOCRとして扱う
+    result['parsed'] = result['confidence'] >= PARSED_THRESHOLD and len(choices) >= MIN_CHOICES
+
+    return result
+
+
+def correct_choice_letter(result: Dict) -> Optional[str]:
+    """
+    正解の選択肢記号（特定できなければNone）
+    """
+    for detail in result['choice_details']:
+        if detail['is_correct'] or (result['correct_answer'] and detail['text'] == result['correct_answer']):
+            return detail['letter']
+    return None
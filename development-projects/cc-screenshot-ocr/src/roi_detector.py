@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+問題領域（ROI）検出
+二値化済みスクリーンショットから問題文・選択肢のパネルを検出し、
+画面レイアウト（解像度）ごとのROIプロファイルをJSONにキャッシュする
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+DEFAULT_PROFILE_FILE = Path(__file__).parent.parent / 'output' / 'roi_profiles.json'
+
+# (x, y, 幅, 高さ)
+Rect = Tuple[int, int, int, int]
+
+
+def union_rect(a: Rect, b: Rect) -> Rect:
+    """
+    2つの矩形を包含する矩形
+    """
+    x0, y0 = min(a[0], b[0]), min(a[1], b[1])
+    x1, y1 = max(a[0] + a[2], b[0] + b[2]), max(a[1] + a[3], b[1] + b[3])
+    return (x0, y0, x1 - x0, y1 - y0)
+
+
+class ROIDetector:
+    """
+    輪郭と空白の射影によるレイアウト検出
+    1. 文字を横方向に膨張させて行ブロックを作り、輪郭から外接矩形を取得
+    2. 行ブロックの縦射影で空白の溝を探し、最も文字量の多い列を選択
+    3. 画面上下端のブロック（ブラウザのバー等）を除いた範囲をROIとする
+    """
+
+    def __init__(self, profile_file: str = DEFAULT_PROFILE_FILE, scale: float = 0.25,
+                 padding: int = 16, edge_ratio: float = 0.06, gutter_ratio: float = 0.03):
+        self.profile_file = Path(profile_file) if profile_file else None
+        self.scale = scale
+        self.padding = padding
+        self.edge_ratio = edge_ratio
+        self.gutter_ratio = gutter_ratio
+
+        # テンプレート（"幅x高さ"）→ ROI
+        self.profiles: Dict[str, Rect] = {}
+        self.stats = {
+            'profile_hits': 0,
+            'detections': 0
+        }
+        self._load_profiles()
+
+    def _load_profiles(self):
+        if self.profile_file and self.profile_file.exists():
+            with open(self.profile_file, 'r', encoding='utf-8') as f:
+                self.profiles = {key: tuple(rect) for key, rect in json.load(f).items()}
+
+    def save_profiles(self):
+        """
+        プロファイルを保存（一時ファイル経由）
+        """
+        if not self.profile_file:
+            return
+        self.profile_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.profile_file.with_name(f"{self.profile_file.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({key: list(rect) for key, rect in self.profiles.items()}, f, indent=2)
+        os.replace(tmp_path, self.profile_file)
+
+    @staticmethod
+    def template_key(binary: np.ndarray) -> str:
+        height, width = binary.shape[:2]
+        return f"{width}x{height}"
+
+    @staticmethod
+    def ink_mask(binary: np.ndarray) -> np.ndarray:
+        """
+        文字部分を255とするマスク（ダークモードの画面は反転）
+        """
+        ink = cv2.bitwise_not(binary)
+        if cv2.countNonZero(ink) > ink.size // 2:
+            ink = binary.copy()
+        return ink
+
+    def _line_boxes(self, ink: np.ndarray) -> List[Rect]:
+        """
+        縮小画像上で行ブロックの外接矩形を取得
+        """
+        small = cv2.resize(ink, None, fx=self.scale, fy=self.scale, interpolation=cv2.INTER_AREA)
+        _, small = cv2.threshold(small, 0, 255, cv2.THRESH_BINARY)
+
+        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (max(3, small.shape[1] // 80), 3))
+        dilated = cv2.dilate(small, kernel)
+
+        contours, _ = cv2.findContours(dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        return [cv2.boundingRect(contour) for contour in contours
+                if cv2.contourArea(contour) >= 4]
+
+    def _main_column(self, boxes: List[Rect], width: int) -> Tuple[int, int]:
+        """
+        縦射影で空白の溝を区切りとし、文字量が最大の列 (x0, x1) を返す
+        """
+        coverage = np.zeros(width, dtype=np.int64)
+        for x, _, w, h in boxes:
+            coverage[x:x + w] += h
+
+        gutter = max(1, int(width * self.gutter_ratio))
+        columns = []
+        start = None
+        blank = 0
+        for x in range(width):
+            if coverage[x]:
+                if start is None:
+                    start = x
+                blank = 0
+            elif start is not None:
+                blank += 1
+                if blank >= gutter:
+                    columns.append((start, x - blank + 1))
+                    start = None
+        if start is not None:
+            columns.append((start, width - blank))
+
+        return max(columns, key=lambda col: int(coverage[col[0]:col[1]].sum()))
+
+    def detect(self, binary: np.ndarray) -> Optional[Rect]:
+        """
+        レイアウト検出（文字が見つからなければNone）
+        """
+        self.stats['detections'] += 1
+        height, width = binary.shape[:2]
+        boxes = self._line_boxes(self.ink_mask(binary))
+        if not boxes:
+            return None
+
+        small_height = int(round(height * self.scale))
+        small_width = int(round(width * self.scale))
+        x0, x1 = self._main_column(boxes, small_width)
+
+        # 列内のブロックから、画面上下端に接するもの（ブラウザ・タスクバー）を除外
+        edge = int(small_height * self.edge_ratio)
+        column_boxes = [box for box in boxes if x0 <= box[0] + box[2] // 2 < x1]
+        panel_boxes = [box for box in column_boxes
+                       if box[1] >= edge and box[1] + box[3] <= small_height - edge] or column_boxes
+
+        rect = panel_boxes[0]
+        for box in panel_boxes[1:]:
+            rect = union_rect(rect, box)
+
+        # 元の解像度に戻して余白を付加
+        x = max(0, int(rect[0] / self.scale) - self.padding)
+        y = max(0, int(rect[1] / self.scale) - self.padding)
+        right = min(width, int((rect[0] + rect[2]) / self.scale) + self.padding)
+        bottom = min(height, int((rect[1] + rect[3]) / self.scale) + self.padding)
+        return (x, y, right - x, bottom - y)
+
+    def _fits(self, binary: np.ndarray, rect: Rect) -> bool:
+        """
+        キャッシュ済みROIの外側すぐ（上下左右の余白帯）に文字が無いか
+        """
+        height, width = binary.shape[:2]
+        x, y, w, h = rect
+        band = self.padding * 2
+        ink = self.ink_mask(binary)
+        strips = [
+            ink[max(0, y - band):y, x:x + w],
+            ink[y + h:min(height, y + h + band), x:x + w],
+            ink[y:y + h, max(0, x - band):x],
+            ink[y:y + h, x + w:min(width, x + w + band)]
+        ]
+        return all(cv2.countNonZero(strip) == 0 for strip in strips if strip.size)
+
+    def get_roi(self, binary: np.ndarray) -> Optional[Rect]:
+        """
+        テンプレートのROIプロファイルを返す
+        内容がはみ出す場合は再検出してプロファイルを拡張
+        """
+        key = self.template_key(binary)
+        profile = self.profiles.get(key)
+        if profile is not None and self._fits(binary, profile):
+            self.stats['profile_hits'] += 1
+            return profile
+
+        rect = self.detect(binary)
+        if rect is None:
+            return profile
+
+        self.profiles[key] = union_rect(profile, rect) if profile is not None else rect
+        self.save_profiles()
+        return self.profiles[key]
+
+    def crop(self, binary: np.ndarray) -> np.ndarray:
+        """
+        ROIで切り出した画像（検出できなければ全体）
+        """
+        rect = self.get_roi(binary)
+        if rect is None:
+            return binary
+        x, y, w, h = rect
+        return np.ascontiguousarray(binary[y:y + h, x:x + w])
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+カードTSVの書き出し → 読み込みの往復テスト
+- 引用符・タブ・改行を含むフィールドが、csv リーダーで元の文字列のまま読み戻せること
+- clean_text 系が引用符を二重にエスケープしないこと（エスケープはライター側だけ）
+"""
+
+import csv
+
+from card_stream import CardStreamWriter
+from text_normalizer import clean_basic_text, clean_card_text
+
+
+HEADERS = ['Front', 'Back', 'Tags']
+
+
+def write_and_read(tmp_path, rows):
+    tsv_file = tmp_path / 'cards.tsv'
+    with CardStreamWriter(tsv_file, HEADERS) as writer:
+        for row in rows:
+            writer.write({}, row)
+    with open(tsv_file, 'r', encoding='utf-8', newline='') as f:
+        return list(csv.reader(f, delimiter='\t'))
+
+
+def test_round_trip_quote_tab_newline(tmp_path):
+    rows = [
+        ['"Least privilege" means minimal access', 'Use the "deny" rule', 'CC'],
+        ['tab\tinside', 'line 1\nline 2', 'quote " tab \t newline \n all'],
+        ['"', '""', 'plain'],
+    ]
+    assert write_and_read(tmp_path, rows) == [HEADERS] + rows
+
+
+def test_cleaned_text_round_trip(tmp_path):
+    texts = ['"Least privilege" means minimal access', 'Use the "deny" rule']
+    rows = [[clean_card_text(text), clean_basic_text(text), 'CC'] for text in texts]
+    assert write_and_read(tmp_path, rows) == [HEADERS] + [[text, text, 'CC'] for text in texts]
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+OCRテキスト・カード用テキストの正規化（共通モジュール）
+- 正規表現はモジュール読み込み時に1回だけコンパイル
+- 1文字単位の置換は str.translate、パターン置換は結合・固定文字列化して走査回数を削減
+- 用語リストの照合は Aho-Corasick 方式のキーワードマッチャー
+"""
+
+import re
+from typing import Dict, Iterable, List, Tuple
+
+
+# OCRテキスト: 2つ以上の改行（前後の空白込み）・改行前後の空白・連続した空白
+_OCR_BLANK_LINES_PATTERN = re.compile(r' *\n *\n[ \n]*')
+_OCR_NEWLINE_SPACES_PATTERN = re.compile(r' +\n *|\n +')
+_OCR_SPACES_PATTERN = re.compile(r'  +')
+
+# カード用テキスト: HTMLタグ と 3文字以下の括弧書き（OCRのゴミ）
+_CARD_MARKUP_PATTERN = re.compile(r'<[^>]+>|\([^\)]{0,3}\)')
+_HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# ダッシュ統一・記号除去
+_CARD_CHAR_TABLE = str.maketrans({'—': '-', '–': '-', '©': None, '®': None, '™': None})
+
+# 選択肢として扱わない行
+CHOICE_EXCLUDE_PATTERN = re.compile(
+    r'^(?:correct|score|seconds|attempt|taken|explanation)'
+    r'|^[0-9]+$'
+    r'|https?://'
+    r'|@'
+    r'|^[^a-zA-Z]',
+    re.IGNORECASE
+)
+
+# 技術用語（これらを含む行は選択肢候補）
+TECH_TERMS = [
+    'access control', 'authentication', 'authorization', 'encryption',
+    'firewall', 'malware', 'virus', 'security', 'data', 'network',
+    'system', 'password', 'user', 'administrative', 'physical',
+    'technical', 'policy', 'procedure', 'risk', 'threat', 'asset',
+    'confidentiality', 'integrity', 'availability', 'medical',
+    'privacy', 'gdpr', 'regulation', 'biometric', 'multifactor',
+    'non-repudiation', 'siem', 'ids', 'ips', 'vpn', 'certificate'
+]
+
+# リスク対応の用語（完璧品質版で追加）
+RISK_RESPONSE_TERMS = ['acceptance', 'avoidance', 'mitigation', 'transference']
+
+# 一般的な選択肢に含まれる語
+CHOICE_WORDS = ['control', 'management', 'protection', 'security']
+
+
+def normalize_ocr_text(text: str) -> str:
+    """
+    OCRテキストのクリーニング
+    改行の統一・余分な空白の削除・連続改行の圧縮
+    （置換対象のある箇所だけに一致するパターンで、固定文字列に置換）
+    """
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    text = _OCR_BLANK_LINES_PATTERN.sub('\n\n', text)
+    text = _OCR_NEWLINE_SPACES_PATTERN.sub('\n', text)
+    text = _OCR_SPACES_PATTERN.sub(' ', text)
+    return text.strip()
+
+
+def clean_basic_text(text: str) -> str:
+    """
+    HTMLタグ除去・空白統一（引用符のエスケープはTSVライター側で行う）
+    """
+    if not text:
+        return ""
+
+    if '<' in text:
+        text = _HTML_TAG_PATTERN.sub('', text)
+    return ' '.join(text.split())
+
+
+def clean_card_text(text: str) -> str:
+    """
+    カード用テキストのクリーニング
+    記号の統一・除去 → タグと短い括弧書きの除去 → 空白統一
+    （引用符のエスケープはTSVライター側で行う）
+    """
+    if not text:
+        return ""
+
+    text = text.translate(_CARD_CHAR_TABLE)
+    if '<' in text or '(' in text:
+        text = _CARD_MARKUP_PATTERN.sub('', text)
+    return ' '.join(text.split())
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick方式の複数キーワード照合（部分文字列。既定では大文字小文字を区別しない）
+    文字列を1回走査するだけで、どのキーワードを含むか判定できる
+    遷移表は展開せず、トライ木の疎な辞書と失敗遷移のまま持つ（状態数×文字種の表を作らない。
+    日本語など文字種の多いキーワードでもメモリが増えない）
+    """
+
+    def __init__(self, keywords: Iterable[str], ignore_case: bool = True):
+        self.ignore_case = ignore_case
+        self.keywords: List[str] = [keyword.lower() if ignore_case else keyword
+                                    for keyword in keywords if keyword]
+
+        # トライ木の構築
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Tuple[int, ...]] = [()]
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                if char not in goto[state]:
+                    goto.append({})
+                    outputs.append(())
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            outputs[state] = outputs[state] + (index,)
+
+        # 失敗遷移を幅優先で計算し、接尾辞のキーワードの番号も合成
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            for char, child in goto[state].items():
+                target = fail[state]
+                while target and char not in goto[target]:
+                    target = fail[target]
+                fail[child] = goto[target].get(char, 0)
+                queue.append(child)
+
+        self._goto = goto
+        self._fail = fail
+        self.outputs = outputs
+
+    def search(self, text: str) -> bool:
+        """
+        いずれかのキーワードを含むか
+        """
+        goto = self._goto
+        fail = self._fail
+        outputs = self.outputs
+        state = 0
+        for char in (text.lower() if self.ignore_case else text):
+            # 遷移が無ければ失敗遷移をたどる
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                return True
+        return False
+
+    def find_all(self, text: str) -> List[Tuple[int, str]]:
+        """
+        一致したキーワードを (開始位置, キーワード) で返す
+        """
+        goto = self._goto
+        fail = self._fail
+        outputs = self.outputs
+        matches = []
+        state = 0
+        for position, char in enumerate(text.lower() if self.ignore_case else text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in outputs[state]:
+                keyword = self.keywords[index]
+                matches.append((position - len(keyword) + 1, keyword))
+        return matches
+
+
+TECH_TERM_MATCHER = KeywordMatcher(TECH_TERMS)
+CHOICE_WORD_MATCHER = KeywordMatcher(CHOICE_WORDS)
+
+
+def is_choice_candidate(choice_clean: str, term_matcher: KeywordMatcher = TECH_TERM_MATCHER) -> bool:
+    """
+    クリーニング済みの行が選択肢らしいか
+    （除外パターンに該当せず、5〜100文字で、技術用語・一般的な選択肢の形を含む）
+    """
+    if CHOICE_EXCLUDE_PATTERN.search(choice_clean):
+        return False
+    if not (5 <= len(choice_clean) <= 100):
+        return False
+    if term_matcher.search(choice_clean):
+        return True
+
+    choice_lower = choice_clean.lower()
+    return (choice_lower.startswith(('a ', 'an ', 'the ')) or
+            CHOICE_WORD_MATCHER.search(choice_lower) or
+            choice_clean[0].isupper())
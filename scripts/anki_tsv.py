@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Anki TSV（テキストインポート形式）の共通リーダー・ライター
+- 先頭の #separator / #guid column / #notetype column / #deck column / #tags column
+  などのヘッダー指定を1回だけ解析し、列位置を決め打ちしない
+- 引用符を含まない行は str.split、含む行だけCの csv リーダーで分割
+  （引用符で囲まれた複数行フィールドにも対応）
+- レコードは軽量な NamedTuple として1件ずつ返す（ノートタイプ・デッキ・タグ列の文字列は intern して共有）
+- 各レコードのバイトオフセット索引で任意位置から読み出し（ファイル更新時は作り直し）
+- 書き出しはAnki互換の引用符付け・まとめ書き・一時ファイル経由の置き換え（gzip圧縮も可）
+"""
+
+import csv
+import gzip
+import io
+import os
+import sys
+from array import array
+from operator import itemgetter
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# #separator: の名前指定（Ankiと同じ）
+SEPARATORS = {
+    'tab': '\t',
+    'comma': ',',
+    'semicolon': ';',
+    'space': ' ',
+    'pipe': '|',
+    'colon': ':',
+}
+
+# ライターが1回の write にまとめる行数
+WRITE_BATCH_ROWS = 1024
+
+# gzip の圧縮レベル（9 は6の5倍以上遅く、サイズは1割程度しか変わらない）
+GZIP_LEVEL = 6
+
+# 列番号を指定するヘッダー（1始まり）
+_COLUMN_DIRECTIVES = {
+    'guid column': 'guid_column',
+    'notetype column': 'notetype_column',
+    'deck column': 'deck_column',
+    'tags column': 'tags_column',
+}
+
+class AnkiNote(NamedTuple):
+    """1ノート分のレコード（fields はGUID・ノートタイプ・デッキ・タグ以外の列）"""
+    guid: Optional[str]
+    notetype: Optional[str]
+    deck: Optional[str]
+    fields: Tuple[str, ...]
+    tags: str
+
+class AnkiTsvHeader:
+    """ファイル先頭のヘッダー指定"""
+
+    def __init__(self):
+        self.separator = '\t'
+        self.html = False
+        self.notetype: Optional[str] = None
+        self.deck: Optional[str] = None
+        self.tags = ""
+        self.columns: List[str] = []
+        # 列番号は0始まりで保持（指定なしは None）
+        self.guid_column: Optional[int] = None
+        self.notetype_column: Optional[int] = None
+        self.deck_column: Optional[int] = None
+        self.tags_column: Optional[int] = None
+        # ヘッダーの行数とバイト数（データ部の開始位置）
+        self.line_count = 0
+        self.size = 0
+
+    def apply(self, line: str):
+        """ヘッダー行 #key:value を1行反映（key:value 形式でないものはコメント）"""
+        key, sep, value = line[1:].partition(':')
+        if not sep:
+            return
+        key = key.strip().lower()
+        value = value.strip()
+
+        if key == 'separator':
+            self.separator = SEPARATORS.get(value.lower(), value[:1] or '\t')
+        elif key == 'html':
+            self.html = value.lower() == 'true'
+        elif key == 'notetype':
+            self.notetype = value
+        elif key == 'deck':
+            self.deck = value
+        elif key == 'tags':
+            self.tags = value
+        elif key == 'columns':
+            self.columns = [name.strip() for name in value.split(self.separator)]
+        elif key in _COLUMN_DIRECTIVES and value.isdigit() and int(value) > 0:
+            setattr(self, _COLUMN_DIRECTIVES[key], int(value) - 1)
+
+    def special_columns(self) -> Dict[str, int]:
+        return {name: column for name, column in (
+            ('guid', self.guid_column),
+            ('notetype', self.notetype_column),
+            ('deck', self.deck_column),
+            ('tags', self.tags_column),
+        ) if column is not None}
+
+def _open_binary(path: str):
+    """.gz はgzipとして開く（シークは先頭からの展開になるので索引での読み出しは遅い）"""
+    return gzip.open(path, 'rb') if path.endswith('.gz') else open(path, 'rb')
+
+def read_header(path: str) -> AnkiTsvHeader:
+    """先頭の # 行からヘッダー指定を読み込む"""
+    header = AnkiTsvHeader()
+    with _open_binary(path) as f:
+        for raw in f:
+            line = raw.decode('utf-8-sig' if header.line_count == 0 else 'utf-8').strip()
+            if not line.startswith('#'):
+                break
+            header.apply(line)
+            header.line_count += 1
+            header.size += len(raw)
+    return header
+
+def _iter_rows(lines: Iterator[str], separator: str) -> Iterator[List[str]]:
+    """
+    行を列に分割（引用符を含まない行は str.split、含む行だけCの csv リーダーで解析）
+    csv リーダーは複数行にまたがるフィールドの続きの行を同じ lines から読む
+    """
+    pending: List[str] = []
+
+    def source():
+        while True:
+            if pending:
+                yield pending.pop()
+                continue
+            line = next(lines, None)
+            if line is None:
+                return
+            yield line
+
+    quoted = csv.reader(source(), delimiter=separator)
+    for line in lines:
+        if '"' in line:
+            pending.append(line)
+            yield next(quoted)
+        else:
+            yield line.rstrip('\r\n').split(separator)
+
+def _is_note_row(row: List[str]) -> bool:
+    """空行・コメント行でないか（従来の各パーサーと同じく途中の # 行も読み飛ばす）"""
+    return bool(row) and row[0][:1] != '#' and (len(row) > 1 or bool(row[0].strip()))
+
+def _note_builder(header: AnkiTsvHeader, width: int) -> Callable[[List[str]], AnkiNote]:
+    """列数 width の行をノートに変換する関数（列数ごとに1回だけ作る）"""
+    special = header.special_columns()
+    field_columns = [i for i in range(width) if i not in special.values()]
+
+    def column(name: str, default, shared: bool = True):
+        index = special.get(name)
+        if index is None or index >= width:
+            return lambda row: default
+        if shared:
+            # ほぼ全行で同じ値になる列は1つの文字列を共有（ノートを保持する側のメモリを削減）
+            intern = sys.intern
+            return lambda row: intern(row[index])
+        return itemgetter(index)
+
+    guid = column('guid', None, shared=False)
+    notetype = column('notetype', header.notetype)
+    deck = column('deck', header.deck)
+    tags = column('tags', header.tags)
+
+    if len(field_columns) == width:
+        fields = tuple
+    elif len(field_columns) == 1:
+        single = itemgetter(field_columns[0])
+        fields = lambda row: (single(row),)
+    elif field_columns:
+        fields = itemgetter(*field_columns)
+    else:
+        fields = lambda row: ()
+
+    new = tuple.__new__
+
+    def build(row: List[str]) -> AnkiNote:
+        # NamedTuple のコンストラクタを経由せずに生成（1行あたりのコストを削減）
+        return new(AnkiNote, (guid(row), notetype(row), deck(row), fields(row), tags(row)))
+    return build
+
+class AnkiTsvReader:
+    """Anki TSVファイルをノート単位で読むリーダー"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._signature = None
+        self._header: Optional[AnkiTsvHeader] = None
+        self._offsets: Optional[array] = None
+        self._builders: Dict[int, Callable[[List[str]], AnkiNote]] = {}
+
+    def _refresh(self):
+        """ファイルが更新されていればヘッダーと索引を破棄"""
+        stat = os.stat(self.path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature != self._signature:
+            self._signature = signature
+            self._header = None
+            self._offsets = None
+            self._builders = {}
+
+    @property
+    def header(self) -> AnkiTsvHeader:
+        self._refresh()
+        if self._header is None:
+            self._header = read_header(self.path)
+        return self._header
+
+    def _to_notes(self, rows: Iterator[List[str]]) -> Iterator[AnkiNote]:
+        builders = self._builders
+        header = self.header
+        width = None
+        builder = None
+        for row in rows:
+            if not _is_note_row(row):
+                continue
+            if len(row) != width:
+                width = len(row)
+                builder = builders.get(width)
+                if builder is None:
+                    builder = builders[width] = _note_builder(header, width)
+            yield builder(row)
+
+    def _open_rows(self, offset: int):
+        f = _open_binary(self.path)
+        f.seek(offset)
+        text = io.TextIOWrapper(f, encoding='utf-8', newline='')
+        return text, _iter_rows(iter(text), self.header.separator)
+
+    def __iter__(self) -> Iterator[AnkiNote]:
+        """全ノートを先頭から順に返す"""
+        text, rows = self._open_rows(self.header.size)
+        with text:
+            yield from self._to_notes(rows)
+
+    def rows(self) -> Iterator[List[str]]:
+        """全ノートの列をそのまま（ヘッダー指定による振り分けなし）返す"""
+        text, rows = self._open_rows(self.header.size)
+        with text:
+            for row in rows:
+                if _is_note_row(row):
+                    yield row
+
+    def build_index(self) -> array:
+        """各ノートの開始バイトオフセット（ファイルを1回走査）"""
+        self._refresh()
+        if self._offsets is not None:
+            return self._offsets
+
+        header = self.header
+        offsets = array('q')
+        position = [header.size]
+
+        with _open_binary(self.path) as f:
+            f.seek(header.size)
+
+            def lines():
+                # 1行読むたびに、その行の終わりの位置を記録
+                for raw in f:
+                    position[0] += len(raw)
+                    yield raw.decode('utf-8')
+
+            start = header.size
+            for row in _iter_rows(lines(), header.separator):
+                if _is_note_row(row):
+                    offsets.append(start)
+                start = position[0]
+
+        self._offsets = offsets
+        return offsets
+
+    def note_count(self) -> int:
+        """ノート数（索引から）"""
+        return len(self.build_index())
+
+    def read_range(self, start: int, end: Optional[int] = None) -> Iterator[AnkiNote]:
+        """start番目から end番目の手前までのノート（0始まり、索引から直接シーク）"""
+        offsets = self.build_index()
+        end = len(offsets) if end is None else min(end, len(offsets))
+        start = max(start, 0)
+        if start >= end:
+            return
+        text, rows = self._open_rows(offsets[start])
+        with text:
+            for i, note in enumerate(self._to_notes(rows), start):
+                if i >= end:
+                    break
+                yield note
+
+    def note_at(self, index: int) -> AnkiNote:
+        """index番目のノート（0始まり）"""
+        if not 0 <= index < self.note_count():
+            raise IndexError(index)
+        return next(self.read_range(index, index + 1))
+
+def quote_field(value: str, separator: str = '\t') -> str:
+    """
+    1フィールド分の値（区切り文字・改行を含むか、引用符で始まる場合だけ引用符で囲む）
+    途中の引用符（class="word" など）はそのままでもAnki・csv リーダーとも文字として読む
+    """
+    if separator in value or '\n' in value or '\r' in value or value[:1] == '"':
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+def format_row(fields: List[str], separator: str = '\t') -> str:
+    """1行分のTSV（引用符が不要な行は join だけで済ませる）"""
+    line = separator.join(fields)
+    if (line.count(separator) != len(fields) - 1 or '\n' in line or '\r' in line
+            or line[:1] == '"' or separator + '"' in line):
+        line = separator.join(quote_field(value, separator) for value in fields)
+    return line + '\n'
+
+class AnkiTsvWriter:
+    """
+    Anki TSVのライター
+    - 行は WRITE_BATCH_ROWS 行ごとにまとめて書き込み
+    - 一時ファイル（<path>.tmp）に書き、正常終了時だけ os.replace で置き換える
+      （途中で失敗しても既存の出力は壊れない）
+    - atomic=False なら出力ファイルへ直接書き、1行ごとにフラッシュ
+      （途中で停止しても、それまでの行は出力ファイルに残る。ストリーミングモード用）
+    - compress=True（または .gz のパス）なら gzip 圧縮して書き出す
+    """
+
+    def __init__(self, path: str, header_lines: List[str] = (), separator: str = '\t',
+                 compress: Optional[bool] = None, atomic: bool = True):
+        self.path = path
+        self.atomic = atomic
+        self.tmp_path = path + ".tmp" if atomic else path
+        self.batch_rows = WRITE_BATCH_ROWS if atomic else 1
+        self.header_lines = list(header_lines)
+        self.separator = separator
+        self.compress = path.endswith('.gz') if compress is None else compress
+        self.count = 0
+        self._file = None
+        self._batch: List[str] = []
+
+    def __enter__(self) -> 'AnkiTsvWriter':
+        if self.compress:
+            self._file = gzip.open(self.tmp_path, 'wt', compresslevel=GZIP_LEVEL,
+                                   encoding='utf-8', newline='')
+        else:
+            self._file = open(self.tmp_path, 'w', encoding='utf-8', newline='', buffering=1 << 20)
+        self._file.writelines(line if line.endswith('\n') else line + '\n' for line in self.header_lines)
+        if not self.atomic:
+            self._file.flush()
+        return self
+
+    def write_row(self, fields: List[str]):
+        """1行を追加（フィールドは必要に応じて引用符付け）"""
+        self._batch.append(format_row(fields, self.separator))
+        self.count += 1
+        if len(self._batch) >= self.batch_rows:
+            self.flush()
+
+    def write_line(self, line: str):
+        """書式済みの1行をそのまま追加（既存TSVの行の再利用など）"""
+        self._batch.append(line)
+        self.count += 1
+        if len(self._batch) >= self.batch_rows:
+            self.flush()
+
+    def flush(self):
+        if self._batch:
+            self._file.write(''.join(self._batch))
+            self._batch = []
+            if not self.atomic:
+                self._file.flush()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            self._file.close()
+
+        if not self.atomic:
+            return False
+        if exc_type is None:
+            os.replace(self.tmp_path, self.path)
+        elif os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+        return False
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Anki .apkg 直接書き出し
+- collection.anki2（SQLite, スキーマv11）を直接構築
+- ノートタイプ・フィールド・CSS・GUIDをそのまま格納
+- 全ノートを1トランザクションの一括INSERTで書き込み
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+import time
+import zipfile
+from typing import Dict, List, Optional, Tuple
+
+# Ankiフィールド区切り文字
+FIELD_SEPARATOR = '\x1f'
+
+SCHEMA_SQL = """
+CREATE TABLE col (
+    id integer primary key, crt integer not null, mod integer not null,
+    scm integer not null, ver integer not null, dty integer not null,
+    usn integer not null, ls integer not null, conf text not null,
+    models text not null, decks text not null, dconf text not null,
+    tags text not null
+);
+CREATE TABLE notes (
+    id integer primary key, guid text not null, mid integer not null,
+    mod integer not null, usn integer not null, tags text not null,
+    flds text not null, sfld integer not null, csum integer not null,
+    flags integer not null, data text not null
+);
+CREATE TABLE cards (
+    id integer primary key, nid integer not null, did integer not null,
+    ord integer not null, mod integer not null, usn integer not null,
+    type integer not null, queue integer not null, due integer not null,
+    ivl integer not null, factor integer not null, reps integer not null,
+    lapses integer not null, left integer not null, odue integer not null,
+    odid integer not null, flags integer not null, data text not null
+);
+CREATE TABLE revlog (
+    id integer primary key, cid integer not null, usn integer not null,
+    ease integer not null, ivl integer not null, lastIvl integer not null,
+    factor integer not null, time integer not null, type integer not null
+);
+CREATE TABLE graves (
+    usn integer not null, oid integer not null, type integer not null
+);
+CREATE INDEX ix_notes_usn on notes (usn);
+CREATE INDEX ix_cards_usn on cards (usn);
+CREATE INDEX ix_revlog_usn on revlog (usn);
+CREATE INDEX ix_cards_nid on cards (nid);
+CREATE INDEX ix_cards_sched on cards (did, queue, due);
+CREATE INDEX ix_revlog_cid on revlog (cid);
+CREATE INDEX ix_notes_csum on notes (csum);
+"""
+
+DEFAULT_DECK_CONFIG = {
+    "id": 1, "name": "Default", "mod": 0, "usn": 0, "maxTaken": 60,
+    "autoplay": True, "timer": 0, "replayq": True, "dyn": False,
+    "new": {"delays": [1, 10], "ints": [1, 4, 7], "initialFactor": 2500,
+            "order": 1, "perDay": 20, "bury": True, "separate": True},
+    "rev": {"perDay": 200, "ease4": 1.3, "fuzz": 0.05, "maxIvl": 36500,
+            "bury": True, "minSpace": 1, "ivlFct": 1},
+    "lapse": {"delays": [10], "mult": 0, "minInt": 1, "leechFails": 8,
+              "leechAction": 0},
+}
+
+def stable_id(name: str) -> int:
+    """名前から安定したモデル/デッキIDを生成（再出力しても同じID）"""
+    return int(hashlib.sha1(name.encode('utf-8')).hexdigest()[:8], 16) + (1 << 30)
+
+def strip_html(text: str) -> str:
+    """ソートフィールド・チェックサム用にHTMLタグを除去"""
+    return re.sub(r'<[^>]+>', '', text).strip()
+
+def field_checksum(text: str) -> int:
+    """Ankiの重複検出用チェックサム（先頭フィールドのSHA1先頭8桁）"""
+    return int(hashlib.sha1(strip_html(text).encode('utf-8')).hexdigest()[:8], 16)
+
+class ApkgWriter:
+    def __init__(self, note_type: str, fields: List[str], templates: List[Tuple[str, str, str]],
+                 css: str, deck_name: str):
+        """
+        templates: (テンプレート名, 表面, 裏面) のリスト
+        """
+        self.note_type = note_type
+        self.fields = fields
+        self.templates = templates
+        self.css = css
+        self.deck_name = deck_name
+        self.model_id = stable_id(note_type)
+        self.notes: List[Tuple[str, List[str], str, str]] = []
+
+    def add_note(self, guid: str, fields: List[str], tags: str = "", deck_name: Optional[str] = None):
+        """ノートを追加（deck_name 省略時は既定デッキ）"""
+        if len(fields) != len(self.fields):
+            raise ValueError(f"フィールド数が一致しません: {len(fields)} != {len(self.fields)}")
+        self.notes.append((guid, fields, tags, deck_name or self.deck_name))
+
+    def _build_model(self, now: int) -> Dict:
+        """ノートタイプ定義"""
+        return {
+            "id": self.model_id,
+            "name": self.note_type,
+            "type": 0,
+            "mod": now,
+            "usn": -1,
+            "sortf": 0,
+            "did": stable_id(self.deck_name),
+            "tmpls": [
+                {"name": name, "ord": i, "qfmt": qfmt, "afmt": afmt,
+                 "did": None, "bqfmt": "", "bafmt": ""}
+                for i, (name, qfmt, afmt) in enumerate(self.templates)
+            ],
+            "flds": [
+                {"name": name, "ord": i, "sticky": False, "rtl": False,
+                 "font": "Arial", "size": 20, "media": []}
+                for i, name in enumerate(self.fields)
+            ],
+            "css": self.css,
+            "latexPre": "\\documentclass[12pt]{article}\n\\special{papersize=3in,5in}\n"
+                        "\\usepackage[utf8]{inputenc}\n\\usepackage{amssymb,amsmath}\n"
+                        "\\pagestyle{empty}\n\\setlength{\\parindent}{0in}\n\\begin{document}\n",
+            "latexPost": "\\end{document}",
+            "tags": [],
+            "vers": [],
+            "req": [[i, "any", [0]] for i in range(len(self.templates))],
+        }
+
+    def _build_deck(self, deck_id: int, name: str, now: int) -> Dict:
+        """デッキ定義"""
+        return {
+            "id": deck_id, "name": name, "mod": now, "usn": -1,
+            "lrnToday": [0, 0], "revToday": [0, 0], "newToday": [0, 0],
+            "timeToday": [0, 0], "collapsed": False, "desc": "", "dyn": 0,
+            "conf": 1, "extendNew": 10, "extendRev": 50,
+        }
+
+    def write(self, output_file: str) -> int:
+        """.apkgファイルを書き出し、ノート数を返す"""
+        now = int(time.time())
+        id_base = now * 1000
+
+        deck_ids = {"Default": 1}
+        for _, _, _, deck_name in self.notes:
+            deck_ids.setdefault(deck_name, stable_id(deck_name))
+
+        decks = {str(did): self._build_deck(did, name, now) for name, did in deck_ids.items()}
+        models = {str(self.model_id): self._build_model(now)}
+        conf = {"nextPos": len(self.notes) + 1, "curModel": str(self.model_id),
+                "curDeck": stable_id(self.deck_name)}
+
+        note_rows = []
+        card_rows = []
+        for i, (guid, fields, tags, deck_name) in enumerate(self.notes):
+            note_id = id_base + i
+            tags_field = f" {tags.strip()} " if tags.strip() else ""
+            note_rows.append((
+                note_id, guid, self.model_id, now, -1, tags_field,
+                FIELD_SEPARATOR.join(fields), strip_html(fields[0]),
+                field_checksum(fields[0]), 0, ""
+            ))
+            for ord_ in range(len(self.templates)):
+                card_id = id_base + i * len(self.templates) + ord_
+                card_rows.append((
+                    card_id, note_id, deck_ids[deck_name], ord_, now, -1,
+                    0, 0, i + 1, 0, 0, 0, 0, 0, 0, 0, 0, ""
+                ))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_file = os.path.join(tmp_dir, "collection.anki2")
+            conn = sqlite3.connect(db_file)
+            try:
+                conn.executescript(SCHEMA_SQL)
+                # 単一トランザクションで一括INSERT
+                with conn:
+                    conn.execute(
+                        "INSERT INTO col VALUES (1, ?, ?, ?, 11, 0, 0, 0, ?, ?, ?, ?, '{}')",
+                        (now, id_base, id_base, json.dumps(conf), json.dumps(models),
+                         json.dumps(decks), json.dumps({"1": DEFAULT_DECK_CONFIG}))
+                    )
+                    conn.executemany("INSERT INTO notes VALUES (?,?,?,?,?,?,?,?,?,?,?)", note_rows)
+                    conn.executemany("INSERT INTO cards VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)", card_rows)
+            finally:
+                conn.close()
+
+            with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED) as zf:
+                zf.write(db_file, "collection.anki2")
+                zf.writestr("media", "{}")
+
+        return len(note_rows)
+
+def read_apkg_summary(apkg_file: str) -> Dict:
+    """生成した.apkgをsqlite3で開き直して内容を要約（オフライン検証用）"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with zipfile.ZipFile(apkg_file) as zf:
+            zf.extract("collection.anki2", tmp_dir)
+        conn = sqlite3.connect(os.path.join(tmp_dir, "collection.anki2"))
+        try:
+            models = json.loads(conn.execute("SELECT models FROM col").fetchone()[0])
+            decks = json.loads(conn.execute("SELECT decks FROM col").fetchone()[0])
+            summary = {
+                'notes': conn.execute("SELECT COUNT(*) FROM notes").fetchone()[0],
+                'cards': conn.execute("SELECT COUNT(*) FROM cards").fetchone()[0],
+                'note_types': [m['name'] for m in models.values()],
+                'fields': [f['name'] for m in models.values() for f in m['flds']],
+                'decks': sorted(d['name'] for d in decks.values()),
+                'first_guid': (conn.execute("SELECT guid FROM notes ORDER BY id LIMIT 1").fetchone() or [None])[0],
+            }
+        finally:
+            conn.close()
+    return summary
+
+if __name__ == "__main__":
+    # 動作確認: python apkg_writer.py [ノート数] [出力ファイル]
+    note_count = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    output_file = sys.argv[2] if len(sys.argv) > 2 else os.path.join(tempfile.gettempdir(), "apkg_writer_check.apkg")
+
+    writer = ApkgWriter("Basic", ["Front", "Back"],
+                        [("Card 1", "{{Front}}", "{{FrontSide}}<hr id=answer>{{Back}}")],
+                        ".card { font-family: arial; }", "apkg-writer-check")
+    for i in range(note_count):
+        writer.add_note(hashlib.sha1(str(i).encode()).hexdigest()[:16], [f"word{i}", f"meaning {i}"], "check")
+
+    start = time.perf_counter()
+    writer.write(output_file)
+    elapsed = time.perf_counter() - start
+
+    print(f"📦 APKG written: {output_file} ({note_count} notes, {elapsed * 1000:.1f} ms)")
+    print(f"🔍 {read_apkg_summary(output_file)}")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Anki TSVリーダーのベンチマーク
+- 合成した約100万行のTSVで、従来の split('\\t') ループと AnkiTsvReader を比較
+- 索引作成と、索引を使った範囲読み出し（セッションのバッチ取得と同じ形）も計測
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from anki_tsv import AnkiTsvReader
+
+HEADER_LINES = [
+    "#separator:tab\n",
+    "#html:true\n",
+    "#guid column:1\n",
+    "#notetype column:2\n",
+    "#deck column:3\n",
+    "#tags column:6\n",
+]
+
+def build_synthetic_tsv(output_file: str, line_count: int) -> int:
+    """約 line_count 行の合成TSVを作成（1%は引用符付きの複数行フィールド）"""
+    rng = random.Random(0)
+    notes = 0
+    lines = 0
+    with open(output_file, 'w', encoding='utf-8', newline='') as f:
+        f.writelines(HEADER_LINES)
+        while lines < line_count:
+            word = f"word{notes}"
+            if rng.random() < 0.01:
+                meaning = f'"意味{notes}<br>\n<h2 style=""text-align: center;"">例文</h2>\nExample {notes}"'
+                lines += 3
+            else:
+                meaning = f"意味{notes} 説明<br>Example sentence for {word}."
+                lines += 1
+            f.write(f"g{notes:08d}\tBasic\ttoefl3800::rank3\t{word}\t{meaning}\ttag{notes % 7}\n")
+            notes += 1
+    return notes
+
+def legacy_parse(input_file: str):
+    """従来の各パーサーと同じ split('\\t') ループ"""
+    with open(input_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('#') or not line:
+                continue
+            parts = line.split('\t')
+            if len(parts) >= 5:
+                yield {
+                    'guid': parts[0],
+                    'card_type': parts[1],
+                    'deck_name': parts[2],
+                    'word': parts[3],
+                    'original_meaning': parts[4]
+                }
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+def run_benchmark(line_count: int = 1_000_000, batches: int = 100, batch_size: int = 100):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_file = os.path.join(tmp_dir, "synthetic.tsv")
+        note_count = build_synthetic_tsv(input_file, line_count)
+        size_mb = os.path.getsize(input_file) / 1024 / 1024
+
+        print(f"🚀 Anki TSV reader benchmark: {line_count:,} lines / {note_count:,} notes ({size_mb:.1f} MB)")
+
+        # どちらも1件ずつ読み捨てる（各パーサーのストリーミング処理と同じ使い方）
+        legacy_count, legacy_time = timed(lambda: sum(1 for _ in legacy_parse(input_file)))
+        print(f"  split('\\t') loop     : {legacy_time:7.3f} s  {legacy_count:,} records")
+
+        reader = AnkiTsvReader(input_file)
+        reader_count, reader_time = timed(lambda: sum(1 for _ in reader))
+        print(f"  AnkiTsvReader         : {reader_time:7.3f} s  {reader_count:,} notes")
+
+        # 引用符付きの複数行フィールドは split では途中で切れる
+        broken = sum(1 for record, note in zip(legacy_parse(input_file), reader)
+                     if record['original_meaning'] != note.fields[1])
+        print(f"  split('\\t') loop で壊れたレコード: {broken:,}")
+
+        offsets, index_time = timed(reader.build_index)
+        print(f"  build_index           : {index_time:7.3f} s  {len(offsets):,} offsets "
+              f"({offsets.itemsize * len(offsets) / 1024 / 1024:.1f} MB)")
+
+        rng = random.Random(1)
+        starts = [rng.randrange(note_count - batch_size) for _ in range(batches)]
+        _, range_time = timed(lambda: [list(reader.read_range(start, start + batch_size)) for start in starts])
+        print(f"  read_range x{batches:<4d}      : {range_time * 1000:7.1f} ms  "
+              f"({range_time / batches * 1000:.2f} ms / {batch_size} notes)")
+
+        expected = set(starts)
+        notes = {i: note for i, note in enumerate(reader) if i in expected}
+        identical = all(reader.note_at(start) == notes[start] for start in starts)
+        print(f"  random access matches full scan: {'✅' if identical else '❌'}")
+
+if __name__ == "__main__":
+    # 使用例: python benchmark_anki_tsv.py [行数]
+    line_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    run_benchmark(line_count)
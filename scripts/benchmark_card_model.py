@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+カードモデルのメモリベンチマーク
+- 10万枚のカードを dict（従来）と EnhancedCard（__slots__）で保持した場合のメモリを tracemalloc で比較
+- TSVから読み込んだノートの保持メモリ（ノートタイプ・デッキ・タグ列の intern あり／なし）も比較
+"""
+
+import gc
+import os
+import pickle
+import sys
+import tempfile
+import tracemalloc
+
+from benchmark_anki_tsv import build_synthetic_tsv
+from anki_tsv import AnkiTsvReader
+from card_model import EnhancedCard
+from enhanced_anki_processor import EnhancedAnkiProcessor
+from word_content_store import WordContentStore
+
+def measure(build):
+    """build() が返すオブジェクトを保持するのに増えたメモリ（バイト）"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+def build_contents(processor: EnhancedAnkiProcessor, card_count: int):
+    """カード本体を除いた中身（GUID・各フィールドの文字列）"""
+    contents = []
+    for i in range(card_count):
+        word = f"word{i}"
+        content = processor.process_word_with_claude(word)
+        contents.append((processor.generate_word_based_guid(word), content['word'], content['definition'],
+                         content['examples'], content['etymology']))
+    return contents
+
+def run_benchmark(card_count: int = 100_000):
+    # コンテンツストアなし（全単語がフォールバックの生成文）
+    processor = EnhancedAnkiProcessor(WordContentStore(os.devnull))
+    tags = "claude-generated toefl rank3 enhanced"
+    deck = processor.deck_name
+
+    contents, content_size = measure(lambda: build_contents(processor, card_count))
+    print(f"🚀 Card model memory benchmark: {card_count:,} cards")
+    print(f"  field strings (shared)   : {content_size / 1024 / 1024:7.1f} MB")
+
+    dict_cards, dict_size = measure(lambda: [
+        {'guid': guid, 'word': word, 'definition': definition, 'examples': examples,
+         'etymology': etymology, 'tags': tags, 'deck': deck}
+        for guid, word, definition, examples, etymology in contents
+    ])
+    print(f"  dict cards               : {dict_size / 1024 / 1024:7.1f} MB  "
+          f"({dict_size / card_count:.0f} B / card)")
+
+    slot_cards, slot_size = measure(lambda: [
+        EnhancedCard(guid, word, definition, examples, etymology, tags, deck)
+        for guid, word, definition, examples, etymology in contents
+    ])
+    print(f"  EnhancedCard (__slots__) : {slot_size / 1024 / 1024:7.1f} MB  "
+          f"({slot_size / card_count:.0f} B / card, {1 - slot_size / dict_size:.0%} smaller)")
+
+    identical = all(card.to_dict() == legacy for card, legacy in zip(slot_cards, dict_cards))
+    restored = pickle.loads(pickle.dumps(slot_cards[:1000]))
+    print(f"  same fields as dict cards: {'✅' if identical else '❌'}  "
+          f"pickle round-trip: {'✅' if restored == slot_cards[:1000] else '❌'}")
+    del contents, dict_cards, slot_cards
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_file = os.path.join(tmp_dir, "synthetic.tsv")
+        note_count = build_synthetic_tsv(input_file, card_count)
+        reader = AnkiTsvReader(input_file)
+
+        # intern なし: 列をそのまま保持（各行ごとに別の文字列）
+        rows, rows_size = measure(lambda: [tuple(row) for row in reader.rows()])
+        print(f"  TSV rows, no intern      : {rows_size / 1024 / 1024:7.1f} MB  ({note_count:,} notes)")
+        del rows
+
+        notes, notes_size = measure(lambda: list(reader))
+        decks = len({id(note.deck) for note in notes})
+        print(f"  AnkiTsvReader notes      : {notes_size / 1024 / 1024:7.1f} MB  "
+              f"({decks} deck string object(s) for {len(notes):,} notes)")
+
+if __name__ == "__main__":
+    # 使用例: python benchmark_card_model.py [カード数]
+    card_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    run_benchmark(card_count)
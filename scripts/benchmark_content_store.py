@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+コンテンツ参照ベンチマーク
+- 旧方式: if/elifチェーン（ストアのデータから同じ形のコードを再生成）
+- 新方式: WordContentStore のハッシュインデックス
+"""
+
+import os
+import sys
+import time
+
+from enhanced_anki_processor import EnhancedAnkiProcessor
+from word_content_store import WordContentStore
+
+DEFAULT_INPUT_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "data", "input", "toefl3800__rank3.txt"
+)
+
+def build_legacy_chain_source(records) -> str:
+    """旧 _generate_meaning / _generate_examples / _generate_etymology_tips と同じ形のソースを生成"""
+    chains = [
+        ('_generate_meaning', 'meaning', 'f"{word}（高品質定義生成中）"'),
+        ('_generate_examples', 'examples', '[]'),
+        ('_generate_etymology_tips', 'etymology', '""'),
+    ]
+
+    source_lines = []
+    for func_name, field, fallback in chains:
+        source_lines.append(f"def {func_name}(word):")
+        keyword = "if"
+        for record in records:
+            if field not in record:
+                continue
+            source_lines.append(f"    {keyword} word == {record['word']!r}:")
+            source_lines.append(f"        return {record[field]!r}")
+            keyword = "elif"
+        source_lines.append("    else:")
+        source_lines.append(f"        return {fallback}")
+        source_lines.append("")
+
+    return "\n".join(source_lines)
+
+def run_benchmark(input_file: str = DEFAULT_INPUT_FILE, rounds: int = 20):
+    """旧方式と新方式の参照コストを比較"""
+    processor = EnhancedAnkiProcessor()
+    words = [w['word'] for w in processor.parse_toefl_file(input_file)]
+    records = list(WordContentStore().load().values())
+
+    print(f"🚀 Content lookup benchmark: {len(words)} words x {rounds} rounds")
+
+    # 旧方式: チェーンのコンパイル（≒モジュール読み込み）コスト
+    source = build_legacy_chain_source(records)
+    start = time.perf_counter()
+    namespace = {}
+    exec(compile(source, "<legacy_chain>", "exec"), namespace)
+    legacy_compile = time.perf_counter() - start
+
+    # 新方式: ストア読み込みコスト
+    start = time.perf_counter()
+    store = WordContentStore()
+    store.load()
+    store_load = time.perf_counter() - start
+
+    legacy_funcs = (namespace['_generate_meaning'], namespace['_generate_examples'],
+                    namespace['_generate_etymology_tips'])
+    store_funcs = (store.get_meaning, store.get_examples, store.get_etymology)
+
+    def time_lookups(funcs):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for word in words:
+                for func in funcs:
+                    func(word)
+        return time.perf_counter() - start
+
+    legacy_lookup = time_lookups(legacy_funcs)
+    store_lookup = time_lookups(store_funcs)
+    lookups = len(words) * rounds
+
+    print(f"📦 Records: {len(records)}")
+    print(f"⏱️  Legacy chain compile: {legacy_compile * 1000:.1f} ms")
+    print(f"⏱️  Store load:           {store_load * 1000:.1f} ms")
+    print(f"⏱️  Legacy lookup:        {legacy_lookup / lookups * 1e6:.2f} µs/word")
+    print(f"⏱️  Store lookup:         {store_lookup / lookups * 1e6:.2f} µs/word")
+    print(f"📈 Speedup: {legacy_lookup / store_lookup:.1f}x")
+
+if __name__ == "__main__":
+    # 使用例: python benchmark_content_store.py [入力ファイル] [ラウンド数]
+    input_file = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_INPUT_FILE
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    run_benchmark(input_file, rounds)
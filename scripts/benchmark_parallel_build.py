@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+並列デッキビルドのベンチマーク
+- ワーカー数 1 → N でのスケーリングを計測
+- 各ワーカー数の出力が逐次処理とバイト単位で一致することを確認
+"""
+
+import contextlib
+import filecmp
+import io
+import os
+import sys
+import tempfile
+import time
+
+from enhanced_anki_processor import EnhancedAnkiProcessor
+
+DEFAULT_INPUT_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "data", "input", "toefl3800__rank3.txt"
+)
+
+def build_synthetic_input(input_file: str, output_file: str, repeat: int) -> int:
+    """入力ファイルの単語行を repeat 回繰り返した合成入力を作成"""
+    with open(input_file, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+
+    header = [line for line in lines if line.startswith('#')]
+    body = [line for line in lines if line.strip() and not line.startswith('#')]
+
+    with open(output_file, 'w', encoding='utf-8', newline='') as f:
+        f.writelines(header)
+        for _ in range(repeat):
+            f.writelines(body)
+
+    return len(body) * repeat
+
+def run_benchmark(input_file: str = DEFAULT_INPUT_FILE, max_workers: int = None, repeat: int = 20):
+    """ワーカー数ごとのビルド時間を計測"""
+    max_workers = max_workers or os.cpu_count() or 1
+    processor = EnhancedAnkiProcessor()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        synthetic_input = os.path.join(tmp_dir, "synthetic_input.txt")
+        word_count = build_synthetic_input(input_file, synthetic_input, repeat)
+
+        print(f"🚀 Parallel build benchmark: {word_count} words, 1-{max_workers} workers")
+
+        baseline_file = None
+        baseline_time = None
+
+        for workers in range(1, max_workers + 1):
+            output_file = os.path.join(tmp_dir, f"deck_{workers}.tsv")
+
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                processor.generate_enhanced_tsv(synthetic_input, output_file, workers=workers)
+            elapsed = time.perf_counter() - start
+
+            if baseline_file is None:
+                baseline_file, baseline_time = output_file, elapsed
+                identical = True
+            else:
+                identical = filecmp.cmp(baseline_file, output_file, shallow=False)
+
+            print(f"  workers={workers:2d}: {elapsed:7.3f} s  "
+                  f"speedup {baseline_time / elapsed:5.2f}x  "
+                  f"{'✅ identical' if identical else '❌ differs'}")
+
+if __name__ == "__main__":
+    # 使用例: python benchmark_parallel_build.py [最大ワーカー数] [繰り返し回数]
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    run_benchmark(DEFAULT_INPUT_FILE, max_workers, repeat)
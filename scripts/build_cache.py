@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+インクリメンタルビルド用キャッシュ
+- GUID → ソースコンテンツのハッシュ を記録するJSON-linesマニフェスト
+- 変更のない単語は既存TSVの行をそのまま再利用
+"""
+
+import json
+import os
+from typing import Dict, Optional
+
+from anki_tsv import AnkiTsvReader, format_row
+
+class BuildCache:
+    def __init__(self, manifest_file: str):
+        self.manifest_file = manifest_file
+        self.entries: Dict[str, str] = {}
+        self.load()
+
+    def load(self) -> Dict[str, str]:
+        """マニフェストを読み込み（存在しなければ空）"""
+        self.entries = {}
+        if os.path.exists(self.manifest_file):
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    entry = json.loads(line)
+                    self.entries[entry['guid']] = entry['hash']
+        return self.entries
+
+    def get(self, guid: str) -> Optional[str]:
+        return self.entries.get(guid)
+
+    def is_fresh(self, guid: str, content_hash: str) -> bool:
+        """前回ビルドからソースが変わっていないか"""
+        return self.entries.get(guid) == content_hash
+
+    def save(self, entries: Dict[str, str]) -> None:
+        """マニフェストを書き出し（一時ファイル経由で置き換え）"""
+        tmp_file = self.manifest_file + ".tmp"
+        with open(tmp_file, 'w', encoding='utf-8', newline='') as f:
+            for guid, content_hash in entries.items():
+                f.write(json.dumps({'guid': guid, 'hash': content_hash}) + "\n")
+        os.replace(tmp_file, self.manifest_file)
+        self.entries = dict(entries)
+
+def load_tsv_rows(tsv_file: str) -> Dict[str, str]:
+    """既存TSVの行をGUID（1列目）で索引化（引用符付きの複数行フィールドも1行として扱う）"""
+    rows = {}
+    if os.path.exists(tsv_file):
+        reader = AnkiTsvReader(tsv_file)
+        separator = reader.header.separator
+        for row in reader.rows():
+            rows[row[0]] = format_row(row, separator)
+    return rows
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+カードモデル
+- 1枚ごとの dict の代わりに __slots__ のクラスで保持（インスタンス辞書を持たない）
+- 全カード共通のタグ・デッキ名は sys.intern で1つの文字列を共有
+"""
+
+import sys
+from typing import Dict, List
+
+class EnhancedCard:
+    """改良版TOEFLカード1枚分（GUID・4フィールド・タグ・デッキ）"""
+
+    __slots__ = ('guid', 'word', 'definition', 'examples', 'etymology', 'tags', 'deck')
+
+    def __init__(self, guid: str, word: str, definition: str, examples: str, etymology: str,
+                 tags: str, deck: str):
+        self.guid = guid
+        self.word = word
+        self.definition = definition
+        self.examples = examples
+        self.etymology = etymology
+        self.tags = sys.intern(tags)
+        self.deck = sys.intern(deck)
+
+    def note_fields(self) -> List[str]:
+        """ノートのフィールド（Word | Definition | Examples | Etymology）"""
+        return [self.word, self.definition, self.examples, self.etymology]
+
+    def tsv_fields(self) -> List[str]:
+        """TSV 1行分のフィールド（GUID | Word | Definition | Examples | Etymology | Tags）"""
+        return [self.guid, self.word, self.definition, self.examples, self.etymology, self.tags]
+
+    def to_dict(self) -> Dict[str, str]:
+        """従来の dict 形式（JSON出力など用）"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EnhancedCard):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"EnhancedCard(guid={self.guid!r}, word={self.word!r}, deck={self.deck!r})"
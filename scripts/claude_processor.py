@@ -7,6 +7,9 @@ API不使用、Claude Codeが直接生成したコンテンツを整形
 import re
 import csv
 
+from anki_tsv import AnkiTsvReader, AnkiTsvWriter
+from apkg_writer import ApkgWriter
+
 def create_anki_back_content(word, meaning, examples, tips):
     """
     AnkiのHTML対応裏面コンテンツを生成
@@ -93,27 +96,15 @@ def parse_toefl_file(file_path):
     """
     words_data = []
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith('#') or not line:
-                continue
-                
-            parts = line.split('\t')
-            if len(parts) >= 5:
-                guid = parts[0]
-                card_type = parts[1] 
-                deck_name = parts[2]
-                word = parts[3]
-                original_meaning = parts[4]
-                
-                words_data.append({
-                    'guid': guid,
-                    'card_type': card_type,
-                    'deck_name': deck_name,
-                    'word': word,
-                    'original_meaning': original_meaning
-                })
+    for note in AnkiTsvReader(file_path):
+        if len(note.fields) >= 2:
+            words_data.append({
+                'guid': note.guid,
+                'card_type': note.notetype,
+                'deck_name': note.deck,
+                'word': note.fields[0],
+                'original_meaning': note.fields[1]
+            })
     
     return words_data
 
@@ -151,22 +142,52 @@ def generate_enhanced_deck(input_file, output_file, limit=None):
         enhanced_cards.append(enhanced_card)
     
     # TSV形式で出力（Ankiインポート用）
-    with open(output_file, 'w', encoding='utf-8', newline='') as f:
-        # Ankiヘッダー
-        f.write("#separator:tab\n")
-        f.write("#html:true\n")
-        f.write("#guid column:1\n")
-        f.write("#notetype column:2\n")
-        f.write("#deck column:3\n")
-        f.write("#tags column:6\n")
-        
+    header_lines = [
+        "#separator:tab",
+        "#html:true",
+        "#guid column:1",
+        "#notetype column:2",
+        "#deck column:3",
+        "#tags column:6",
+    ]
+    with AnkiTsvWriter(output_file, header_lines) as writer:
         # カードデータ
         for card in enhanced_cards:
-            f.write(f"{card['guid']}\t{card['card_type']}\t{card['deck_name']}\t{card['front']}\t{card['back']}\t{card['tags']}\n")
+            writer.write_row([card['guid'], card['card_type'], card['deck_name'],
+                              card['front'], card['back'], card['tags']])
     
     print(f"Enhanced deck created: {output_file}")
     print(f"Total cards: {len(enhanced_cards)}")
 
+def generate_enhanced_apkg(input_file, output_file, limit=None):
+    """
+    強化されたAnkiデッキを .apkg として直接生成（Basicノートタイプ）
+    """
+    print(f"Processing {input_file} -> APKG...")
+    
+    words_data = parse_toefl_file(input_file)
+    
+    if limit:
+        words_data = words_data[:limit]
+    
+    writer = ApkgWriter(
+        "Basic",
+        ["Front", "Back"],
+        [("Card 1", "{{Front}}", "{{FrontSide}}<hr id=answer>{{Back}}")],
+        ".card { font-family: arial; font-size: 20px; text-align: center; }",
+        words_data[0]['deck_name'] if words_data else "Default"
+    )
+    
+    for word_data in words_data:
+        word = word_data['word']
+        writer.add_note(word_data['guid'], [word, process_word_with_claude(word)],
+                        'claude-generated', word_data['deck_name'])
+    
+    note_count = writer.write(output_file)
+    
+    print(f"Enhanced APKG created: {output_file}")
+    print(f"Total notes: {note_count}")
+
 if __name__ == "__main__":
     # テスト実行（最初の3語のみ）
     input_file = "../data/input/toefl3800__rank3.txt"
@@ -1,21 +1,19 @@
 #!/usr/bin/env python3
 """
 Anki出力をHTMLプレビュー用に変換するスクリプト
+- TSVを1行ずつ読み、カードを読んだそばからHTMLに書き出す（ページ全体を文字列で組み立てない）
+- ページ分割モード: N枚ごとに別ページ + 目次ページ（1万枚以上のデッキ向け）
 """
 
-def convert_anki_to_html_preview(anki_file, output_file):
-    """
-    AnkiのTSVファイルをHTML形式のプレビューに変換
-    """
-    
-    html_content = """
-<!DOCTYPE html>
-<html lang="ja">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Anki Deck Preview</title>
-    <style>
+import argparse
+import html
+import os
+import re
+from typing import Dict, Iterator, List, TextIO
+
+from anki_tsv import AnkiTsvReader
+
+PREVIEW_CSS = """
         body { font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }
         .card { 
             background: white; 
@@ -51,49 +49,45 @@ def convert_anki_to_html_preview(anki_file, output_file):
             background-color: #f8f9fa;
             border-left: 3px solid #3498db;
         }
-    </style>
-</head>
-<body>
-    <h1>📚 Anki Deck Preview - TOEFL 3800 Rank3</h1>
-    <p>Generated by Claude Code | <a href="https://github.com/53b29461/anki-deck-generator">GitHub Repository</a></p>
 """
-    
-    cards_html = ""
-    card_count = 0
-    
-    with open(anki_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            
-            # ヘッダー行をスキップ
-            if line.startswith('#') or not line:
-                continue
-                
-            parts = line.split('\t')
-            if len(parts) >= 5:
-                guid = parts[0]
-                card_type = parts[1]
-                deck_name = parts[2]
-                front = parts[3]
-                back = parts[4]
-                tags = parts[5] if len(parts) > 5 else ""
-                
-                card_count += 1
-                cards_html += f"""
+
+CARD_TEMPLATE = """
     <div class="card">
         <div class="front">📖 {front}</div>
         <div class="back">{back}</div>
         <div class="card-info">
-            <strong>GUID:</strong> {guid[:8]}... | 
+            <strong>GUID:</strong> {guid}... | 
             <strong>Type:</strong> {card_type} | 
             <strong>Deck:</strong> {deck_name} | 
             <strong>Tags:</strong> {tags}
         </div>
     </div>
 """
-    
-    html_content += cards_html
-    html_content += f"""
+
+# ページ送りのリンク（ページ分割モード）
+NAV_STYLE = "margin: 20px 0; color: #7f8c8d;"
+
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+def _page_header(title: str = "Anki Deck Preview") -> str:
+    return f"""
+<!DOCTYPE html>
+<html lang="ja">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>{PREVIEW_CSS}    </style>
+</head>
+<body>
+    <h1>📚 Anki Deck Preview - TOEFL 3800 Rank3</h1>
+    <p>Generated by Claude Code | <a href="https://github.com/53b29461/anki-deck-generator">GitHub Repository</a></p>
+"""
+
+
+def _page_footer(card_count: int) -> str:
+    return f"""
     <div style="text-align: center; margin: 40px 0; color: #7f8c8d;">
         <p>Total Cards: <strong>{card_count}</strong></p>
         <p>Generated by Claude Code Anki Deck Generator</p>
@@ -101,21 +95,163 @@ def convert_anki_to_html_preview(anki_file, output_file):
 </body>
 </html>
 """
-    
+
+
+def iter_anki_cards(anki_file: str) -> Iterator[Dict[str, str]]:
+    """
+    AnkiのTSVファイルからカードを1枚ずつ読み込む
+    （列位置はファイル先頭のヘッダー指定に従う。1つ目のフィールドが表面、残りが裏面）
+    """
+    for note in AnkiTsvReader(anki_file):
+        if note.fields:
+            yield {
+                'guid': note.guid or "",
+                'card_type': note.notetype or "",
+                'deck_name': note.deck or "",
+                'front': note.fields[0],
+                'back': "".join(note.fields[1:]),
+                'tags': note.tags,
+            }
+
+
+def render_card(card: Dict[str, str]) -> str:
+    """
+    カード1枚分のHTML
+    """
+    return CARD_TEMPLATE.format(
+        front=card['front'],
+        back=card['back'],
+        guid=card['guid'][:8],
+        card_type=card['card_type'],
+        deck_name=card['deck_name'],
+        tags=card['tags'],
+    )
+
+
+def _page_file_name(output_file: str, page: int) -> str:
+    stem, ext = os.path.splitext(output_file)
+    return f"{stem}_{page:04d}{ext or '.html'}"
+
+
+def _write_page_nav(f: TextIO, output_file: str, page: int, has_next: bool):
+    links = [f'<a href="{os.path.basename(output_file)}">目次</a>']
+    if page > 1:
+        links.append(f'<a href="{os.path.basename(_page_file_name(output_file, page - 1))}">← 前へ</a>')
+    if has_next:
+        links.append(f'<a href="{os.path.basename(_page_file_name(output_file, page + 1))}">次へ →</a>')
+    f.write(f'\n    <div style="{NAV_STYLE}">Page {page} | {" | ".join(links)}</div>\n')
+
+
+def _plain_text(field: str, limit: int = 40) -> str:
+    """
+    目次用: フィールドのHTMLタグを除いたテキスト（先頭 limit 文字）
+    """
+    text = _TAG_PATTERN.sub('', field).strip()
+    if len(text) > limit:
+        text = text[:limit] + "…"
+    return html.escape(text)
+
+
+def _write_index(output_file: str, pages: List[Dict], card_count: int):
+    """
+    ページ分割モードの目次ページ
+    """
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    
+        f.write(_page_header("Anki Deck Preview - Index"))
+        f.write("\n    <ol>\n")
+        for page in pages:
+            f.write(f'        <li><a href="{os.path.basename(page["file"])}">'
+                    f'Cards {page["first"]}-{page["last"]}</a> '
+                    f'({_plain_text(page["first_front"])} … {_plain_text(page["last_front"])})</li>\n')
+        f.write("    </ol>\n")
+        f.write(_page_footer(card_count))
+
+
+def convert_anki_to_html_preview(anki_file, output_file, cards_per_page: int = None):
+    """
+    AnkiのTSVファイルをHTML形式のプレビューに変換
+    cards_per_page を指定すると N枚ごとのページ + 目次（output_file）に分割
+    """
+    if cards_per_page:
+        card_count = _write_paginated_preview(anki_file, output_file, cards_per_page)
+    else:
+        card_count = 0
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(_page_header())
+            for card in iter_anki_cards(anki_file):
+                f.write(render_card(card))
+                card_count += 1
+            f.write(_page_footer(card_count))
+
     print(f"HTML preview created: {output_file}")
     print(f"Total cards converted: {card_count}")
+    return card_count
+
+
+def _remove_stale_pages(output_file: str, first_stale_page: int):
+    """
+    前回の実行で書いたページのうち、今回のページ数を超える分を削除
+    """
+    page = first_stale_page
+    while os.path.exists(_page_file_name(output_file, page)):
+        os.remove(_page_file_name(output_file, page))
+        page += 1
+
+
+def _write_paginated_preview(anki_file: str, output_file: str, cards_per_page: int) -> int:
+    """
+    N枚ごとにページを書き出し、最後に目次を書く
+    （保持するのは1ページ分のHTMLとページごとの見出し情報だけ。
+      次のページの有無が分かってから上下のページ送りを書く）
+    """
+    pages: List[Dict] = []
+    rendered: List[str] = []
+    card_count = 0
+    first_front = last_front = ""
+
+    def write_page(has_next: bool):
+        page_number = len(pages) + 1
+        page_file = _page_file_name(output_file, page_number)
+        with open(page_file, 'w', encoding='utf-8') as f:
+            f.write(_page_header(f"Anki Deck Preview - Page {page_number}"))
+            _write_page_nav(f, output_file, page_number, has_next)
+            f.writelines(rendered)
+            _write_page_nav(f, output_file, page_number, has_next)
+            f.write(_page_footer(len(rendered)))
+        pages.append({'file': page_file, 'first': card_count - len(rendered) + 1, 'last': card_count,
+                      'first_front': first_front, 'last_front': last_front})
+        rendered.clear()
+
+    for card in iter_anki_cards(anki_file):
+        if len(rendered) == cards_per_page:
+            write_page(has_next=True)
+        if not rendered:
+            first_front = card['front']
+        rendered.append(render_card(card))
+        card_count += 1
+        last_front = card['front']
+    if rendered:
+        write_page(has_next=False)
+
+    _remove_stale_pages(output_file, len(pages) + 1)
+    _write_index(output_file, pages, card_count)
+    return card_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Anki TSV → HTMLプレビュー")
+    parser.add_argument("--input", default="../data/output/claude-code/enhanced_deck_test.txt", help="AnkiのTSVファイル")
+    parser.add_argument("--output", default="../data/output/claude-code/preview.html", help="出力HTMLファイル")
+    parser.add_argument("--per-page", type=int, default=None,
+                        help="1ページあたりのカード数（指定するとページ分割 + 目次）")
+    args = parser.parse_args()
+
+    convert_anki_to_html_preview(args.input, args.output, args.per_page)
 
-if __name__ == "__main__":
-    # テスト用HTML変換
-    anki_file = "../data/output/claude-code/enhanced_deck_test.txt"
-    html_file = "../data/output/claude-code/preview.html"
-    
-    convert_anki_to_html_preview(anki_file, html_file)
-    
     print("✅ HTML preview ready!")
-    print("📁 Open in browser: data/output/claude-code/preview.html")
+    print(f"📁 Open in browser: {args.output}")
     print("🌐 Or start local server:")
-    print("   cd data/output/claude-code && python3 -m http.server 8000")
\ No newline at end of file
+    print(f"   cd {os.path.dirname(args.output) or '.'} && python3 -m http.server 8000")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+単語コンテンツ移行ツール（ワンショット）
+- enhanced_anki_processor.py のif/elifチェーンから単語データを抽出
+- word_content_store 用のJSON-lines形式に変換
+"""
+
+import ast
+import json
+import os
+import sys
+from typing import Dict, List
+
+from word_content_store import DEFAULT_STORE_FILE
+
+# 抽出対象メソッド → レコードのフィールド名
+METHOD_FIELDS = {
+    '_generate_meaning': 'meaning',
+    '_generate_examples': 'examples',
+    '_generate_etymology_tips': 'etymology',
+}
+
+def extract_chain(func: ast.FunctionDef) -> Dict[str, object]:
+    """
+    `if word == "..." : return <literal>` チェーンを {単語: 値} に変換
+    同じ単語が複数回出現する場合は最初の分岐を採用（元の評価順と同じ）
+    """
+    entries = {}
+    body = [node for node in func.body
+            if not (isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant))]
+    node = body[0] if body else None
+
+    while isinstance(node, ast.If):
+        test = node.test
+        if (isinstance(test, ast.Compare) and len(test.ops) == 1
+                and isinstance(test.ops[0], ast.Eq)
+                and isinstance(test.comparators[0], ast.Constant)
+                and len(node.body) == 1 and isinstance(node.body[0], ast.Return)):
+            word = test.comparators[0].value
+            if word not in entries:
+                entries[word] = ast.literal_eval(node.body[0].value)
+        else:
+            print(f"⚠️  Skipped non-literal branch at line {node.lineno}")
+
+        # elif は orelse 内の単一Ifノードとして表現される
+        node = node.orelse[0] if len(node.orelse) == 1 else None
+
+    return entries
+
+def migrate(source_file: str, output_file: str) -> List[Dict]:
+    """
+    ソースファイルからコンテンツストアを生成
+    """
+    with open(source_file, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=source_file)
+
+    records = {}  # 挿入順 = 最初に出現した順
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef) and node.name in METHOD_FIELDS:
+            field = METHOD_FIELDS[node.name]
+            entries = extract_chain(node)
+            print(f"📥 {node.name}: {len(entries)} words")
+            for word, value in entries.items():
+                records.setdefault(word, {'word': word})[field] = value
+
+    output_dir = os.path.dirname(output_file)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8', newline='') as f:
+        for record in records.values():
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    print(f"✅ Content store written: {output_file}")
+    print(f"📊 Total records: {len(records)}")
+
+    return list(records.values())
+
+if __name__ == "__main__":
+    # 使用例: python migrate_word_content.py <旧enhanced_anki_processor.py> [出力ファイル]
+    if len(sys.argv) < 2:
+        print("使用法: python migrate_word_content.py <source.py> [output.jsonl]")
+        sys.exit(1)
+
+    source = sys.argv[1]
+    output = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_STORE_FILE
+    migrate(source, output)
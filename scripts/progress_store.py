@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+進捗データの保存バックエンド
+- JsonProgressStore: 従来のsession_progress.json（全体を書き直し）
+- SqliteProgressStore: completed_wordsテーブル＋WAL＋バッチコミット
+- JournalProgressStore: スナップショット＋追記専用JSON-linesジャーナル
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# ジャーナル先頭行の「対応するスナップショットのハッシュ」と「スナップショットに反映済みの番号」のキー
+JOURNAL_HEADER_KEY = "snapshot_sha1"
+JOURNAL_SEQ_KEY = "_journal_seq"
+
+def atomic_write_json(path: str, data: Dict) -> str:
+    """一時ファイルに書き込み・fsync後にrenameで置き換え（途中停止でも壊れない）。内容のSHA1を返す"""
+    payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    tmp_file = path + ".tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+    return hashlib.sha1(payload).hexdigest()
+
+def apply_journal_entry(data: Dict, entry: Dict) -> None:
+    """ジャーナル1件を進捗データに反映（append: リスト追加 / update: 辞書マージ）"""
+    target = data
+    for key in entry['path']:
+        target = target[key]
+
+    if entry['op'] == 'append':
+        target.append(entry['value'])
+    elif entry['op'] == 'update':
+        target.update(entry['value'])
+    else:
+        raise ValueError(f"Unknown journal op: {entry['op']}")
+
+class JsonProgressStore:
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> Optional[Dict]:
+        """進捗データを読み込み（存在しなければNone）"""
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return None
+
+    def initialize(self, progress_data: Dict) -> None:
+        """初回は save() 時にファイルを作成"""
+        pass
+
+    def add_completed_word(self, word: str) -> None:
+        """JSONでは completed_words_list ごと save() で書き出す"""
+        pass
+
+    def append_session_record(self, record: Dict) -> None:
+        """JSONでは session_history ごと save() で書き出す"""
+        pass
+
+    def save(self, progress_data: Dict) -> None:
+        atomic_write_json(self.path, progress_data)
+
+    def close(self) -> None:
+        pass
+
+class JournalProgressStore:
+    """
+    session_progress.json をスナップショットとし、更新は
+    session_progress.journal.jsonl に1行ずつ追記（1更新あたりO(1)）
+    読み込み時はスナップショット＋ジャーナル末尾を再生
+    ジャーナルの先頭行には対応するスナップショットのハッシュと反映済みの番号を記録
+    （スナップショット自体には管理用のキーを書き込まない）
+    """
+    # 件数が増え続けるため save() ではなく追記で記録するセクション
+    APPEND_SECTIONS = ("completed_words_list", "session_history")
+
+    def __init__(self, path: str, journal_path: str = None, compact_interval: int = 500):
+        self.path = path
+        self.journal_path = journal_path or os.path.splitext(path)[0] + ".journal.jsonl"
+        self.compact_interval = compact_interval
+        self._seq = 0
+        self._journal_entries = 0
+        self._journal = None
+
+    def load(self) -> Optional[Dict]:
+        """スナップショットを読み込み、未反映のジャーナルを再生"""
+        if not os.path.exists(self.path):
+            return None
+
+        with open(self.path, 'rb') as f:
+            snapshot = f.read()
+        progress_data = json.loads(snapshot.decode('utf-8'))
+        digest = hashlib.sha1(snapshot).hexdigest()
+
+        snapshot_seq = 0
+        self._seq = 0
+        self._journal_entries = 0
+
+        header_matches = False
+        stale = False
+        pending: List[bytes] = []
+        valid_size = 0
+        torn = False
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'rb') as f:
+                for line in f:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("incomplete line")
+                        entry = json.loads(line.decode('utf-8'))
+                    except ValueError:
+                        # 書き込み途中で停止した末尾行
+                        torn = True
+                        break
+                    valid_size += len(line)
+                    if JOURNAL_HEADER_KEY in entry:
+                        header_matches = entry[JOURNAL_HEADER_KEY] == digest
+                        # ハッシュ不一致: スナップショットの書き換え後、ジャーナルを空にする前に停止
+                        # （以降の行はすべてスナップショットに反映済み）
+                        stale = not header_matches
+                        snapshot_seq = entry[JOURNAL_SEQ_KEY]
+                        self._seq = max(self._seq, snapshot_seq)
+                        continue
+                    # コンパクション済み（スナップショットに反映済み）の行は読み飛ばす
+                    if stale or entry['seq'] <= snapshot_seq:
+                        self._seq = max(self._seq, entry['seq'])
+                        continue
+                    apply_journal_entry(progress_data, entry)
+                    pending.append(line)
+                    self._seq = entry['seq']
+                    self._journal_entries += 1
+
+        if not header_matches:
+            # ジャーナルをこのスナップショットに対応付け直す（未反映の行だけ残す）
+            self._reset_journal(digest, self._seq if stale else snapshot_seq, pending)
+        elif torn:
+            # 壊れた末尾行を切り詰め、以降の追記が再生されるようにする
+            with open(self.journal_path, 'r+b') as f:
+                f.truncate(valid_size)
+
+        return progress_data
+
+    def initialize(self, progress_data: Dict) -> None:
+        """スナップショットが無い場合に初期状態を書き出す"""
+        self.compact(progress_data)
+
+    def append_entry(self, op: str, path: List[str], value, sync: bool = False) -> None:
+        """ジャーナルに1行追記（op: append / update, path: 対象セクションのキー列）"""
+        if self._journal is None:
+            self._journal = open(self.journal_path, 'a', encoding='utf-8')
+
+        self._seq += 1
+        entry = {'seq': self._seq, 'op': op, 'path': path, 'value': value}
+        self._journal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._journal.flush()
+        if sync:
+            os.fsync(self._journal.fileno())
+        self._journal_entries += 1
+
+    def add_completed_word(self, word: str) -> None:
+        self.append_entry('append', ['completed_words_list'], word)
+
+    def append_session_record(self, record: Dict) -> None:
+        self.append_entry('append', ['session_history'], record)
+
+    def needs_compaction(self) -> bool:
+        return self._journal_entries >= self.compact_interval
+
+    def save(self, progress_data: Dict) -> None:
+        """固定サイズのセクションを1行で記録してfsync（必要ならコンパクション）"""
+        sections = {section: data for section, data in progress_data.items()
+                    if section not in self.APPEND_SECTIONS}
+        self.append_entry('update', [], sections, sync=True)
+
+        if self.needs_compaction():
+            self.compact(progress_data)
+
+    def compact(self, progress_data: Dict) -> None:
+        """スナップショットを書き直し、ジャーナルを空にする"""
+        digest = atomic_write_json(self.path, progress_data)
+
+        # rename後に停止しても、ジャーナル先頭のハッシュが一致しないので反映済みの行は再生されない
+        self._reset_journal(digest, self._seq)
+
+    def _reset_journal(self, digest: str, seq: int, lines: List[bytes] = ()) -> None:
+        """先頭行（スナップショットのハッシュと反映済みの番号）＋ lines でジャーナルを置き換え"""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+        header = {JOURNAL_HEADER_KEY: digest, JOURNAL_SEQ_KEY: seq}
+        tmp_file = self.journal_path + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(json.dumps(header).encode('utf-8') + b"\n")
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.journal_path)
+        self._journal_entries = len(lines)
+
+    def close(self) -> None:
+        if self._journal is not None:
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            self._journal.close()
+            self._journal = None
+
+class SqliteProgressStore:
+    SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS completed_words (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        word TEXT NOT NULL UNIQUE,
+        completed_at TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS progress_state (
+        section TEXT PRIMARY KEY,
+        data TEXT NOT NULL
+    );
+    """
+
+    def __init__(self, path: str, commit_interval: int = 50):
+        self.path = path
+        self.commit_interval = commit_interval
+        self._pending = 0
+
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA_SQL)
+        self.conn.commit()
+
+    def load(self) -> Optional[Dict]:
+        """進捗データを組み立て（未保存ならNone）"""
+        rows = self.conn.execute("SELECT section, data FROM progress_state").fetchall()
+        if not rows:
+            return None
+
+        progress_data = {section: json.loads(data) for section, data in rows}
+        progress_data["completed_words_list"] = [
+            word for (word,) in self.conn.execute("SELECT word FROM completed_words ORDER BY id")
+        ]
+        return progress_data
+
+    def initialize(self, progress_data: Dict) -> None:
+        """初回は save() 時に書き込み"""
+        pass
+
+    def append_session_record(self, record: Dict) -> None:
+        """session_history は save() でセクションごと書き込み"""
+        pass
+
+    def add_completed_word(self, word: str) -> None:
+        """完了語彙を1件追加（commit_interval件ごとにコミット）"""
+        self.conn.execute(
+            "INSERT OR IGNORE INTO completed_words (word, completed_at) VALUES (?, ?)",
+            (word, datetime.now().isoformat())
+        )
+        self._pending += 1
+        if self._pending >= self.commit_interval:
+            self.commit()
+
+    def save(self, progress_data: Dict) -> None:
+        """完了語彙以外のセクションを書き込みコミット"""
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO progress_state (section, data) VALUES (?, ?)",
+            [(section, json.dumps(data, ensure_ascii=False))
+             for section, data in progress_data.items() if section != "completed_words_list"]
+        )
+        self.commit()
+
+    def commit(self) -> None:
+        self.conn.commit()
+        self._pending = 0
+
+    def import_json(self, json_file: str) -> int:
+        """既存のsession_progress.jsonを取り込み、取り込んだ完了語彙数を返す"""
+        with open(json_file, 'r', encoding='utf-8') as f:
+            progress_data = json.load(f)
+
+        imported_at = datetime.now().isoformat()
+        words = progress_data.get("completed_words_list", [])
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO completed_words (word, completed_at) VALUES (?, ?)",
+            [(word, imported_at) for word in words]
+        )
+        self.save(progress_data)
+        return len(words)
+
+    def close(self) -> None:
+        self.commit()
+        self.conn.close()
+
+def migrate_json_to_sqlite(json_file: str, db_file: str) -> int:
+    """JSON進捗データをSQLiteへ移行"""
+    store = SqliteProgressStore(db_file)
+    try:
+        count = store.import_json(json_file)
+    finally:
+        store.close()
+
+    print(f"✅ Migrated {count} completed words: {json_file} → {db_file}")
+    return count
+
+if __name__ == "__main__":
+    # 使用例: python progress_store.py migrate ../data/progress/session_progress.json ../data/progress/session_progress.db
+    if len(sys.argv) >= 4 and sys.argv[1] == "migrate":
+        migrate_json_to_sqlite(sys.argv[2], sys.argv[3])
+    else:
+        print("使用法: python progress_store.py migrate <session_progress.json> <session_progress.db>")
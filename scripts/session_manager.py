@@ -6,36 +6,66 @@
 - 品質管理・バックアップ
 """
 
-import json
 import os
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 
+from anki_tsv import AnkiTsvReader
+from progress_store import JournalProgressStore, JsonProgressStore, SqliteProgressStore
+
+# 入力ファイルのリーダー（パス → リーダー。ノート位置の索引はリーダー内でキャッシュし、
+# ファイルのmtime・サイズが変わった場合のみ作り直す）
+_input_readers: Dict[str, AnkiTsvReader] = {}
+
+def get_input_reader(input_file: str) -> AnkiTsvReader:
+    """入力ファイルのリーダーを取得（プロセス内で共有）"""
+    reader = _input_readers.get(input_file)
+    if reader is None:
+        reader = _input_readers[input_file] = AnkiTsvReader(input_file)
+    return reader
+
 class SessionManager:
-    def __init__(self, project_root: str = ".."):
+    def __init__(self, project_root: str = "..", backend: str = "json"):
         self.project_root = project_root
         self.progress_dir = os.path.join(project_root, "data", "progress")
         self.progress_file = os.path.join(self.progress_dir, "session_progress.json")
+        self.progress_db = os.path.join(self.progress_dir, "session_progress.db")
         self.session_logs_dir = os.path.join(self.progress_dir, "session_logs")
         
+        # 保存バックエンド（"json"、"sqlite" または "journal"）
+        if backend == "sqlite":
+            self.store = SqliteProgressStore(self.progress_db)
+        elif backend == "journal":
+            self.store = JournalProgressStore(self.progress_file)
+        elif backend == "json":
+            self.store = JsonProgressStore(self.progress_file)
+        else:
+            raise ValueError(f"Unknown progress backend: {backend}")
+        
         # 進捗データをロード
         self.progress_data = self.load_progress()
+        
+        # 完了語彙の検索用インデックス（O(1)の重複チェック）
+        self._completed_words = set(self.progress_data["completed_words_list"])
     
     def load_progress(self) -> Dict:
         """進捗データを読み込み"""
-        if os.path.exists(self.progress_file):
-            with open(self.progress_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        else:
+        progress_data = self.store.load()
+        if progress_data is None:
             # デフォルトの進捗データ
-            return self._create_default_progress()
+            progress_data = self._create_default_progress()
+            self.store.initialize(progress_data)
+        return progress_data
     
     def save_progress(self) -> None:
         """進捗データを保存"""
-        with open(self.progress_file, 'w', encoding='utf-8') as f:
-            json.dump(self.progress_data, f, ensure_ascii=False, indent=2)
+        self.store.save(self.progress_data)
         
-        print(f"✅ Progress saved: {self.progress_file}")
+        print(f"✅ Progress saved: {self.store.path}")
+    
+    def close(self) -> None:
+        """保存バックエンドを閉じる（未コミット分を確定）"""
+        self.store.close()
     
     def get_next_batch(self, batch_size: int = 100) -> Tuple[int, int, List[str]]:
         """次に処理するバッチの単語リストを取得"""
@@ -51,26 +81,18 @@ class SessionManager:
     def _extract_words_from_range(self, start: int, end: int) -> List[str]:
         """指定範囲の単語をTOEFLファイルから抽出"""
         input_file = os.path.join(self.project_root, "data", "input", "toefl3800__rank3.txt")
-        words = []
-        
-        with open(input_file, 'r', encoding='utf-8') as f:
-            lines = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-        
-        # 指定範囲の単語を抽出（1-based indexing）
-        for i in range(start - 1, min(end, len(lines))):
-            if i < len(lines):
-                parts = lines[i].split('\t')
-                if len(parts) >= 4:
-                    word = parts[3]  # 英単語は4列目
-                    words.append(word)
+        reader = get_input_reader(input_file)
         
-        return words
+        # 指定範囲の単語を抽出（1-based indexing、索引から該当範囲だけを読む）
+        return [note.fields[0] for note in reader.read_range(max(start - 1, 0), end) if note.fields]
     
     def update_progress(self, word: str, position: int) -> None:
         """単語処理完了時の進捗更新"""
         # 完了語彙リストに追加
-        if word not in self.progress_data["completed_words_list"]:
+        if word not in self._completed_words:
+            self._completed_words.add(word)
             self.progress_data["completed_words_list"].append(word)
+            self.store.add_completed_word(word)
         
         # 統計更新
         self.progress_data["current_status"]["completed_words"] = len(
@@ -121,6 +143,7 @@ class SessionManager:
         }
         
         self.progress_data["session_history"].append(session_record)
+        self.store.append_session_record(session_record)
         
         # 次セッションの準備
         self.progress_data["current_status"]["current_session"] += 1
@@ -184,6 +207,7 @@ Generated: {datetime.now().isoformat()}
 - Output: `data/output/claude-code/enhanced_deck_v2.tsv`
 - CSS: `data/output/claude-code/card_template.css`
 - Main Script: `scripts/enhanced_anki_processor.py`
+- Word Content: `data/content/word_content.jsonl`
 """
         
         with open(handoff_file, 'w', encoding='utf-8') as f:
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+単語コンテンツストア
+- 1単語1レコードのJSON-lines形式
+- 初回アクセス時に一度だけ読み込み、ハッシュインデックスでO(1)参照
+"""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+DEFAULT_STORE_FILE = os.path.normpath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "data", "content", "word_content.jsonl"
+))
+
+class WordContentStore:
+    def __init__(self, store_file: str = DEFAULT_STORE_FILE):
+        self.store_file = store_file
+        self._index: Optional[Dict[str, Dict]] = None
+
+    def load(self) -> Dict[str, Dict]:
+        """ストアを読み込みインデックスを構築（2回目以降はキャッシュを返す）"""
+        if self._index is not None:
+            return self._index
+
+        index = {}
+        if os.path.exists(self.store_file):
+            with open(self.store_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    record = json.loads(line)
+                    # 重複時は先勝ち（旧if/elifチェーンと同じ優先順位）
+                    index.setdefault(record['word'], record)
+
+        self._index = index
+        return index
+
+    def get(self, word: str) -> Optional[Dict]:
+        """単語レコードを取得"""
+        return self.load().get(word)
+
+    def get_meaning(self, word: str) -> Optional[str]:
+        record = self.get(word)
+        return record.get('meaning') if record else None
+
+    def get_examples(self, word: str) -> Optional[List[str]]:
+        record = self.get(word)
+        return record.get('examples') if record else None
+
+    def get_etymology(self, word: str) -> Optional[str]:
+        record = self.get(word)
+        return record.get('etymology') if record else None
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.load()
+
+    def __len__(self) -> int:
+        return len(self.load())